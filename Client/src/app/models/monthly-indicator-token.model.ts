@@ -5,6 +5,7 @@ export interface MonthlyIndicatorToken {
   month: number;
   year: number;
   created_at: string;
+  expires_at: string;
 }
 
 export interface MonthlyIndicatorTokenCreate {
@@ -23,6 +24,7 @@ export interface PublicIndicatorForm {
   month: number;
   year: number;
   existing_indicator: PublicIndicatorData | null;
+  draft: PublicIndicatorData | null;
 }
 
 export interface PublicIndicatorData {
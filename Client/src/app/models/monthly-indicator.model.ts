@@ -19,6 +19,7 @@ export interface MonthlyIndicator {
 export interface MonthlyIndicatorListResponse {
   items: MonthlyIndicator[];
   total: number;
+  next_cursor: string | null;
 }
 
 export interface MonthlyIndicatorCreate {
@@ -24,5 +24,13 @@ export interface PortfolioSummary {
   health: HealthDistribution;
   monthly_report_pct: number;
   routines_up_to_date_pct: number;
-  startups: StartupSummary[];
+}
+
+export type StartupSummarySort = 'name' | 'total_revenue' | 'cash_balance' | 'ebitda_burn' | 'headcount';
+
+export type SortOrder = 'asc' | 'desc';
+
+export interface CursorPage<T> {
+  items: T[];
+  next_cursor: string | null;
 }
@@ -1,3 +1,8 @@
+import { BoardMeeting } from './board-meeting.model';
+import { Executive } from './executive.model';
+import { MonthlyIndicator } from './monthly-indicator.model';
+import { MonthlyIndicatorToken } from './monthly-indicator-token.model';
+
 export enum StartupStatus {
   HEALTHY = 'saudavel',
   WARNING = 'atencao',
@@ -17,9 +22,39 @@ export interface Startup {
   updated_at: string;
 }
 
+export interface StartupFacets {
+  status: Record<StartupStatus, number>;
+  sector: Record<string, number>;
+}
+
 export interface StartupListResponse {
   items: Startup[];
   total: number;
+  facets: StartupFacets;
+  next_cursor: string | null;
+}
+
+export interface StartupListFilters {
+  status?: StartupStatus[];
+  sector?: string[];
+  invested_from?: string;
+  invested_to?: string;
+  q?: string;
+  limit?: number;
+  cursor?: string;
+}
+
+export interface StartupOverview {
+  startup: Startup;
+  indicators: MonthlyIndicator[];
+  board_meetings: BoardMeeting[];
+  executives: Executive[];
+  tokens: MonthlyIndicatorToken[];
+}
+
+export interface StartupOverviewLimits {
+  indicators?: number;
+  meetings?: number;
 }
 
 export interface StartupCreate {
@@ -16,6 +16,7 @@ describe('Portfolio', () => {
 
   const portfolioServiceSpy = {
     getSummary: vi.fn(),
+    getStartups: vi.fn(),
   };
   const startupServiceSpy = {
     create: vi.fn(),
@@ -38,12 +39,12 @@ describe('Portfolio', () => {
     health: { healthy: 1, warning: 1, critical: 0 },
     monthly_report_pct: 50,
     routines_up_to_date_pct: 50,
-    startups: [],
   };
 
   beforeEach(async () => {
     queryParamMap$ = new BehaviorSubject(convertToParamMap({ month: '2', year: '2026' }));
     portfolioServiceSpy.getSummary.mockReturnValue(of(summaryMock));
+    portfolioServiceSpy.getStartups.mockReturnValue(of({ items: [], next_cursor: null }));
 
     await TestBed.configureTestingModule({
       imports: [Portfolio],
@@ -73,6 +74,30 @@ describe('Portfolio', () => {
     expect(component.selectedYear()).toBe(2026);
   });
 
+  it('should load first startups page for selected query period', () => {
+    expect(portfolioServiceSpy.getStartups).toHaveBeenCalledWith(2, 2026, 'name', 'asc', null);
+  });
+
+  it('should append next startups page using the cursor', () => {
+    const first = { startup: { id: '1' } };
+    const second = { startup: { id: '2' } };
+    portfolioServiceSpy.getStartups.mockReturnValueOnce(of({ items: [first], next_cursor: 'next' }));
+    queryParamMap$.next(convertToParamMap({ month: '2', year: '2026' }));
+    portfolioServiceSpy.getStartups.mockReturnValueOnce(of({ items: [second], next_cursor: null }));
+
+    component.loadMoreStartups();
+
+    expect(portfolioServiceSpy.getStartups).toHaveBeenLastCalledWith(2, 2026, 'name', 'asc', 'next');
+    expect(component.startups()).toEqual([first, second]);
+    expect(component.nextCursor()).toBeNull();
+  });
+
+  it('should reload startups from the first page when sort changes', () => {
+    component.onSortChange({ active: 'total_revenue', direction: 'desc' });
+
+    expect(portfolioServiceSpy.getStartups).toHaveBeenLastCalledWith(2, 2026, 'total_revenue', 'desc', null);
+  });
+
   it('should default to previous month when query params are missing', () => {
     routerSpy.navigate.mockClear();
     const now = new Date();
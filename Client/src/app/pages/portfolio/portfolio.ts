@@ -6,11 +6,14 @@ import { MatIconModule } from '@angular/material/icon';
 import { MatCardModule } from '@angular/material/card';
 import { MatDialog, MatDialogModule } from '@angular/material/dialog';
 import { MatSnackBar, MatSnackBarModule } from '@angular/material/snack-bar';
+import { MatSortModule, Sort } from '@angular/material/sort';
 
 import {
   PortfolioSummary,
   RevenueVariationDirection,
+  SortOrder,
   StartupSummary,
+  StartupSummarySort,
 } from '../../models/portfolio.model';
 import { KpiCardTone } from '../../components/kpi-card/kpi-card';
 import { MONTH_LABELS } from '../../models/monthly-indicator.model';
@@ -33,6 +36,7 @@ import {
     MatCardModule,
     MatDialogModule,
     MatSnackBarModule,
+    MatSortModule,
     StatusBadge,
     KpiCard,
     HealthBar,
@@ -52,6 +56,11 @@ export class Portfolio implements OnInit {
 
   readonly summaryByPeriod = signal<PortfolioSummary | null>(null);
   readonly loading = signal(false);
+  readonly startups = signal<StartupSummary[]>([]);
+  readonly nextCursor = signal<string | null>(null);
+  readonly loadingStartups = signal(false);
+  readonly sortField = signal<StartupSummarySort>('name');
+  readonly sortOrder = signal<SortOrder>('asc');
   readonly selectedMonth = signal(this.defaultPeriod.month);
   readonly selectedYear = signal(this.defaultPeriod.year);
   readonly monthLabels = MONTH_LABELS;
@@ -76,6 +85,7 @@ export class Portfolio implements OnInit {
       this.selectedMonth.set(period.month);
       this.selectedYear.set(period.year);
       this.loadSummary();
+      this.loadStartups();
     });
   }
 
@@ -93,6 +103,40 @@ export class Portfolio implements OnInit {
     });
   }
 
+  loadStartups(append = false): void {
+    this.loadingStartups.set(true);
+    this.monitoringService
+      .getStartups(
+        this.selectedMonth(),
+        this.selectedYear(),
+        this.sortField(),
+        this.sortOrder(),
+        append ? this.nextCursor() : null,
+      )
+      .subscribe({
+        next: (page) => {
+          this.startups.set(append ? [...this.startups(), ...page.items] : page.items);
+          this.nextCursor.set(page.next_cursor);
+          this.loadingStartups.set(false);
+        },
+        error: (err) => {
+          this.snackBar.open(err.error?.detail || 'Erro ao carregar startups', 'Fechar', { duration: 3000 });
+          this.loadingStartups.set(false);
+        },
+      });
+  }
+
+  loadMoreStartups(): void {
+    if (!this.nextCursor() || this.loadingStartups()) return;
+    this.loadStartups(true);
+  }
+
+  onSortChange(sort: Sort): void {
+    this.sortField.set(sort.direction ? (sort.active as StartupSummarySort) : 'name');
+    this.sortOrder.set(sort.direction || 'asc');
+    this.loadStartups();
+  }
+
   formatCurrency(value: number | null): string {
     if (value == null) return '-';
     return new Intl.NumberFormat('pt-BR', { style: 'currency', currency: 'BRL' }).format(value);
@@ -167,6 +211,7 @@ export class Portfolio implements OnInit {
           next: () => {
             this.snackBar.open('Startup criada com sucesso', 'Fechar', { duration: 3000 });
             this.loadSummary();
+            this.loadStartups();
           },
           error: (err) =>
             this.snackBar.open(err.error?.detail || 'Erro ao criar startup', 'Fechar', { duration: 3000 }),
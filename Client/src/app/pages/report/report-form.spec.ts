@@ -41,11 +41,25 @@ describe('ReportForm', () => {
       month: 1,
       year: 2026,
       existing_indicator: null,
+      draft: null,
     });
   });
 
   afterEach(() => httpMock.verify());
 
+  it('should autosave a single draft once typing pauses', () => {
+    vi.useFakeTimers();
+    component.form.controls.headcount.setValue(3);
+    component.form.controls.headcount.setValue(4);
+    vi.advanceTimersByTime(1500);
+    vi.useRealTimers();
+
+    const req = httpMock.expectOne('/api/monthly-indicator/test-token/draft');
+    expect(req.request.method).toBe('PUT');
+    expect(req.request.body.headcount).toBe(4);
+    req.flush(null, { status: 202, statusText: 'Accepted' });
+  });
+
   it('should have a valid form when all fields are empty (all optional)', () => {
     expect(component.form.valid).toBe(true);
   });
@@ -1,4 +1,5 @@
-import { Component, inject, OnInit, signal } from '@angular/core';
+import { Component, DestroyRef, inject, OnInit, signal } from '@angular/core';
+import { takeUntilDestroyed } from '@angular/core/rxjs-interop';
 import { ReactiveFormsModule, FormBuilder, Validators, AbstractControl, ValidationErrors } from '@angular/forms';
 import { ActivatedRoute } from '@angular/router';
 import { MatFormFieldModule } from '@angular/material/form-field';
@@ -8,6 +9,7 @@ import { MatCardModule } from '@angular/material/card';
 import { MatIconModule } from '@angular/material/icon';
 import { MatProgressSpinnerModule } from '@angular/material/progress-spinner';
 import { MatSnackBar, MatSnackBarModule } from '@angular/material/snack-bar';
+import { catchError, debounceTime, EMPTY, filter, switchMap } from 'rxjs';
 
 import { MonthlyIndicatorTokenService } from '../../services/monthly-indicator-token.service';
 import { PublicIndicatorForm } from '../../models/monthly-indicator-token.model';
@@ -16,6 +18,7 @@ import { MONTH_LABELS } from '../../models/monthly-indicator.model';
 const MAX_MONEY = 9_999_999_999_999.99;
 const MIN_MONEY = -9_999_999_999_999.99;
 const MAX_PCT = 99_999.99;
+const AUTOSAVE_DEBOUNCE_MS = 1500;
 
 function integerValidator(control: AbstractControl): ValidationErrors | null {
   const value = control.value;
@@ -43,6 +46,7 @@ export default class ReportForm implements OnInit {
   private readonly service = inject(MonthlyIndicatorTokenService);
   private readonly snackBar = inject(MatSnackBar);
   private readonly fb = inject(FormBuilder);
+  private readonly destroyRef = inject(DestroyRef);
 
   readonly context = signal<PublicIndicatorForm | null>(null);
   readonly loading = signal(true);
@@ -69,18 +73,20 @@ export default class ReportForm implements OnInit {
     this.service.getPublicForm(this.token).subscribe({
       next: (ctx) => {
         this.context.set(ctx);
-        if (ctx.existing_indicator) {
+        const saved = ctx.draft ?? ctx.existing_indicator;
+        if (saved) {
           this.form.patchValue({
-            total_revenue: ctx.existing_indicator.total_revenue,
-            cash_balance: ctx.existing_indicator.cash_balance,
-            ebitda_burn: ctx.existing_indicator.ebitda_burn,
-            recurring_revenue_pct: ctx.existing_indicator.recurring_revenue_pct,
-            gross_margin_pct: ctx.existing_indicator.gross_margin_pct,
-            headcount: ctx.existing_indicator.headcount,
-            achievements: ctx.existing_indicator.achievements ?? '',
-            challenges: ctx.existing_indicator.challenges ?? '',
+            total_revenue: saved.total_revenue,
+            cash_balance: saved.cash_balance,
+            ebitda_burn: saved.ebitda_burn,
+            recurring_revenue_pct: saved.recurring_revenue_pct,
+            gross_margin_pct: saved.gross_margin_pct,
+            headcount: saved.headcount,
+            achievements: saved.achievements ?? '',
+            challenges: saved.challenges ?? '',
           });
         }
+        this.startAutosave();
         this.loading.set(false);
       },
       error: () => {
@@ -90,6 +96,21 @@ export default class ReportForm implements OnInit {
     });
   }
 
+  private startAutosave(): void {
+    this.form.valueChanges
+      .pipe(
+        debounceTime(AUTOSAVE_DEBOUNCE_MS),
+        filter(() => this.form.valid && !this.submitting() && !this.submitted()),
+        switchMap(() =>
+          this.service
+            .savePublicDraft(this.token, this.form.getRawValue())
+            .pipe(catchError(() => EMPTY)),
+        ),
+        takeUntilDestroyed(this.destroyRef),
+      )
+      .subscribe();
+  }
+
   onSubmit(): void {
     if (this.form.invalid || this.submitting()) return;
     this.submitting.set(true);
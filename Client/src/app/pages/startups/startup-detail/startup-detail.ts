@@ -15,7 +15,6 @@ import { MatTableModule } from '@angular/material/table';
 import { MatExpansionModule } from '@angular/material/expansion';
 import { MatMenuModule } from '@angular/material/menu';
 import { MatTooltipModule } from '@angular/material/tooltip';
-import { forkJoin } from 'rxjs';
 
 import { Startup, StartupStatus, STARTUP_STATUS_CONFIG } from '../../../models/startup.model';
 import { MonthlyIndicator, MONTH_LABELS } from '../../../models/monthly-indicator.model';
@@ -53,6 +52,9 @@ import {
   TokenGenerateDialogData,
 } from '../token-generate-dialog/token-generate-dialog';
 
+// The page lists the whole history; these are the overview's maximums.
+const OVERVIEW_LIMITS = { indicators: 120, meetings: 120 };
+
 @Component({
   selector: 'app-startup-detail',
   imports: [
@@ -120,19 +122,13 @@ export class StartupDetail implements OnInit {
 
   loadAll(): void {
     this.loading.set(true);
-    forkJoin({
-      startup: this.startupService.getById(this.startupId),
-      indicators: this.indicatorService.list(this.startupId),
-      meetings: this.meetingService.list(this.startupId),
-      executives: this.executiveService.list(this.startupId),
-      tokens: this.tokenService.list(this.startupId),
-    }).subscribe({
-      next: ({ startup, indicators, meetings, executives, tokens }) => {
+    this.startupService.getOverview(this.startupId, OVERVIEW_LIMITS).subscribe({
+      next: ({ startup, indicators, board_meetings, executives, tokens }) => {
         this.startup.set(startup);
-        this.indicators.set(indicators.items);
-        this.meetings.set(meetings.items);
-        this.executives.set(executives.items);
-        this.tokens.set(tokens.items);
+        this.indicators.set(indicators);
+        this.meetings.set(board_meetings);
+        this.executives.set(executives);
+        this.tokens.set(tokens);
         this.loading.set(false);
       },
       error: (err) => {
@@ -1,4 +1,4 @@
-import { Component, inject } from '@angular/core';
+import { Component, inject, signal } from '@angular/core';
 import { MAT_DIALOG_DATA, MatDialogModule } from '@angular/material/dialog';
 import { MatButtonModule } from '@angular/material/button';
 import { MatIconModule } from '@angular/material/icon';
@@ -8,6 +8,7 @@ import { MatSnackBar, MatSnackBarModule } from '@angular/material/snack-bar';
 
 import { MonthlyIndicatorToken } from '../../../models/monthly-indicator-token.model';
 import { MONTH_LABELS } from '../../../models/monthly-indicator.model';
+import { MonthlyIndicatorTokenService } from '../../../services/monthly-indicator-token.service';
 
 export interface TokenListDialogData {
   tokens: MonthlyIndicatorToken[];
@@ -26,10 +27,10 @@ export interface TokenListDialogData {
   template: `
     <h2 mat-dialog-title>Links de Relatorio</h2>
     <mat-dialog-content>
-      @if (data.tokens.length === 0) {
+      @if (tokens().length === 0) {
         <p class="empty-text">Nenhum link gerado ainda.</p>
       } @else {
-        <table mat-table [dataSource]="data.tokens" class="token-table">
+        <table mat-table [dataSource]="tokens()" class="token-table">
           <ng-container matColumnDef="period">
             <th mat-header-cell *matHeaderCellDef>Periodo</th>
             <td mat-cell *matCellDef="let t">{{ monthLabels[t.month] }}/{{ t.year }}</td>
@@ -40,6 +41,9 @@ export interface TokenListDialogData {
               <button mat-icon-button matTooltip="Copiar link" (click)="copyLink(t)">
                 <mat-icon>content_copy</mat-icon>
               </button>
+              <button mat-icon-button matTooltip="Revogar link" (click)="revoke(t)">
+                <mat-icon>link_off</mat-icon>
+              </button>
             </td>
           </ng-container>
           <tr mat-header-row *matHeaderRowDef="columns"></tr>
@@ -65,8 +69,10 @@ export interface TokenListDialogData {
 export class TokenListDialog {
   readonly data = inject<TokenListDialogData>(MAT_DIALOG_DATA);
   private readonly snackBar = inject(MatSnackBar);
+  private readonly tokenService = inject(MonthlyIndicatorTokenService);
   readonly monthLabels = MONTH_LABELS;
   readonly columns = ['period', 'actions'];
+  readonly tokens = signal<MonthlyIndicatorToken[]>(this.data.tokens);
 
   copyLink(token: MonthlyIndicatorToken): void {
     const url = `${window.location.origin}/monthly-indicator/${token.token}`;
@@ -74,4 +80,11 @@ export class TokenListDialog {
       this.snackBar.open('Link copiado!', 'Fechar', { duration: 2000 });
     });
   }
+
+  revoke(token: MonthlyIndicatorToken): void {
+    this.tokenService.revoke(token.startup_id, token.id).subscribe(() => {
+      this.tokens.update((tokens) => tokens.filter((t) => t.id !== token.id));
+      this.snackBar.open('Link revogado', 'Fechar', { duration: 2000 });
+    });
+  }
 }
@@ -26,6 +26,7 @@ describe('MonthlyIndicatorTokenService', () => {
       month: 1,
       year: 2025,
       created_at: '',
+      expires_at: '',
     };
     const payload = { month: 2, year: 2026 };
     service.create('sid', payload).subscribe((res) => {
@@ -47,6 +48,13 @@ describe('MonthlyIndicatorTokenService', () => {
     req.flush(mockResponse);
   });
 
+  it('should revoke a token', () => {
+    service.revoke('sid', 'tid').subscribe();
+    const req = httpMock.expectOne('/api/startups/sid/monthly-indicator-tokens/tid');
+    expect(req.request.method).toBe('DELETE');
+    req.flush(null);
+  });
+
   it('should get public form', () => {
     const mockCtx = {
       startup_name: 'Acme',
@@ -54,6 +62,7 @@ describe('MonthlyIndicatorTokenService', () => {
       month: 3,
       year: 2025,
       existing_indicator: null,
+      draft: null,
     };
     service.getPublicForm('my-token').subscribe((res) => {
       expect(res.startup_name).toBe('Acme');
@@ -63,6 +72,24 @@ describe('MonthlyIndicatorTokenService', () => {
     req.flush(mockCtx);
   });
 
+  it('should save public form draft', () => {
+    const payload = {
+      total_revenue: null,
+      cash_balance: null,
+      ebitda_burn: null,
+      recurring_revenue_pct: null,
+      gross_margin_pct: null,
+      headcount: 4,
+      achievements: 'Rascunho',
+      challenges: null,
+    };
+    service.savePublicDraft('my-token', payload).subscribe();
+    const req = httpMock.expectOne('/api/monthly-indicator/my-token/draft');
+    expect(req.request.method).toBe('PUT');
+    expect(req.request.body).toEqual(payload);
+    req.flush(null, { status: 202, statusText: 'Accepted' });
+  });
+
   it('should submit public form', () => {
     const payload = {
       total_revenue: 100000,
@@ -27,10 +27,20 @@ export class MonthlyIndicatorTokenService {
     );
   }
 
+  revoke(startupId: string, tokenId: string): Observable<void> {
+    return this.http.delete<void>(
+      `/api/startups/${startupId}/monthly-indicator-tokens/${tokenId}`,
+    );
+  }
+
   getPublicForm(token: string): Observable<PublicIndicatorForm> {
     return this.http.get<PublicIndicatorForm>(`/api/monthly-indicator/${token}`);
   }
 
+  savePublicDraft(token: string, data: PublicIndicatorSubmit): Observable<void> {
+    return this.http.put<void>(`/api/monthly-indicator/${token}/draft`, data);
+  }
+
   submitPublicForm(token: string, data: PublicIndicatorSubmit): Observable<void> {
     return this.http.post<void>(`/api/monthly-indicator/${token}`, data);
   }
@@ -27,7 +27,6 @@ describe('PortfolioService', () => {
       health: { healthy: 2, warning: 1, critical: 0 },
       monthly_report_pct: 66.7,
       routines_up_to_date_pct: 33.3,
-      startups: [],
     };
 
     service.getSummary(2, 2026).subscribe((res) => {
@@ -41,4 +40,18 @@ describe('PortfolioService', () => {
     expect(req.request.params.get('year')).toBe('2026');
     req.flush(mockData);
   });
+
+  it('should get a page of portfolio startups', () => {
+    service.getStartups(2, 2026, 'total_revenue', 'desc', 'abc').subscribe((res) => {
+      expect(res.items.length).toBe(0);
+      expect(res.next_cursor).toBeNull();
+    });
+
+    const req = httpMock.expectOne((request) => request.url === '/api/portfolio/startups');
+    expect(req.request.method).toBe('GET');
+    expect(req.request.params.get('sort')).toBe('total_revenue');
+    expect(req.request.params.get('order')).toBe('desc');
+    expect(req.request.params.get('cursor')).toBe('abc');
+    req.flush({ items: [], next_cursor: null });
+  });
 });
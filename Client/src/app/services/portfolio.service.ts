@@ -2,7 +2,13 @@ import { HttpClient, HttpParams } from '@angular/common/http';
 import { Injectable, inject } from '@angular/core';
 import { Observable } from 'rxjs';
 
-import { PortfolioSummary } from '../models/portfolio.model';
+import {
+  CursorPage,
+  PortfolioSummary,
+  SortOrder,
+  StartupSummary,
+  StartupSummarySort,
+} from '../models/portfolio.model';
 
 @Injectable({ providedIn: 'root' })
 export class PortfolioService {
@@ -12,4 +18,16 @@ export class PortfolioService {
     const params = new HttpParams().set('month', month).set('year', year);
     return this.http.get<PortfolioSummary>('/api/portfolio/summary', { params });
   }
+
+  getStartups(
+    month: number,
+    year: number,
+    sort: StartupSummarySort = 'name',
+    order: SortOrder = 'asc',
+    cursor: string | null = null,
+  ): Observable<CursorPage<StartupSummary>> {
+    let params = new HttpParams().set('month', month).set('year', year).set('sort', sort).set('order', order);
+    if (cursor) params = params.set('cursor', cursor);
+    return this.http.get<CursorPage<StartupSummary>>('/api/portfolio/startups', { params });
+  }
 }
@@ -20,7 +20,12 @@ describe('StartupService', () => {
   afterEach(() => httpMock.verify());
 
   it('should list startups', () => {
-    const mockResponse = { items: [], total: 0 };
+    const mockResponse = {
+      items: [],
+      total: 0,
+      facets: { status: { saudavel: 0, atencao: 0, critico: 0 }, sector: {} },
+      next_cursor: null,
+    };
     service.list().subscribe((res) => {
       expect(res.total).toBe(0);
       expect(res.items).toEqual([]);
@@ -30,6 +35,28 @@ describe('StartupService', () => {
     req.flush(mockResponse);
   });
 
+  it('should send startup list filters as query params', () => {
+    service
+      .list({ status: [StartupStatus.HEALTHY, StartupStatus.CRITICAL], q: 'alp', limit: 20 })
+      .subscribe();
+    const req = httpMock.expectOne((r) => r.url === '/api/startups');
+    expect(req.request.params.getAll('status')).toEqual(['saudavel', 'critico']);
+    expect(req.request.params.get('q')).toBe('alp');
+    expect(req.request.params.get('limit')).toBe('20');
+    req.flush({ items: [], total: 0, facets: { status: {}, sector: {} }, next_cursor: null });
+  });
+
+  it('should get the startup overview with its limits', () => {
+    service.getOverview('s1', { indicators: 120, meetings: 50 }).subscribe((res) => {
+      expect(res.executives).toEqual([]);
+    });
+    const req = httpMock.expectOne((r) => r.url === '/api/startups/s1/overview');
+    expect(req.request.method).toBe('GET');
+    expect(req.request.params.get('indicators')).toBe('120');
+    expect(req.request.params.get('meetings')).toBe('50');
+    req.flush({ startup: {}, indicators: [], board_meetings: [], executives: [], tokens: [] });
+  });
+
   it('should create a startup', () => {
     const payload = {
       name: 'Test',
@@ -1,11 +1,14 @@
-import { HttpClient } from '@angular/common/http';
+import { HttpClient, HttpParams } from '@angular/common/http';
 import { Injectable, inject } from '@angular/core';
 import { Observable } from 'rxjs';
 
 import {
   Startup,
   StartupCreate,
+  StartupListFilters,
   StartupListResponse,
+  StartupOverview,
+  StartupOverviewLimits,
   StartupUpdate,
 } from '../models/startup.model';
 
@@ -14,14 +17,29 @@ export class StartupService {
   private readonly http = inject(HttpClient);
   private readonly baseUrl = '/api/startups';
 
-  list(): Observable<StartupListResponse> {
-    return this.http.get<StartupListResponse>(this.baseUrl);
+  list(filters: StartupListFilters = {}): Observable<StartupListResponse> {
+    let params = new HttpParams();
+    for (const status of filters.status ?? []) params = params.append('status', status);
+    for (const sector of filters.sector ?? []) params = params.append('sector', sector);
+    if (filters.invested_from) params = params.set('invested_from', filters.invested_from);
+    if (filters.invested_to) params = params.set('invested_to', filters.invested_to);
+    if (filters.q) params = params.set('q', filters.q);
+    if (filters.limit) params = params.set('limit', filters.limit);
+    if (filters.cursor) params = params.set('cursor', filters.cursor);
+    return this.http.get<StartupListResponse>(this.baseUrl, { params });
   }
 
   getById(id: string): Observable<Startup> {
     return this.http.get<Startup>(`${this.baseUrl}/${id}`);
   }
 
+  getOverview(id: string, limits: StartupOverviewLimits = {}): Observable<StartupOverview> {
+    let params = new HttpParams();
+    if (limits.indicators) params = params.set('indicators', limits.indicators);
+    if (limits.meetings) params = params.set('meetings', limits.meetings);
+    return this.http.get<StartupOverview>(`${this.baseUrl}/${id}/overview`, { params });
+  }
+
   create(data: StartupCreate): Observable<Startup> {
     return this.http.post<Startup>(this.baseUrl, data);
   }
@@ -0,0 +1,46 @@
+"""create portfolio_period_snapshots table
+
+Revision ID: 0016
+Revises: 0015
+Create Date: 2026-10-18
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0016"
+down_revision: Union[str, None] = "0015"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "portfolio_period_snapshots",
+        sa.Column("month", sa.SmallInteger(), nullable=False),
+        sa.Column("year", sa.SmallInteger(), nullable=False),
+        sa.Column("reference_date", sa.Date(), nullable=False),
+        sa.Column("total_startups", sa.Integer(), nullable=False),
+        sa.Column("healthy", sa.Integer(), nullable=False),
+        sa.Column("warning", sa.Integer(), nullable=False),
+        sa.Column("critical", sa.Integer(), nullable=False),
+        sa.Column("revenue", sa.Numeric(18, 2), nullable=False),
+        sa.Column("previous_revenue", sa.Numeric(18, 2), nullable=False),
+        sa.Column("reported", sa.Integer(), nullable=False),
+        sa.Column("with_recent_meetings", sa.Integer(), nullable=False),
+        sa.Column(
+            "computed_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=True,
+        ),
+        sa.PrimaryKeyConstraint("month", "year"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("portfolio_period_snapshots")
@@ -0,0 +1,31 @@
+"""add version to portfolio_period_snapshots
+
+Revision ID: 0017
+Revises: 0016
+Create Date: 2026-10-18
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0017"
+down_revision: Union[str, None] = "0016"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Snapshots are derived data; dropping them forces a rebuild with a version.
+    op.execute("DELETE FROM portfolio_period_snapshots")
+    op.add_column(
+        "portfolio_period_snapshots",
+        sa.Column("version", sa.UUID(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("portfolio_period_snapshots", "version")
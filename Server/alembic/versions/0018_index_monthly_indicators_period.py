@@ -0,0 +1,29 @@
+"""index monthly_indicators by period
+
+Revision ID: 0018
+Revises: 0017
+Create Date: 2026-10-18
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "0018"
+down_revision: Union[str, None] = "0017"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_monthly_indicators_year_month",
+        "monthly_indicators",
+        ["year", "month"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_monthly_indicators_year_month", table_name="monthly_indicators")
@@ -0,0 +1,35 @@
+"""add expires_at to monthly_indicator_tokens
+
+Revision ID: 0019
+Revises: 0018
+Create Date: 2026-10-18
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0019"
+down_revision: Union[str, None] = "0018"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "monthly_indicator_tokens",
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    # Existing tokens get the validity new ones are issued with.
+    op.execute(
+        "UPDATE monthly_indicator_tokens "
+        "SET expires_at = date_trunc('second', created_at) + interval '90 days'"
+    )
+    op.alter_column("monthly_indicator_tokens", "expires_at", nullable=False)
+
+
+def downgrade() -> None:
+    op.drop_column("monthly_indicator_tokens", "expires_at")
@@ -0,0 +1,70 @@
+"""add revocation to monthly_indicator_tokens and index only live tokens
+
+Revision ID: 0020
+Revises: 0019
+Create Date: 2026-10-18
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0020"
+down_revision: Union[str, None] = "0019"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "monthly_indicator_tokens",
+        sa.Column("revoked_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.drop_constraint(
+        "uq_monthly_indicator_token_startup_month_year",
+        "monthly_indicator_tokens",
+        type_="unique",
+    )
+    # Created unnamed as report_tokens.token UNIQUE; renames kept the name.
+    op.execute(
+        "ALTER TABLE monthly_indicator_tokens "
+        "DROP CONSTRAINT IF EXISTS report_tokens_token_key"
+    )
+    op.create_index(
+        "uq_monthly_indicator_token_live_token",
+        "monthly_indicator_tokens",
+        ["token"],
+        unique=True,
+        postgresql_where=sa.text("revoked_at IS NULL"),
+    )
+    op.create_index(
+        "uq_monthly_indicator_token_live_period",
+        "monthly_indicator_tokens",
+        ["startup_id", "month", "year"],
+        unique=True,
+        postgresql_where=sa.text("revoked_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.execute("DELETE FROM monthly_indicator_tokens WHERE revoked_at IS NOT NULL")
+    op.drop_index(
+        "uq_monthly_indicator_token_live_period",
+        table_name="monthly_indicator_tokens",
+    )
+    op.drop_index(
+        "uq_monthly_indicator_token_live_token",
+        table_name="monthly_indicator_tokens",
+    )
+    op.create_unique_constraint(
+        "report_tokens_token_key", "monthly_indicator_tokens", ["token"]
+    )
+    op.create_unique_constraint(
+        "uq_monthly_indicator_token_startup_month_year",
+        "monthly_indicator_tokens",
+        ["startup_id", "month", "year"],
+    )
+    op.drop_column("monthly_indicator_tokens", "revoked_at")
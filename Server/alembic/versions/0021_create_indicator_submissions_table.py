@@ -0,0 +1,51 @@
+"""create indicator_submissions staging table
+
+Revision ID: 0021
+Revises: 0020
+Create Date: 2026-10-18
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0021"
+down_revision: Union[str, None] = "0020"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "indicator_submissions",
+        sa.Column("id", sa.BigInteger(), sa.Identity(), primary_key=True),
+        sa.Column(
+            "startup_id",
+            sa.UUID(),
+            sa.ForeignKey("startups.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("month", sa.SmallInteger(), nullable=False),
+        sa.Column("year", sa.SmallInteger(), nullable=False),
+        sa.Column("total_revenue", sa.Numeric(15, 2), nullable=True),
+        sa.Column("recurring_revenue_pct", sa.Numeric(7, 2), nullable=True),
+        sa.Column("gross_margin_pct", sa.Numeric(7, 2), nullable=True),
+        sa.Column("cash_balance", sa.Numeric(15, 2), nullable=True),
+        sa.Column("headcount", sa.Integer(), nullable=True),
+        sa.Column("ebitda_burn", sa.Numeric(15, 2), nullable=True),
+        sa.Column("achievements", sa.Text(), nullable=True),
+        sa.Column("challenges", sa.Text(), nullable=True),
+        sa.Column(
+            "submitted_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=True,
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("indicator_submissions")
@@ -0,0 +1,51 @@
+"""create indicator_drafts table
+
+Revision ID: 0022
+Revises: 0021
+Create Date: 2026-10-18
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0022"
+down_revision: Union[str, None] = "0021"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "indicator_drafts",
+        sa.Column(
+            "startup_id",
+            sa.UUID(),
+            sa.ForeignKey("startups.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("month", sa.SmallInteger(), nullable=False),
+        sa.Column("year", sa.SmallInteger(), nullable=False),
+        sa.Column("total_revenue", sa.Numeric(15, 2), nullable=True),
+        sa.Column("recurring_revenue_pct", sa.Numeric(7, 2), nullable=True),
+        sa.Column("gross_margin_pct", sa.Numeric(7, 2), nullable=True),
+        sa.Column("cash_balance", sa.Numeric(15, 2), nullable=True),
+        sa.Column("headcount", sa.Integer(), nullable=True),
+        sa.Column("ebitda_burn", sa.Numeric(15, 2), nullable=True),
+        sa.Column("achievements", sa.Text(), nullable=True),
+        sa.Column("challenges", sa.Text(), nullable=True),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=True,
+        ),
+        sa.PrimaryKeyConstraint("startup_id", "month", "year"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("indicator_drafts")
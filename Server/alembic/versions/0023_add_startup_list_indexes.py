@@ -0,0 +1,38 @@
+"""add indexes for startup list filters and name prefix search
+
+Revision ID: 0023
+Revises: 0022
+Create Date: 2026-10-18
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0023"
+down_revision: Union[str, None] = "0022"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_startups_name_id", "startups", ["name", "id"])
+    op.create_index("ix_startups_status_name_id", "startups", ["status", "name", "id"])
+    op.create_index("ix_startups_sector_name_id", "startups", ["sector", "name", "id"])
+    op.create_index("ix_startups_investment_date", "startups", ["investment_date"])
+    op.create_index(
+        "ix_startups_lower_name_prefix",
+        "startups",
+        [sa.text("lower(name) text_pattern_ops")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_startups_lower_name_prefix", table_name="startups")
+    op.drop_index("ix_startups_investment_date", table_name="startups")
+    op.drop_index("ix_startups_sector_name_id", table_name="startups")
+    op.drop_index("ix_startups_status_name_id", table_name="startups")
+    op.drop_index("ix_startups_name_id", table_name="startups")
@@ -0,0 +1,54 @@
+"""add full-text and trigram search indexes
+
+Revision ID: 0024
+Revises: 0023
+Create Date: 2026-10-18
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0024"
+down_revision: Union[str, None] = "0023"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match app/domain/models/search_index.py for queries to use them.
+SEARCH_COLUMNS = {
+    "startups": ("name", "notes"),
+    "board_meetings": ("summary", "attention_points", "next_steps"),
+    "monthly_indicators": ("achievements", "challenges", "comments"),
+    "deals": ("company", "founders", "notes"),
+}
+
+
+def _document(columns: tuple[str, ...]) -> str:
+    return " || ' ' || ".join(f"coalesce({column}, '')" for column in columns)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for table, columns in SEARCH_COLUMNS.items():
+        document = _document(columns)
+        op.create_index(
+            f"ix_{table}_search_vector",
+            table,
+            [sa.text(f"to_tsvector('portuguese'::regconfig, {document})")],
+            postgresql_using="gin",
+        )
+        op.create_index(
+            f"ix_{table}_search_trgm",
+            table,
+            [sa.text(f"({document}) gin_trgm_ops")],
+            postgresql_using="gin",
+        )
+
+
+def downgrade() -> None:
+    for table in SEARCH_COLUMNS:
+        op.drop_index(f"ix_{table}_search_trgm", table_name=table)
+        op.drop_index(f"ix_{table}_search_vector", table_name=table)
@@ -0,0 +1,37 @@
+"""add generation counters so stale portfolio snapshot rebuilds are detected
+
+Revision ID: 0026
+Revises: 0025
+Create Date: 2026-10-18
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0026"
+down_revision: Union[str, None] = "0025"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "portfolio_snapshot_generations",
+        sa.Column("month", sa.SmallInteger(), nullable=False),
+        sa.Column("year", sa.SmallInteger(), nullable=False),
+        sa.Column("generation", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("month", "year"),
+    )
+    op.add_column(
+        "portfolio_period_snapshots",
+        sa.Column("generation", sa.BigInteger(), nullable=False, server_default="0"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("portfolio_period_snapshots", "generation")
+    op.drop_table("portfolio_snapshot_generations")
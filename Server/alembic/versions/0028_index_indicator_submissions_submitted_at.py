@@ -0,0 +1,31 @@
+"""index the submission queue by submission time
+
+Revision ID: 0028
+Revises: 0027
+Create Date: 2026-10-18
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "0028"
+down_revision: Union[str, None] = "0027"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_indicator_submissions_submitted_at",
+        "indicator_submissions",
+        ["submitted_at", "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_indicator_submissions_submitted_at", table_name="indicator_submissions"
+    )
@@ -1,10 +1,21 @@
+from app.application.portfolio.snapshot_periods import meeting_horizon
 from app.domain.models.board_meeting import BoardMeeting
 from app.repositories.board_meeting_repository import BoardMeetingRepository
+from app.repositories.portfolio_snapshot_repository import (
+    PortfolioSnapshotRepository,
+)
 
 
 class DeleteBoardMeeting:
-    def __init__(self, repository: BoardMeetingRepository) -> None:
+    def __init__(
+        self,
+        repository: BoardMeetingRepository,
+        snapshot_repo: PortfolioSnapshotRepository,
+    ) -> None:
         self._repository = repository
+        self._snapshot_repo = snapshot_repo
 
     async def execute(self, meeting: BoardMeeting) -> None:
+        horizon = meeting_horizon(meeting.meeting_date)
         await self._repository.delete(meeting)
+        await self._snapshot_repo.delete_through(*horizon)
@@ -2,6 +2,7 @@ import uuid
 
 from app.domain.models.board_meeting import BoardMeeting
 from app.repositories.board_meeting_repository import BoardMeetingRepository
+from app.repositories.watermark import Watermark
 
 
 class ListBoardMeetings:
@@ -10,3 +11,6 @@ class ListBoardMeetings:
 
     async def execute(self, startup_id: uuid.UUID) -> tuple[list[BoardMeeting], int]:
         return await self._repository.get_all_by_startup(startup_id)
+
+    async def version(self, startup_id: uuid.UUID) -> Watermark:
+        return await self._repository.get_watermark(startup_id)
@@ -1,12 +1,25 @@
+from app.application.portfolio.snapshot_periods import meeting_horizon
 from app.domain.models.board_meeting import BoardMeeting
 from app.repositories.board_meeting_repository import BoardMeetingRepository
+from app.repositories.portfolio_snapshot_repository import (
+    PortfolioSnapshotRepository,
+)
 
 
 class UpdateBoardMeeting:
-    def __init__(self, repository: BoardMeetingRepository) -> None:
+    def __init__(
+        self,
+        repository: BoardMeetingRepository,
+        snapshot_repo: PortfolioSnapshotRepository,
+    ) -> None:
         self._repository = repository
+        self._snapshot_repo = snapshot_repo
 
     async def execute(self, meeting: BoardMeeting, updates: dict) -> BoardMeeting:
+        previous_date = meeting.meeting_date
         for field, value in updates.items():
             setattr(meeting, field, value)
-        return await self._repository.update(meeting)
+        updated = await self._repository.update(meeting)
+        latest_date = max(previous_date, updated.meeting_date)
+        await self._snapshot_repo.delete_through(*meeting_horizon(latest_date))
+        return updated
@@ -1,5 +1,6 @@
 from app.domain.models.deal import Deal
 from app.repositories.deal_repository import DealRepository
+from app.repositories.watermark import Watermark
 
 
 class ListDeals:
@@ -8,3 +9,6 @@ class ListDeals:
 
     async def execute(self) -> tuple[list[Deal], int]:
         return await self._repository.get_all()
+
+    async def version(self) -> Watermark:
+        return await self._repository.get_watermark()
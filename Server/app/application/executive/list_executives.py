@@ -2,6 +2,7 @@ import uuid
 
 from app.domain.models.executive import Executive
 from app.repositories.executive_repository import ExecutiveRepository
+from app.repositories.watermark import Watermark
 
 
 class ListExecutives:
@@ -10,3 +11,6 @@ class ListExecutives:
 
     async def execute(self, startup_id: uuid.UUID) -> tuple[list[Executive], int]:
         return await self._repository.get_all_by_startup(startup_id)
+
+    async def version(self, startup_id: uuid.UUID) -> Watermark:
+        return await self._repository.get_watermark(startup_id)
@@ -0,0 +1,104 @@
+import uuid
+from typing import Any
+
+from app.application.monthly_indicator.import_monthly_indicators import merge_periods
+from app.application.monthly_indicator.readmodels import AppliedSubmissions
+from app.application.portfolio.snapshot_periods import indicator_periods
+from app.repositories.indicator_draft_repository import IndicatorDraftRepository
+from app.repositories.indicator_submission_repository import (
+    SUBMISSION_FIELDS,
+    IndicatorSubmissionRepository,
+)
+from app.repositories.monthly_indicator_repository import (
+    VALUE_FIELDS,
+    MonthlyIndicatorRepository,
+)
+from app.repositories.portfolio_snapshot_repository import (
+    PortfolioSnapshotRepository,
+)
+
+APPLY_BATCH_SIZE = 500
+
+
+class ApplyQueuedIndicatorSubmissions:
+    def __init__(
+        self,
+        queue_repo: IndicatorSubmissionRepository,
+        repository: MonthlyIndicatorRepository,
+        snapshot_repo: PortfolioSnapshotRepository,
+        draft_repo: IndicatorDraftRepository,
+    ) -> None:
+        self._queue_repo = queue_repo
+        self._repository = repository
+        self._snapshot_repo = snapshot_repo
+        self._draft_repo = draft_repo
+
+    async def execute(self) -> AppliedSubmissions:
+        """Apply and dequeue the oldest batch of submissions.
+
+        Submissions are merged field by field, in submission order, and drop
+        the saved drafts of their forms; a value written after the latest
+        submission of its period is kept, and the period is reported as
+        superseded. Callers repeat, one transaction per batch, until a batch
+        comes back smaller than ``APPLY_BATCH_SIZE``; 0 also means another
+        drainer is running.
+        """
+        if not await self._queue_repo.try_lock():
+            return AppliedSubmissions(count=0, superseded=[])
+        submissions = await self._queue_repo.get_oldest(APPLY_BATCH_SIZE)
+        if not submissions:
+            return AppliedSubmissions(count=0, superseded=[])
+
+        rows = merge_periods(
+            [
+                {
+                    "startup_id": submission.startup_id,
+                    "month": submission.month,
+                    "year": submission.year,
+                    **{
+                        field: getattr(submission, field) for field in SUBMISSION_FIELDS
+                    },
+                }
+                for submission in submissions
+            ]
+        )
+        # Submissions come in submission order, so the last one of a period
+        # is its latest.
+        submitted_at = {
+            (submission.startup_id, submission.month, submission.year): (
+                submission.submitted_at
+            )
+            for submission in submissions
+        }
+        for row in rows:
+            row["updated_at"] = submitted_at[
+                (row["startup_id"], row["month"], row["year"])
+            ]
+        merged = await self._repository.merge_submissions(rows)
+        await self._queue_repo.delete([submission.id for submission in submissions])
+        await self._draft_repo.delete_many(
+            [(row["startup_id"], row["month"], row["year"]) for row in rows]
+        )
+
+        affected: set[tuple[int, int]] = set()
+        for row in rows:
+            affected.update(indicator_periods(row["month"], row["year"]))
+        await self._snapshot_repo.delete_periods(sorted(affected))
+        return AppliedSubmissions(
+            count=len(submissions), superseded=_superseded(rows, merged)
+        )
+
+
+def _superseded(
+    rows: list[dict[str, Any]], merged: list[Any]
+) -> list[tuple[uuid.UUID, int, int]]:
+    submitted = {(row["startup_id"], row["month"], row["year"]): row for row in rows}
+    return sorted(
+        (row.startup_id, row.month, row.year)
+        for row in merged
+        if any(
+            value is not None and getattr(row, field) != value
+            for field, value in submitted[(row.startup_id, row.month, row.year)].items()
+            if field in VALUE_FIELDS
+        )
+    )
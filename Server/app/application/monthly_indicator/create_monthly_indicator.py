@@ -1,36 +1,31 @@
+from app.application.portfolio.snapshot_periods import indicator_periods
 from app.domain.models.monthly_indicator import MonthlyIndicator
 from app.domain.validators import validate_period_not_future
 from app.repositories.monthly_indicator_repository import (
     MonthlyIndicatorRepository,
 )
+from app.repositories.portfolio_snapshot_repository import (
+    PortfolioSnapshotRepository,
+)
 
 
 class CreateMonthlyIndicator:
-    def __init__(self, repository: MonthlyIndicatorRepository) -> None:
+    def __init__(
+        self,
+        repository: MonthlyIndicatorRepository,
+        snapshot_repo: PortfolioSnapshotRepository,
+    ) -> None:
         self._repository = repository
+        self._snapshot_repo = snapshot_repo
 
     async def execute(self, indicator: MonthlyIndicator) -> MonthlyIndicator:
+        """Create the indicator, or merge its non-null fields into the one
+        already reported for the same startup and period."""
         validate_period_not_future(indicator.month, indicator.year)
 
-        existing = await self._repository.get_by_startup_and_period(
-            indicator.startup_id, indicator.month, indicator.year
-        )
-        if existing:
-            fields = {
-                "total_revenue",
-                "recurring_revenue_pct",
-                "gross_margin_pct",
-                "cash_balance",
-                "headcount",
-                "ebitda_burn",
-                "achievements",
-                "challenges",
-                "comments",
-            }
-            for field in fields:
-                value = getattr(indicator, field)
-                if value is not None:
-                    setattr(existing, field, value)
-            return await self._repository.update(existing)
+        saved = await self._repository.upsert(indicator)
 
-        return await self._repository.create(indicator)
+        await self._snapshot_repo.delete_periods(
+            indicator_periods(indicator.month, indicator.year)
+        )
+        return saved
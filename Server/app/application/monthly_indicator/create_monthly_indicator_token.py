@@ -1,9 +1,17 @@
 import uuid
+from datetime import datetime, timedelta, timezone
 
 from app.domain.models.monthly_indicator_token import MonthlyIndicatorToken
 from app.domain.validators import validate_period_not_future
 from app.repositories.monthly_indicator_repository import MonthlyIndicatorRepository
 
+TOKEN_VALIDITY = timedelta(days=90)
+
+
+def token_expiry(now: datetime) -> datetime:
+    """Expiry of a token issued at ``now``; it is signed into the public link."""
+    return now.replace(microsecond=0) + TOKEN_VALIDITY
+
 
 class CreateMonthlyIndicatorToken:
     def __init__(self, repository: MonthlyIndicatorRepository) -> None:
@@ -13,12 +21,17 @@ class CreateMonthlyIndicatorToken:
         self, startup_id: uuid.UUID, month: int, year: int
     ) -> MonthlyIndicatorToken:
         validate_period_not_future(month, year)
+        now = datetime.now(timezone.utc)
 
+        # An expired token is replaced rather than handed out again.
+        await self._repository.revoke_expired_tokens(month, year, now, startup_id)
         existing = await self._repository.get_token_by_startup_and_period(
             startup_id, month, year
         )
         if existing:
             return existing
 
-        token = MonthlyIndicatorToken(startup_id=startup_id, month=month, year=year)
+        token = MonthlyIndicatorToken(
+            startup_id=startup_id, month=month, year=year, expires_at=token_expiry(now)
+        )
         return await self._repository.create_token(token)
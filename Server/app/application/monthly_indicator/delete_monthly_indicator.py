@@ -1,10 +1,21 @@
+from app.application.portfolio.snapshot_periods import indicator_periods
 from app.domain.models.monthly_indicator import MonthlyIndicator
 from app.repositories.monthly_indicator_repository import MonthlyIndicatorRepository
+from app.repositories.portfolio_snapshot_repository import (
+    PortfolioSnapshotRepository,
+)
 
 
 class DeleteMonthlyIndicator:
-    def __init__(self, repository: MonthlyIndicatorRepository) -> None:
+    def __init__(
+        self,
+        repository: MonthlyIndicatorRepository,
+        snapshot_repo: PortfolioSnapshotRepository,
+    ) -> None:
         self._repository = repository
+        self._snapshot_repo = snapshot_repo
 
     async def execute(self, indicator: MonthlyIndicator) -> None:
+        affected = indicator_periods(indicator.month, indicator.year)
         await self._repository.delete(indicator)
+        await self._snapshot_repo.delete_periods(affected)
@@ -0,0 +1,23 @@
+import uuid
+from typing import Any
+
+from app.domain.validators import validate_period_not_future
+from app.repositories.indicator_submission_repository import (
+    IndicatorSubmissionRepository,
+)
+
+
+class EnqueueIndicatorSubmission:
+    def __init__(self, repository: IndicatorSubmissionRepository) -> None:
+        self._repository = repository
+
+    async def execute(
+        self, token: uuid.UUID, month: int, year: int, values: dict[str, Any]
+    ) -> bool:
+        """Queue a public submission; False when the token is not live.
+
+        ``month`` and ``year`` come from the signed link, so the period is
+        checked before any database work.
+        """
+        validate_period_not_future(month, year)
+        return await self._repository.enqueue(token, values)
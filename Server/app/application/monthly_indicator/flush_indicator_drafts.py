@@ -0,0 +1,57 @@
+import uuid
+from datetime import datetime, timezone
+from typing import Any
+
+from app.repositories.indicator_draft_repository import IndicatorDraftRepository
+from app.repositories.monthly_indicator_repository import MonthlyIndicatorRepository
+
+
+class FlushIndicatorDrafts:
+    def __init__(
+        self,
+        draft_repo: IndicatorDraftRepository,
+        repository: MonthlyIndicatorRepository,
+    ) -> None:
+        self._draft_repo = draft_repo
+        self._repository = repository
+
+    async def execute(self, drafts: dict[uuid.UUID, dict[str, Any]]) -> int:
+        """Save the latest draft of every live token; return how many.
+
+        ``drafts`` maps token ids to a row with the startup, the period, the
+        ``updated_at`` of the autosave and the form values. Drafts of tokens
+        revoked since are dropped, and so are those a submission replaced,
+        possibly on another worker whose buffer never saw them.
+        """
+        if not drafts:
+            return 0
+        live = await self._repository.get_live_tokens(set(drafts))
+        # A period has at most one live token, so rows never repeat a period.
+        rows = [row for token, row in drafts.items() if token in live]
+        submitted = await self._repository.get_updated_at(
+            [(row["startup_id"], row["month"], row["year"]) for row in rows]
+        )
+        rows = [
+            row
+            for row in rows
+            if not _submitted_after(
+                submitted.get((row["startup_id"], row["month"], row["year"])),
+                row["updated_at"],
+            )
+        ]
+        if rows:
+            await self._draft_repo.save_many(rows)
+        return len(rows)
+
+
+def _submitted_after(submitted_at: datetime | None, saved_at: datetime) -> bool:
+    """Whether a submission at ``submitted_at`` supersedes the draft.
+
+    Compared to the second, since some databases store no finer; a tie goes
+    to the submission.
+    """
+    if submitted_at is None:
+        return False
+    if submitted_at.tzinfo is None:
+        submitted_at = submitted_at.replace(tzinfo=timezone.utc)
+    return submitted_at >= saved_at.replace(microsecond=0)
@@ -1,24 +1,53 @@
+import uuid
+
+from app.application.monthly_indicator.readmodels import PublicFormTarget
+from app.domain.models.indicator_draft import IndicatorDraft
 from app.domain.models.monthly_indicator import MonthlyIndicator
-from app.domain.models.monthly_indicator_token import MonthlyIndicatorToken
-from app.domain.models.startup import Startup
 from app.repositories.monthly_indicator_repository import MonthlyIndicatorRepository
-from app.repositories.startup_repository import StartupRepository
 
 
 class GetPublicIndicatorForm:
-    def __init__(
-        self,
-        startup_repo: StartupRepository,
-        indicator_repo: MonthlyIndicatorRepository,
-    ) -> None:
-        self._startup_repo = startup_repo
-        self._indicator_repo = indicator_repo
+    def __init__(self, repository: MonthlyIndicatorRepository) -> None:
+        self._repository = repository
 
     async def execute(
-        self, token: MonthlyIndicatorToken
-    ) -> tuple[Startup | None, MonthlyIndicator | None]:
-        startup = await self._startup_repo.get_by_id(token.startup_id)
-        indicator = await self._indicator_repo.get_by_startup_and_period(
-            token.startup_id, token.month, token.year
+        self, token: uuid.UUID
+    ) -> tuple[PublicFormTarget, MonthlyIndicator | None, IndicatorDraft | None] | None:
+        """Resolve the token, the indicator already reported and the saved
+        draft, in one query."""
+        row = await self._repository.get_public_form(token)
+        if row is None:
+            return None
+        target = PublicFormTarget(
+            startup_id=row.startup_id,
+            month=row.month,
+            year=row.year,
+            startup_name=row.name,
+            startup_logo_url=row.logo_url,
+        )
+        indicator = row.MonthlyIndicator
+        return target, indicator, _unless_replaced(row.IndicatorDraft, indicator)
+
+    async def get_existing(
+        self, target: PublicFormTarget
+    ) -> tuple[MonthlyIndicator | None, IndicatorDraft | None]:
+        """The indicator already reported and the saved draft for a target
+        resolved earlier, in one query."""
+        row = await self._repository.get_reported_and_draft(
+            target.startup_id, target.month, target.year
         )
-        return startup, indicator
+        if row is None:
+            return None, None
+        indicator = row.MonthlyIndicator
+        return indicator, _unless_replaced(row.IndicatorDraft, indicator)
+
+
+def _unless_replaced(
+    draft: IndicatorDraft | None, indicator: MonthlyIndicator | None
+) -> IndicatorDraft | None:
+    """The saved draft, unless a later submission replaced it."""
+    if draft is None or (
+        indicator is not None and indicator.updated_at >= draft.updated_at
+    ):
+        return None
+    return draft
@@ -0,0 +1,91 @@
+import uuid
+from collections.abc import AsyncIterable, AsyncIterator
+from typing import Any
+
+from app.application.portfolio.snapshot_periods import indicator_periods
+from app.domain.validators import validate_period_not_future
+from app.repositories.monthly_indicator_repository import (
+    VALUE_FIELDS,
+    MonthlyIndicatorRepository,
+)
+from app.repositories.portfolio_snapshot_repository import (
+    PortfolioSnapshotRepository,
+)
+from app.repositories.startup_repository import StartupRepository
+
+IMPORT_BATCH_SIZE = 500
+
+
+class ImportMonthlyIndicators:
+    def __init__(
+        self,
+        repository: MonthlyIndicatorRepository,
+        startup_repo: StartupRepository,
+        snapshot_repo: PortfolioSnapshotRepository,
+    ) -> None:
+        self._repository = repository
+        self._startup_repo = startup_repo
+        self._snapshot_repo = snapshot_repo
+
+    async def execute(self, records: AsyncIterable[dict[str, Any]]) -> int:
+        """Upsert indicator records in batches; return how many distinct
+        periods were written.
+
+        Records are consumed lazily, ``IMPORT_BATCH_SIZE`` at a time, and keep
+        the create semantics: an existing period only takes non-null values.
+        Any invalid record aborts the whole import.
+        """
+        written: set[tuple[uuid.UUID, int, int]] = set()
+        affected: set[tuple[int, int]] = set()
+        async for batch in _batches(records, IMPORT_BATCH_SIZE):
+            rows = merge_periods(batch)
+            startup_ids = {row["startup_id"] for row in rows}
+            missing = startup_ids - await self._startup_repo.get_existing_ids(
+                startup_ids
+            )
+            if missing:
+                raise ValueError(f"Startup com id {min(missing)} nao encontrada")
+
+            written |= await self._repository.upsert_many(rows)
+            for row in rows:
+                affected.update(indicator_periods(row["month"], row["year"]))
+
+        await self._snapshot_repo.delete_periods(sorted(affected))
+        return len(written)
+
+
+async def _batches(
+    records: AsyncIterable[dict[str, Any]], size: int
+) -> AsyncIterator[list[dict[str, Any]]]:
+    batch: list[dict[str, Any]] = []
+    async for record in records:
+        batch.append(record)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def merge_periods(batch: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Collapse records of the same startup and period, later values winning.
+
+    A multi-row upsert cannot touch the same row twice.
+    """
+    merged: dict[tuple, dict[str, Any]] = {}
+    for record in batch:
+        validate_period_not_future(record["month"], record["year"])
+        key = (record["startup_id"], record["month"], record["year"])
+        row = merged.setdefault(
+            key,
+            {
+                "startup_id": key[0],
+                "month": key[1],
+                "year": key[2],
+                **dict.fromkeys(VALUE_FIELDS),
+            },
+        )
+        for field in VALUE_FIELDS:
+            if record.get(field) is not None:
+                row[field] = record[field]
+    return list(merged.values())
@@ -0,0 +1,59 @@
+import uuid
+from datetime import date, datetime, timezone
+
+from app.application.monthly_indicator.create_monthly_indicator_token import (
+    token_expiry,
+)
+from app.domain.models.monthly_indicator_token import MonthlyIndicatorToken
+from app.domain.models.startup import StartupStatus
+from app.domain.validators import validate_period_not_future
+from app.repositories.monthly_indicator_repository import MonthlyIndicatorRepository
+
+
+def previous_period(today: date) -> tuple[int, int]:
+    """The (month, year) founders report on during ``today``'s month."""
+    if today.month == 1:
+        return 12, today.year - 1
+    return today.month - 1, today.year
+
+
+class IssueMonthlyIndicatorTokens:
+    def __init__(self, repository: MonthlyIndicatorRepository) -> None:
+        self._repository = repository
+
+    async def execute(
+        self,
+        month: int,
+        year: int,
+        startup_ids: list[uuid.UUID] | None = None,
+        statuses: list[StartupStatus] | None = None,
+        skip_revoked: bool = False,
+    ) -> tuple[list[MonthlyIndicatorToken], int]:
+        """Issue the period's token to every startup, or to those matching
+        ``startup_ids`` and ``statuses``, that does not have one yet.
+
+        With ``skip_revoked``, startups whose token for the period was
+        revoked are left without one. Returns the created tokens and how many
+        matching startups already had a token.
+        """
+        validate_period_not_future(month, year)
+        now = datetime.now(timezone.utc)
+
+        # Expired tokens are replaced rather than counted as already issued.
+        await self._repository.revoke_expired_tokens(month, year, now)
+        created, matched = await self._repository.create_tokens_for_period(
+            month, year, token_expiry(now), startup_ids, statuses, skip_revoked
+        )
+        return created, matched - len(created)
+
+    async def execute_scheduled(
+        self, month: int, year: int
+    ) -> tuple[list[MonthlyIndicatorToken], int] | None:
+        """Issue the period's tokens once, for the monthly job.
+
+        Returns None when the period was already issued, by another worker
+        or before a restart. Tokens analysts revoked are not issued again.
+        """
+        if not await self._repository.claim_token_run(month, year):
+            return None
+        return await self.execute(month, year, skip_revoked=True)
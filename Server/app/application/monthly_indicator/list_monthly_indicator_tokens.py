@@ -2,6 +2,7 @@ import uuid
 
 from app.domain.models.monthly_indicator_token import MonthlyIndicatorToken
 from app.repositories.monthly_indicator_repository import MonthlyIndicatorRepository
+from app.repositories.watermark import Watermark
 
 
 class ListMonthlyIndicatorTokens:
@@ -12,3 +13,6 @@ class ListMonthlyIndicatorTokens:
         self, startup_id: uuid.UUID
     ) -> tuple[list[MonthlyIndicatorToken], int]:
         return await self._repository.get_all_tokens_by_startup(startup_id)
+
+    async def version(self, startup_id: uuid.UUID) -> Watermark:
+        return await self._repository.get_tokens_watermark(startup_id)
@@ -1,7 +1,11 @@
 import uuid
 
 from app.domain.models.monthly_indicator import MonthlyIndicator
+from app.domain.validators import parse_period
 from app.repositories.monthly_indicator_repository import MonthlyIndicatorRepository
+from app.repositories.watermark import Watermark
+
+MAX_PAGE_SIZE = 120
 
 
 class ListMonthlyIndicators:
@@ -9,6 +13,61 @@ class ListMonthlyIndicators:
         self._repository = repository
 
     async def execute(
-        self, startup_id: uuid.UUID
-    ) -> tuple[list[MonthlyIndicator], int]:
-        return await self._repository.get_all_by_startup(startup_id)
+        self,
+        startup_id: uuid.UUID,
+        start: str | None = None,
+        end: str | None = None,
+        limit: int | None = None,
+        after: list | None = None,
+        metrics_only: bool = False,
+    ) -> tuple[list[MonthlyIndicator], int, list | None]:
+        """Return the indicators, their total and the key of the next page.
+
+        ``start``/``end`` are optional "YYYY-MM" bounds. Without ``limit`` the
+        whole range is returned and the total is its length; with it, the total
+        counts the range and ``after`` is the key returned for the previous page.
+        """
+        start_period = parse_period(start) if start is not None else None
+        end_period = parse_period(end) if end is not None else None
+        if (
+            start_period is not None
+            and end_period is not None
+            and (start_period[1], start_period[0]) > (end_period[1], end_period[0])
+        ):
+            raise ValueError("Periodo inicial deve ser anterior ao periodo final")
+        if limit is not None and (limit < 1 or limit > MAX_PAGE_SIZE):
+            raise ValueError(f"Limite deve estar entre 1 e {MAX_PAGE_SIZE}")
+        if after is not None and limit is None:
+            raise ValueError("Cursor requer um limite")
+
+        items = await self._repository.get_history(
+            startup_id,
+            start=start_period,
+            end=end_period,
+            limit=limit + 1 if limit is not None else None,
+            before=self._parse_key(after) if after is not None else None,
+            metrics_only=metrics_only,
+        )
+        if limit is None:
+            return items, len(items), None
+
+        next_key = None
+        if len(items) > limit:
+            items = items[:limit]
+            next_key = [items[-1].year, items[-1].month]
+        total = await self._repository.count_history(
+            startup_id, start=start_period, end=end_period
+        )
+        return items, total, next_key
+
+    async def version(self, startup_id: uuid.UUID) -> Watermark:
+        return await self._repository.get_watermark(startup_id)
+
+    def _parse_key(self, key: list) -> tuple[int, int]:
+        try:
+            year, month = key
+        except (TypeError, ValueError):
+            raise ValueError("Cursor invalido") from None
+        if not isinstance(year, int) or not isinstance(month, int):
+            raise ValueError("Cursor invalido")
+        return month, year
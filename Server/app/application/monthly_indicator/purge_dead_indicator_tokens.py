@@ -0,0 +1,20 @@
+from datetime import datetime, timezone
+
+from app.repositories.monthly_indicator_repository import MonthlyIndicatorRepository
+
+PURGE_BATCH_SIZE = 1000
+
+
+class PurgeDeadIndicatorTokens:
+    def __init__(self, repository: MonthlyIndicatorRepository) -> None:
+        self._repository = repository
+
+    async def execute(self) -> int:
+        """Delete one batch of revoked or expired tokens; return its size.
+
+        Callers repeat, one transaction per batch, until a batch comes back
+        smaller than ``PURGE_BATCH_SIZE``.
+        """
+        return await self._repository.delete_dead_tokens(
+            datetime.now(timezone.utc), PURGE_BATCH_SIZE
+        )
@@ -0,0 +1,25 @@
+import uuid
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class PublicFormTarget:
+    """What a public form token points at: a startup and a reporting period."""
+
+    startup_id: uuid.UUID
+    month: int
+    year: int
+    startup_name: str
+    startup_logo_url: str | None
+
+
+@dataclass(frozen=True)
+class AppliedSubmissions:
+    """A batch of queued submissions taken off the queue.
+
+    ``superseded`` lists the periods where some submitted value gave way to
+    one written after the submission.
+    """
+
+    count: int
+    superseded: list[tuple[uuid.UUID, int, int]]
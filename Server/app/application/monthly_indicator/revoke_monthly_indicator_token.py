@@ -0,0 +1,15 @@
+import uuid
+
+from app.repositories.monthly_indicator_repository import MonthlyIndicatorRepository
+
+
+class RevokeMonthlyIndicatorToken:
+    def __init__(self, repository: MonthlyIndicatorRepository) -> None:
+        self._repository = repository
+
+    async def execute(
+        self, startup_id: uuid.UUID, token_id: uuid.UUID
+    ) -> uuid.UUID | None:
+        """Revoke the startup's live token; return its value, or None if the
+        startup has no such live token."""
+        return await self._repository.revoke_token(startup_id, token_id)
@@ -0,0 +1,29 @@
+from app.application.monthly_indicator.create_monthly_indicator import (
+    CreateMonthlyIndicator,
+)
+from app.domain.models.monthly_indicator import MonthlyIndicator
+from app.repositories.indicator_draft_repository import IndicatorDraftRepository
+from app.repositories.monthly_indicator_repository import MonthlyIndicatorRepository
+from app.repositories.portfolio_snapshot_repository import (
+    PortfolioSnapshotRepository,
+)
+
+
+class SubmitPublicIndicator:
+    def __init__(
+        self,
+        repository: MonthlyIndicatorRepository,
+        snapshot_repo: PortfolioSnapshotRepository,
+        draft_repo: IndicatorDraftRepository,
+    ) -> None:
+        self._create = CreateMonthlyIndicator(repository, snapshot_repo)
+        self._draft_repo = draft_repo
+
+    async def execute(self, indicator: MonthlyIndicator) -> MonthlyIndicator:
+        """Create or merge the founder's indicator and drop the form's saved
+        draft in the same transaction."""
+        saved = await self._create.execute(indicator)
+        await self._draft_repo.delete_many(
+            [(indicator.startup_id, indicator.month, indicator.year)]
+        )
+        return saved
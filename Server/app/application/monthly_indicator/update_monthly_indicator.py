@@ -1,13 +1,22 @@
+from app.application.portfolio.snapshot_periods import indicator_periods
 from app.domain.models.monthly_indicator import MonthlyIndicator
 from app.domain.validators import validate_period_not_future
 from app.repositories.monthly_indicator_repository import (
     MonthlyIndicatorRepository,
 )
+from app.repositories.portfolio_snapshot_repository import (
+    PortfolioSnapshotRepository,
+)
 
 
 class UpdateMonthlyIndicator:
-    def __init__(self, repository: MonthlyIndicatorRepository) -> None:
+    def __init__(
+        self,
+        repository: MonthlyIndicatorRepository,
+        snapshot_repo: PortfolioSnapshotRepository,
+    ) -> None:
         self._repository = repository
+        self._snapshot_repo = snapshot_repo
 
     async def execute(
         self, indicator: MonthlyIndicator, updates: dict
@@ -16,6 +25,10 @@ class UpdateMonthlyIndicator:
         year = updates.get("year", indicator.year)
         validate_period_not_future(month, year)
 
+        affected = indicator_periods(indicator.month, indicator.year)
+        affected += indicator_periods(month, year)
         for field, value in updates.items():
             setattr(indicator, field, value)
-        return await self._repository.update(indicator)
+        updated = await self._repository.update(indicator)
+        await self._snapshot_repo.delete_periods(affected)
+        return updated
@@ -0,0 +1,101 @@
+"""Vectorized portfolio metrics over a startups x periods indicator grid."""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+PERCENTILES = (10, 25, 50, 75, 90)
+
+
+@dataclass(frozen=True)
+class IndicatorGrid:
+    """Indicator columns laid out as ``(startup, period)`` float matrices.
+
+    Periods are consecutive months ending at the reference period, which is
+    the last column. Missing indicators and missing values are ``NaN``;
+    ``reported`` tells which cells had an indicator at all.
+    """
+
+    startup_ids: np.ndarray
+    reported: np.ndarray
+    revenue: np.ndarray
+    gross_margin_pct: np.ndarray
+    cash_balance: np.ndarray
+    ebitda_burn: np.ndarray
+
+
+def build_grid(
+    startup_ids: Sequence,
+    period_offsets: Sequence[int],
+    columns: dict[str, Sequence],
+    periods: int,
+) -> IndicatorGrid:
+    """Scatter flat indicator rows into ``(startup, period)`` matrices.
+
+    ``period_offsets`` is each row's position in the window, ``0`` being the
+    oldest month. Rows outside the window are ignored.
+    """
+    ids, rows = np.unique(np.asarray(startup_ids, dtype=object), return_inverse=True)
+    cols = np.asarray(period_offsets, dtype=np.int64)
+    inside = (cols >= 0) & (cols < periods)
+    rows, cols = rows[inside], cols[inside]
+
+    def scatter(values: Sequence) -> np.ndarray:
+        grid = np.full((len(ids), periods), np.nan)
+        grid[rows, cols] = np.asarray(values, dtype=float)[inside]
+        return grid
+
+    reported = np.zeros((len(ids), periods), dtype=bool)
+    reported[rows, cols] = True
+
+    return IndicatorGrid(
+        startup_ids=ids,
+        reported=reported,
+        revenue=scatter(columns["total_revenue"]),
+        gross_margin_pct=scatter(columns["gross_margin_pct"]),
+        cash_balance=scatter(columns["cash_balance"]),
+        ebitda_burn=scatter(columns["ebitda_burn"]),
+    )
+
+
+def growth(current: np.ndarray, base: np.ndarray) -> np.ndarray:
+    """Relative growth in percent; ``NaN`` where the base is not positive."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(base > 0, (current - base) / base * 100, np.nan)
+
+
+def runway_months(cash_balance: np.ndarray, ebitda_burn: np.ndarray) -> np.ndarray:
+    """Months of cash at the current burn; ``NaN`` when not burning."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(ebitda_burn < 0, cash_balance / -ebitda_burn, np.nan)
+
+
+def burn_multiple(
+    ebitda_burn: np.ndarray, revenue: np.ndarray, previous_revenue: np.ndarray
+) -> np.ndarray:
+    """Net burn per unit of net new revenue; ``NaN`` without burn or growth."""
+    net_new_revenue = revenue - previous_revenue
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(
+            (ebitda_burn < 0) & (net_new_revenue > 0),
+            -ebitda_burn / net_new_revenue,
+            np.nan,
+        )
+
+
+def gross_margin_revenue(
+    revenue: np.ndarray, gross_margin_pct: np.ndarray
+) -> np.ndarray:
+    return revenue * gross_margin_pct / 100
+
+
+def distribution(values: np.ndarray) -> tuple[int, dict[int, float] | None]:
+    """Count of finite values and their percentiles, if there are any."""
+    finite = values[np.isfinite(values)]
+    if finite.size == 0:
+        return 0, None
+    points = np.percentile(finite, PERCENTILES)
+    return int(finite.size), {
+        p: round(float(v), 2) for p, v in zip(PERCENTILES, points, strict=True)
+    }
@@ -0,0 +1,105 @@
+from collections.abc import AsyncIterator
+from typing import Any
+
+from app.repositories.portfolio_repository import PortfolioRepository
+
+STARTUP_FIELDS = ("startup_id", "startup_name", "sector", "status", "investment_date")
+INDICATOR_FIELDS = (
+    "year",
+    "month",
+    "total_revenue",
+    "recurring_revenue_pct",
+    "gross_margin_pct",
+    "cash_balance",
+    "ebitda_burn",
+    "headcount",
+    "achievements",
+    "challenges",
+    "comments",
+)
+BOARD_MEETING_FIELDS = (
+    "meeting_date",
+    "participants",
+    "summary",
+    "attention_points",
+    "next_steps",
+)
+
+
+class ExportPortfolio:
+    """Full portfolio history as streamed records.
+
+    Only the startup being emitted is held in memory, whatever the size of
+    the portfolio.
+    """
+
+    def __init__(self, portfolio_repo: PortfolioRepository) -> None:
+        self._portfolio_repo = portfolio_repo
+
+    async def rows(self) -> AsyncIterator[dict[str, Any]]:
+        """One flat record per startup and reported period."""
+        async for row in self._portfolio_repo.stream_indicator_history():
+            yield {
+                **_startup_fields(row),
+                **{field: getattr(row, field) for field in INDICATOR_FIELDS},
+            }
+
+    async def documents(
+        self, include_board_meetings: bool = False
+    ) -> AsyncIterator[dict[str, Any]]:
+        """One record per startup with its history nested."""
+        meetings = (
+            _BoardMeetingCursor(self._portfolio_repo.stream_board_meetings())
+            if include_board_meetings
+            else None
+        )
+        document: dict[str, Any] | None = None
+        async for row in self._portfolio_repo.stream_indicator_history():
+            if document is None or document["startup_id"] != row.startup_id:
+                if document is not None:
+                    yield await _complete(document, meetings)
+                document = {**_startup_fields(row), "monthly_indicators": []}
+            if row.year is not None:
+                document["monthly_indicators"].append(
+                    {field: getattr(row, field) for field in INDICATOR_FIELDS}
+                )
+        if document is not None:
+            yield await _complete(document, meetings)
+
+
+def _startup_fields(row: Any) -> dict[str, Any]:
+    fields = {field: getattr(row, field) for field in STARTUP_FIELDS}
+    fields["status"] = row.status.value
+    return fields
+
+
+async def _complete(
+    document: dict[str, Any], meetings: "_BoardMeetingCursor | None"
+) -> dict[str, Any]:
+    if meetings is not None:
+        document["board_meetings"] = await meetings.take(document["startup_id"])
+    return document
+
+
+class _BoardMeetingCursor:
+    """Merge-joins a meeting stream sorted by startup id into startup records."""
+
+    def __init__(self, rows: AsyncIterator[Any]) -> None:
+        self._rows = rows
+        self._pending: Any = None
+        self._started = False
+
+    async def take(self, startup_id: Any) -> list[dict[str, Any]]:
+        if not self._started:
+            self._pending = await anext(self._rows, None)
+            self._started = True
+        # Skip meetings whose startup was not in the indicator stream.
+        while self._pending is not None and self._pending.startup_id < startup_id:
+            self._pending = await anext(self._rows, None)
+        taken = []
+        while self._pending is not None and self._pending.startup_id == startup_id:
+            taken.append(
+                {field: getattr(self._pending, field) for field in BOARD_MEETING_FIELDS}
+            )
+            self._pending = await anext(self._rows, None)
+        return taken
@@ -0,0 +1,101 @@
+from datetime import date
+
+import numpy as np
+
+from app.application.portfolio import analytics
+from app.application.portfolio.get_portfolio_summary import resolve_period
+from app.application.portfolio.readmodels import MetricDistribution, PortfolioAnalytics
+from app.repositories.portfolio_repository import PortfolioRepository
+from app.repositories.watermark import Watermark
+
+# Reference month plus the twelve before it, enough for year-over-year growth.
+WINDOW_MONTHS = 13
+
+_INDICATOR_COLUMNS = (
+    "total_revenue",
+    "gross_margin_pct",
+    "cash_balance",
+    "ebitda_burn",
+)
+
+
+class GetPortfolioAnalytics:
+    def __init__(self, portfolio_repo: PortfolioRepository) -> None:
+        self._portfolio_repo = portfolio_repo
+
+    async def version(self) -> tuple[date, Watermark, Watermark]:
+        """Changes with any startup or monthly indicator, and daily because
+        the default period follows the current date."""
+        return date.today(), *await self._portfolio_repo.get_watermark()
+
+    async def execute(
+        self, month: int | None = None, year: int | None = None
+    ) -> PortfolioAnalytics:
+        month, year = resolve_period(month, year)
+        end_index = year * 12 + month - 1
+        start_index = end_index - (WINDOW_MONTHS - 1)
+
+        rows = await self._portfolio_repo.get_indicator_history(
+            (start_index % 12 + 1, start_index // 12), (month, year)
+        )
+        grid = analytics.build_grid(
+            [row.startup_id for row in rows],
+            [row.year * 12 + row.month - 1 - start_index for row in rows],
+            {
+                column: [getattr(row, column) for row in rows]
+                for column in _INDICATOR_COLUMNS
+            },
+            WINDOW_MONTHS,
+        )
+
+        revenue = grid.revenue[:, -1]
+        previous_revenue = grid.revenue[:, -2]
+        gm_revenue = analytics.gross_margin_revenue(
+            revenue, grid.gross_margin_pct[:, -1]
+        )
+        with_margin = np.isfinite(gm_revenue)
+        gm_revenue_total = float(gm_revenue[with_margin].sum())
+        margin_base = float(revenue[with_margin].sum())
+
+        return PortfolioAnalytics(
+            month=month,
+            year=year,
+            reported=int(grid.reported[:, -1].sum()),
+            gross_margin_revenue=round(gm_revenue_total, 2),
+            weighted_gross_margin_pct=(
+                round(gm_revenue_total / margin_base * 100, 1)
+                if margin_base > 0
+                else None
+            ),
+            revenue_growth_mom=_distribution(
+                analytics.growth(revenue, previous_revenue)
+            ),
+            revenue_growth_yoy=_distribution(
+                analytics.growth(revenue, grid.revenue[:, 0])
+            ),
+            runway_months=_distribution(
+                analytics.runway_months(
+                    grid.cash_balance[:, -1], grid.ebitda_burn[:, -1]
+                )
+            ),
+            burn_multiple=_distribution(
+                analytics.burn_multiple(
+                    grid.ebitda_burn[:, -1], revenue, previous_revenue
+                )
+            ),
+            gross_margin_revenue_per_startup=_distribution(gm_revenue),
+        )
+
+
+def _distribution(values: np.ndarray) -> MetricDistribution:
+    count, points = analytics.distribution(values)
+    if points is None:
+        return MetricDistribution()
+    return MetricDistribution(
+        count=count,
+        p10=points[10],
+        p25=points[25],
+        median=points[50],
+        p75=points[75],
+        p90=points[90],
+    )
@@ -0,0 +1,72 @@
+from datetime import date
+from decimal import Decimal
+
+from app.application.portfolio.get_portfolio_timeseries import (
+    iter_periods,
+    resolve_period_range,
+)
+from app.application.portfolio.readmodels import CohortPoint, CohortSeries
+from app.repositories.portfolio_repository import PortfolioRepository
+from app.repositories.watermark import Watermark
+
+_DIMENSION_ORDER = {"total": 0, "vintage": 1, "sector": 2}
+
+
+class GetPortfolioCohorts:
+    def __init__(self, portfolio_repo: PortfolioRepository) -> None:
+        self._portfolio_repo = portfolio_repo
+
+    async def version(self) -> tuple[date, Watermark, Watermark]:
+        """Changes with any startup or monthly indicator, and daily because
+        the default period follows the current date."""
+        return date.today(), *await self._portfolio_repo.get_watermark()
+
+    async def execute(
+        self, start: str | None = None, end: str | None = None
+    ) -> list[CohortSeries]:
+        """Series per vintage year, per sector and for the whole portfolio.
+
+        Every cohort gets a point for every month in the range; months
+        without indicators are zero.
+        """
+        start_period, end_period = resolve_period_range(start, end)
+        periods = iter_periods(start_period, end_period)
+
+        sizes = await self._portfolio_repo.get_cohort_sizes()
+        rows = await self._portfolio_repo.get_cohort_series(start_period, end_period)
+        by_key = {(r.dimension, r.cohort, r.month, r.year): r for r in rows}
+
+        series = []
+        for size in sorted(
+            sizes, key=lambda s: (_DIMENSION_ORDER[s.dimension], s.cohort or "")
+        ):
+            points = []
+            for month, year in periods:
+                row = by_key.get((size.dimension, size.cohort, month, year))
+                reported = row.reported if row else 0
+                points.append(
+                    CohortPoint(
+                        month=month,
+                        year=year,
+                        revenue=Decimal(row.revenue or 0) if row else Decimal("0"),
+                        ebitda_burn=(
+                            Decimal(row.ebitda_burn or 0) if row else Decimal("0")
+                        ),
+                        headcount=(row.headcount or 0) if row else 0,
+                        reported=reported,
+                        monthly_report_pct=(
+                            round(reported / size.startups * 100, 1)
+                            if size.startups
+                            else 0.0
+                        ),
+                    )
+                )
+            series.append(
+                CohortSeries(
+                    dimension=size.dimension,
+                    cohort=size.cohort,
+                    startups=size.startups,
+                    points=points,
+                )
+            )
+        return series
@@ -1,40 +1,83 @@
 import calendar
-from datetime import date
+from datetime import date, timedelta
 from decimal import Decimal
 
 from app.application.portfolio.readmodels import (
     HealthDistribution,
     PortfolioSummary,
-    StartupSummary,
 )
-from app.domain.models.startup import StartupStatus
+from app.domain.models.portfolio_period_snapshot import PortfolioPeriodSnapshot
 from app.domain.validators import validate_period_not_future
-from app.repositories.board_meeting_repository import BoardMeetingRepository
-from app.repositories.monthly_indicator_repository import (
-    MonthlyIndicatorRepository,
+from app.repositories.portfolio_repository import PortfolioRepository
+from app.repositories.portfolio_snapshot_repository import (
+    PortfolioSnapshotRepository,
 )
-from app.repositories.startup_repository import StartupRepository
 
 MEETING_CUTOFF_DAYS = 90
 
 
+def resolve_period(month: int | None, year: int | None) -> tuple[int, int]:
+    """Validate an optional (month, year) pair, defaulting to the current one."""
+    if month is None and year is None:
+        today = date.today()
+        return today.month, today.year
+
+    if month is None or year is None:
+        raise ValueError("Mes e ano devem ser informados juntos")
+
+    if month < 1 or month > 12:
+        raise ValueError("Mes deve estar entre 1 e 12")
+
+    validate_period_not_future(month, year)
+    return month, year
+
+
 class GetPortfolioSummary:
     def __init__(
         self,
-        startup_repo: StartupRepository,
-        indicator_repo: MonthlyIndicatorRepository,
-        meeting_repo: BoardMeetingRepository,
+        portfolio_repo: PortfolioRepository,
+        snapshot_repo: PortfolioSnapshotRepository,
     ) -> None:
-        self._startup_repo = startup_repo
-        self._indicator_repo = indicator_repo
-        self._meeting_repo = meeting_repo
+        self._portfolio_repo = portfolio_repo
+        self._snapshot_repo = snapshot_repo
 
     async def execute(
         self, month: int | None = None, year: int | None = None
     ) -> PortfolioSummary:
-        selected_month, selected_year = self._resolve_period(month, year)
+        snapshot = await self.get_snapshot(month, year)
+        return await self.build_summary(snapshot)
 
-        startups, total = await self._startup_repo.get_all()
+    async def get_snapshot(
+        self, month: int | None = None, year: int | None = None
+    ) -> PortfolioPeriodSnapshot:
+        """Return an up-to-date snapshot for the period, rebuilding it if stale.
+
+        The snapshot ``version`` changes on every rebuild, so callers can use
+        it to validate anything derived from the summary of that period.
+        """
+        selected_month, selected_year = resolve_period(month, year)
+        routines_reference_date = self._get_routines_reference_date(
+            selected_month, selected_year
+        )
+
+        snapshot = await self._snapshot_repo.get(selected_month, selected_year)
+        generation = await self._snapshot_repo.get_generation(
+            selected_month, selected_year
+        )
+        if (
+            snapshot is None
+            or snapshot.reference_date != routines_reference_date
+            or snapshot.generation != generation
+        ):
+            snapshot = await self._rebuild_snapshot(
+                selected_month, selected_year, routines_reference_date, generation
+            )
+        return snapshot
+
+    async def build_summary(
+        self, snapshot: PortfolioPeriodSnapshot
+    ) -> PortfolioSummary:
+        total = snapshot.total_startups
 
         if total == 0:
             return PortfolioSummary(
@@ -45,81 +88,16 @@ class GetPortfolioSummary:
                 health=HealthDistribution(),
                 monthly_report_pct=0.0,
                 routines_up_to_date_pct=0.0,
-                startups=[],
-            )
-
-        startup_ids = [s.id for s in startups]
-        previous_month, previous_year = self._get_previous_period(
-            selected_month, selected_year
-        )
-        indicators_by_period = await self._indicator_repo.get_by_startups_and_period(
-            startup_ids, selected_month, selected_year
-        )
-        previous_indicators_by_period = (
-            await self._indicator_repo.get_by_startups_and_period(
-                startup_ids, previous_month, previous_year
             )
-        )
-
-        healthy = warning = critical = 0
-        for s in startups:
-            if s.status == StartupStatus.HEALTHY:
-                healthy += 1
-            elif s.status == StartupStatus.WARNING:
-                warning += 1
-            elif s.status == StartupStatus.CRITICAL:
-                critical += 1
-
-        total_revenue = Decimal("0")
-        for ind in indicators_by_period.values():
-            if ind.total_revenue:
-                total_revenue += ind.total_revenue
-
-        previous_total_revenue = Decimal("0")
-        for ind in previous_indicators_by_period.values():
-            if ind.total_revenue:
-                previous_total_revenue += ind.total_revenue
 
+        total_revenue = Decimal(snapshot.revenue)
         revenue_variation_pct, revenue_variation_direction = (
-            self._calculate_revenue_variation(total_revenue, previous_total_revenue)
-        )
-
-        startups_with_report = sum(
-            1 for sid in startup_ids if indicators_by_period.get(sid)
-        )
-        report_pct = (startups_with_report / total) * 100
-
-        today = date.today()
-        if selected_month == today.month and selected_year == today.year:
-            routines_reference_date = today
-        else:
-            routines_reference_date = date(
-                selected_year,
-                selected_month,
-                calendar.monthrange(selected_year, selected_month)[1],
-            )
-
-        ids_with_meetings = (
-            await self._meeting_repo.get_startup_ids_with_recent_meetings(
-                startup_ids,
-                MEETING_CUTOFF_DAYS,
-                routines_reference_date,
+            self._calculate_revenue_variation(
+                total_revenue, Decimal(snapshot.previous_revenue)
             )
         )
-        routines_pct = (len(ids_with_meetings) / total) * 100
-
-        monitoring_items = []
-        for s in startups:
-            ind = indicators_by_period.get(s.id)
-            monitoring_items.append(
-                StartupSummary(
-                    startup=s,
-                    total_revenue=ind.total_revenue if ind else None,
-                    cash_balance=ind.cash_balance if ind else None,
-                    ebitda_burn=ind.ebitda_burn if ind else None,
-                    headcount=ind.headcount if ind else None,
-                )
-            )
+        report_pct = (snapshot.reported / total) * 100
+        routines_pct = (snapshot.with_recent_meetings / total) * 100
 
         return PortfolioSummary(
             total_startups=total,
@@ -127,32 +105,53 @@ class GetPortfolioSummary:
             revenue_variation_pct=revenue_variation_pct,
             revenue_variation_direction=revenue_variation_direction,
             health=HealthDistribution(
-                healthy=healthy, warning=warning, critical=critical
+                healthy=snapshot.healthy,
+                warning=snapshot.warning,
+                critical=snapshot.critical,
             ),
             monthly_report_pct=round(report_pct, 1),
             routines_up_to_date_pct=round(routines_pct, 1),
-            startups=monitoring_items,
         )
 
-    def _resolve_period(self, month: int | None, year: int | None) -> tuple[int, int]:
-        if month is None and year is None:
-            today = date.today()
-            return today.month, today.year
-
-        if month is None or year is None:
-            raise ValueError("Mes e ano devem ser informados juntos")
-
-        if month < 1 or month > 12:
-            raise ValueError("Mes deve estar entre 1 e 12")
-
-        validate_period_not_future(month, year)
-        return month, year
+    async def _rebuild_snapshot(
+        self, month: int, year: int, routines_reference_date: date, generation: int
+    ) -> PortfolioPeriodSnapshot:
+        previous_month, previous_year = self._get_previous_period(month, year)
+        aggregates = await self._portfolio_repo.get_period_aggregates(
+            month,
+            year,
+            previous_month,
+            previous_year,
+            routines_reference_date - timedelta(days=MEETING_CUTOFF_DAYS),
+        )
+        return await self._snapshot_repo.save(
+            PortfolioPeriodSnapshot(
+                month=month,
+                year=year,
+                reference_date=routines_reference_date,
+                total_startups=aggregates.total_startups,
+                healthy=aggregates.healthy,
+                warning=aggregates.warning,
+                critical=aggregates.critical,
+                revenue=aggregates.revenue,
+                previous_revenue=aggregates.previous_revenue,
+                reported=aggregates.reported,
+                with_recent_meetings=aggregates.with_recent_meetings,
+                generation=generation,
+            )
+        )
 
     def _get_previous_period(self, month: int, year: int) -> tuple[int, int]:
         if month == 1:
             return 12, year - 1
         return month - 1, year
 
+    def _get_routines_reference_date(self, month: int, year: int) -> date:
+        today = date.today()
+        if month == today.month and year == today.year:
+            return today
+        return date(year, month, calendar.monthrange(year, month)[1])
+
     def _calculate_revenue_variation(
         self, current_revenue: Decimal, previous_revenue: Decimal
     ) -> tuple[float | None, str]:
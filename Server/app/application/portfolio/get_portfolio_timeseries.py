@@ -0,0 +1,97 @@
+from datetime import date
+from decimal import Decimal
+
+from app.application.portfolio.readmodels import PeriodAggregate
+from app.domain.validators import (
+    parse_period,
+    validate_period_not_future,
+    validate_period_range,
+)
+from app.repositories.portfolio_repository import PortfolioRepository
+from app.repositories.watermark import Watermark
+
+DEFAULT_RANGE_MONTHS = 12
+MAX_RANGE_MONTHS = 120
+
+
+def resolve_period_range(
+    start: str | None, end: str | None
+) -> tuple[tuple[int, int], tuple[int, int]]:
+    """Parse optional "YYYY-MM" bounds, defaulting to the last twelve months."""
+    if end is None:
+        today = date.today()
+        end_period = (today.month, today.year)
+    else:
+        end_period = parse_period(end)
+    validate_period_not_future(*end_period)
+
+    if start is None:
+        index = end_period[1] * 12 + end_period[0] - DEFAULT_RANGE_MONTHS
+        start_period = (index % 12 + 1, index // 12)
+    else:
+        start_period = parse_period(start)
+
+    validate_period_range(start_period, end_period, MAX_RANGE_MONTHS)
+    return start_period, end_period
+
+
+def iter_periods(start: tuple[int, int], end: tuple[int, int]) -> list[tuple[int, int]]:
+    month, year = start
+    periods = []
+    while (year, month) <= (end[1], end[0]):
+        periods.append((month, year))
+        month, year = (1, year + 1) if month == 12 else (month + 1, year)
+    return periods
+
+
+class GetPortfolioTimeseries:
+    def __init__(self, portfolio_repo: PortfolioRepository) -> None:
+        self._portfolio_repo = portfolio_repo
+
+    async def version(self) -> tuple[date, Watermark, Watermark]:
+        """Changes with any startup or monthly indicator, and daily because
+        the default period follows the current date."""
+        return date.today(), *await self._portfolio_repo.get_watermark()
+
+    async def execute(
+        self, start: str | None = None, end: str | None = None
+    ) -> list[PeriodAggregate]:
+        start_period, end_period = resolve_period_range(start, end)
+
+        rows = await self._portfolio_repo.get_period_series(start_period, end_period)
+        by_period = {(row.month, row.year): row for row in rows}
+
+        points = []
+        for month, year in iter_periods(start_period, end_period):
+            row = by_period.get((month, year))
+            if row is None:
+                points.append(
+                    PeriodAggregate(
+                        month=month,
+                        year=year,
+                        revenue=Decimal("0"),
+                        cash_balance=Decimal("0"),
+                        ebitda_burn=Decimal("0"),
+                        headcount=0,
+                        reported=0,
+                        monthly_report_pct=0.0,
+                    )
+                )
+                continue
+
+            report_pct = (
+                (row.reported / row.total_startups) * 100 if row.total_startups else 0.0
+            )
+            points.append(
+                PeriodAggregate(
+                    month=month,
+                    year=year,
+                    revenue=Decimal(row.revenue or 0),
+                    cash_balance=Decimal(row.cash_balance or 0),
+                    ebitda_burn=Decimal(row.ebitda_burn or 0),
+                    headcount=row.headcount or 0,
+                    reported=row.reported,
+                    monthly_report_pct=round(report_pct, 1),
+                )
+            )
+        return points
@@ -0,0 +1,81 @@
+import uuid
+from datetime import date, datetime, timezone
+from typing import Any
+
+from app.application.portfolio.get_portfolio_timeseries import (
+    iter_periods,
+    resolve_period_range,
+)
+from app.application.portfolio.readmodels import (
+    ComplianceStatus,
+    ReportingCompliance,
+    ReportingPeriod,
+    StartupCompliance,
+)
+from app.repositories.portfolio_repository import PortfolioRepository
+from app.repositories.watermark import Watermark
+
+
+class GetReportingCompliance:
+    def __init__(self, portfolio_repo: PortfolioRepository) -> None:
+        self._portfolio_repo = portfolio_repo
+
+    async def version(self) -> tuple[date, Watermark, Watermark, Watermark]:
+        """Changes with any startup, monthly indicator or token, and daily
+        because the default period and token expiry follow the current date."""
+        return (
+            date.today(),
+            *await self._portfolio_repo.get_watermark(),
+            await self._portfolio_repo.get_token_watermark(),
+        )
+
+    async def execute(
+        self,
+        start: str | None = None,
+        end: str | None = None,
+        missing_only: bool = False,
+    ) -> ReportingCompliance:
+        """Startups x months matrix of reported, pending and missing reports.
+
+        A cell is "pending" when a live token was issued for it but nothing
+        was reported yet; months before the investment are None unless
+        something was reported for them. With
+        ``missing_only`` only startups with a missing report are returned.
+        """
+        start_period, end_period = resolve_period_range(start, end)
+        periods = iter_periods(start_period, end_period)
+        index = {period: i for i, period in enumerate(periods)}
+
+        rows = await self._portfolio_repo.get_reporting_cells(
+            start_period, end_period, datetime.now(timezone.utc)
+        )
+        grouped: dict[uuid.UUID, tuple[Any, dict[int, ComplianceStatus]]] = {}
+        for row in rows:
+            startup, cells = grouped.setdefault(row.id, (row, {}))
+            if row.month is not None:
+                cells[index[(row.month, row.year)]] = (
+                    "reported" if row.reported else "pending"
+                )
+
+        startups = []
+        for startup, filled in grouped.values():
+            invested = (startup.investment_date.year, startup.investment_date.month)
+            cells: list[ComplianceStatus | None] = [
+                filled.get(i) or ("missing" if (year, month) >= invested else None)
+                for i, (month, year) in enumerate(periods)
+            ]
+            missing = cells.count("missing")
+            if missing_only and not missing:
+                continue
+            startups.append(
+                StartupCompliance(
+                    startup_id=startup.id,
+                    name=startup.name,
+                    cells=cells,
+                    missing=missing,
+                )
+            )
+        return ReportingCompliance(
+            periods=[ReportingPeriod(month=m, year=y) for m, y in periods],
+            startups=startups,
+        )
@@ -0,0 +1,104 @@
+import uuid
+from datetime import date
+from decimal import Decimal, InvalidOperation
+from typing import Any, Literal
+
+from app.application.portfolio.get_portfolio_summary import resolve_period
+from app.application.portfolio.readmodels import StartupSummary
+from app.repositories.portfolio_repository import PortfolioRepository
+from app.repositories.watermark import Watermark
+
+SortField = Literal["name", "total_revenue", "cash_balance", "ebitda_burn", "headcount"]
+SortOrder = Literal["asc", "desc"]
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+_DECIMAL_FIELDS = {"total_revenue", "cash_balance", "ebitda_burn"}
+
+
+class ListPortfolioStartups:
+    def __init__(self, portfolio_repo: PortfolioRepository) -> None:
+        self._portfolio_repo = portfolio_repo
+
+    async def version(self) -> tuple[date, Watermark, Watermark]:
+        """Changes with any startup or monthly indicator, and daily because
+        the default period follows the current date."""
+        return date.today(), *await self._portfolio_repo.get_watermark()
+
+    async def execute(
+        self,
+        month: int | None = None,
+        year: int | None = None,
+        sort: SortField = "name",
+        order: SortOrder = "asc",
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: list | None = None,
+    ) -> tuple[list[StartupSummary], list | None]:
+        """Return one page of the monitoring list and the key of the next one.
+
+        ``after`` is the key returned for the previous page; it is only valid
+        for the same sort and order it was produced with.
+        """
+        selected_month, selected_year = resolve_period(month, year)
+        if limit < 1 or limit > MAX_PAGE_SIZE:
+            raise ValueError(f"Limite deve estar entre 1 e {MAX_PAGE_SIZE}")
+
+        rows = await self._portfolio_repo.get_monitoring_page(
+            selected_month,
+            selected_year,
+            sort,
+            order == "desc",
+            limit + 1,
+            self._parse_key(sort, order, after) if after is not None else None,
+        )
+
+        next_key = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            value = last.Startup.name if sort == "name" else getattr(last, sort)
+            next_key = [sort, order, _dump_value(value), str(last.Startup.id)]
+
+        items = [
+            StartupSummary(
+                startup=row.Startup,
+                total_revenue=row.total_revenue,
+                cash_balance=row.cash_balance,
+                ebitda_burn=row.ebitda_burn,
+                headcount=row.headcount,
+            )
+            for row in rows
+        ]
+        return items, next_key
+
+    def _parse_key(
+        self, sort: SortField, order: SortOrder, key: list
+    ) -> tuple[Any, uuid.UUID]:
+        try:
+            key_sort, key_order, value, last_id = key
+            if (key_sort, key_order) != (sort, order):
+                raise ValueError
+            return _load_value(sort, value), uuid.UUID(last_id)
+        except (TypeError, ValueError, InvalidOperation):
+            raise ValueError("Cursor invalido para a ordenacao informada") from None
+
+
+def _dump_value(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def _load_value(sort: SortField, value: Any) -> Any:
+    if value is None:
+        return None
+    if sort in _DECIMAL_FIELDS:
+        return Decimal(str(value))
+    if sort == "headcount":
+        if not isinstance(value, int):
+            raise ValueError
+        return value
+    if not isinstance(value, str):
+        raise ValueError
+    return value
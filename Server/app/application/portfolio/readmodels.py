@@ -1,3 +1,4 @@
+import uuid
 from dataclasses import dataclass
 from decimal import Decimal
 from typing import Literal
@@ -30,4 +31,82 @@ class PortfolioSummary:
     health: HealthDistribution
     monthly_report_pct: float
     routines_up_to_date_pct: float
-    startups: list[StartupSummary]
+
+
+@dataclass(frozen=True)
+class PeriodAggregate:
+    month: int
+    year: int
+    revenue: Decimal
+    cash_balance: Decimal
+    ebitda_burn: Decimal
+    headcount: int
+    reported: int
+    monthly_report_pct: float
+
+
+@dataclass(frozen=True)
+class MetricDistribution:
+    count: int = 0
+    p10: float | None = None
+    p25: float | None = None
+    median: float | None = None
+    p75: float | None = None
+    p90: float | None = None
+
+
+@dataclass(frozen=True)
+class PortfolioAnalytics:
+    month: int
+    year: int
+    reported: int
+    gross_margin_revenue: float
+    weighted_gross_margin_pct: float | None
+    revenue_growth_mom: MetricDistribution
+    revenue_growth_yoy: MetricDistribution
+    runway_months: MetricDistribution
+    burn_multiple: MetricDistribution
+    gross_margin_revenue_per_startup: MetricDistribution
+
+
+@dataclass(frozen=True)
+class CohortPoint:
+    month: int
+    year: int
+    revenue: Decimal
+    ebitda_burn: Decimal
+    headcount: int
+    reported: int
+    monthly_report_pct: float
+
+
+@dataclass(frozen=True)
+class CohortSeries:
+    dimension: Literal["vintage", "sector", "total"]
+    cohort: str | None
+    startups: int
+    points: list[CohortPoint]
+
+
+ComplianceStatus = Literal["reported", "pending", "missing"]
+
+
+@dataclass(frozen=True)
+class ReportingPeriod:
+    month: int
+    year: int
+
+
+@dataclass(frozen=True)
+class StartupCompliance:
+    startup_id: uuid.UUID
+    name: str
+    # One entry per period; None before the investment month.
+    cells: list[ComplianceStatus | None]
+    missing: int
+
+
+@dataclass(frozen=True)
+class ReportingCompliance:
+    periods: list[ReportingPeriod]
+    startups: list[StartupCompliance]
@@ -0,0 +1,16 @@
+from datetime import date, timedelta
+
+from app.application.portfolio.get_portfolio_summary import MEETING_CUTOFF_DAYS
+
+
+def indicator_periods(month: int, year: int) -> list[tuple[int, int]]:
+    """Snapshots that read an indicator of (month, year): its own and the next."""
+    if month == 12:
+        return [(month, year), (1, year + 1)]
+    return [(month, year), (month + 1, year)]
+
+
+def meeting_horizon(meeting_date: date) -> tuple[int, int]:
+    """Last period whose routines coverage can still count this meeting."""
+    horizon = meeting_date + timedelta(days=MEETING_CUTOFF_DAYS)
+    return horizon.month, horizon.year
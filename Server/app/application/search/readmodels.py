@@ -0,0 +1,16 @@
+import uuid
+from dataclasses import dataclass
+from typing import Literal
+
+SearchKind = Literal["startup", "board_meeting", "monthly_indicator", "deal"]
+
+
+@dataclass(frozen=True)
+class SearchResult:
+    kind: SearchKind
+    id: uuid.UUID
+    # None for deals, which are not portfolio startups yet.
+    startup_id: uuid.UUID | None
+    title: str
+    snippet: str
+    rank: float
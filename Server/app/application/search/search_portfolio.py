@@ -0,0 +1,76 @@
+import uuid
+
+from app.application.search.readmodels import SearchResult
+from app.repositories.search_repository import SearchRepository
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+MIN_QUERY_LENGTH = 2
+SNIPPET_LENGTH = 160
+
+
+class SearchPortfolio:
+    def __init__(self, repository: SearchRepository) -> None:
+        self._repository = repository
+
+    async def execute(
+        self, query: str, limit: int = DEFAULT_PAGE_SIZE, after: list | None = None
+    ) -> tuple[list[SearchResult], list | None]:
+        """Return one page of ranked results and the key of the next one."""
+        query = query.strip()
+        if len(query) < MIN_QUERY_LENGTH:
+            raise ValueError(f"Busca deve ter ao menos {MIN_QUERY_LENGTH} caracteres")
+        if limit < 1 or limit > MAX_PAGE_SIZE:
+            raise ValueError(f"Limite deve estar entre 1 e {MAX_PAGE_SIZE}")
+
+        rows = await self._repository.search(
+            query,
+            limit + 1,
+            self._parse_key(after) if after is not None else None,
+        )
+        next_key = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_key = [float(rows[-1].rank), str(rows[-1].id)]
+
+        terms = query.lower().split()
+        items = [
+            SearchResult(
+                kind=row.kind,
+                id=row.id,
+                startup_id=row.startup_id,
+                title=row.title,
+                snippet=_snippet(row.document, terms),
+                rank=float(row.rank),
+            )
+            for row in rows
+        ]
+        return items, next_key
+
+    def _parse_key(self, key: list) -> tuple[float, uuid.UUID]:
+        try:
+            rank, last_id = key
+            if isinstance(rank, bool) or not isinstance(rank, (int, float)):
+                raise ValueError
+            return float(rank), uuid.UUID(last_id)
+        except (TypeError, ValueError, AttributeError):
+            raise ValueError("Cursor invalido") from None
+
+
+def _snippet(document: str, terms: list[str]) -> str:
+    """A window of the document around the first term found in it.
+
+    Stemmed matches may contain none of the terms verbatim; the document
+    start is used then.
+    """
+    text = " ".join(document.split())
+    lowered = text.lower()
+    positions = [lowered.find(term) for term in terms]
+    start = min((p for p in positions if p >= 0), default=0)
+    start = max(0, start - SNIPPET_LENGTH // 4)
+    snippet = text[start : start + SNIPPET_LENGTH]
+    if start > 0:
+        snippet = "..." + snippet
+    if start + SNIPPET_LENGTH < len(text):
+        snippet += "..."
+    return snippet
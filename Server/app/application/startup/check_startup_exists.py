@@ -0,0 +1,11 @@
+import uuid
+
+from app.repositories.startup_repository import StartupRepository
+
+
+class CheckStartupExists:
+    def __init__(self, repository: StartupRepository) -> None:
+        self._repository = repository
+
+    async def execute(self, startup_id: uuid.UUID) -> bool:
+        return await self._repository.exists(startup_id)
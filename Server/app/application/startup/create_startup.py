@@ -1,10 +1,20 @@
 from app.domain.models.startup import Startup
+from app.repositories.portfolio_snapshot_repository import (
+    PortfolioSnapshotRepository,
+)
 from app.repositories.startup_repository import StartupRepository
 
 
 class CreateStartup:
-    def __init__(self, repository: StartupRepository) -> None:
+    def __init__(
+        self,
+        repository: StartupRepository,
+        snapshot_repo: PortfolioSnapshotRepository,
+    ) -> None:
         self._repository = repository
+        self._snapshot_repo = snapshot_repo
 
     async def execute(self, startup: Startup) -> Startup:
-        return await self._repository.create(startup)
+        created = await self._repository.create(startup)
+        await self._snapshot_repo.delete_all()
+        return created
@@ -1,10 +1,27 @@
 from app.domain.models.startup import Startup
+from app.repositories.portfolio_snapshot_repository import (
+    PortfolioSnapshotRepository,
+)
 from app.repositories.startup_repository import StartupRepository
 
 
 class DeleteStartup:
-    def __init__(self, repository: StartupRepository) -> None:
+    def __init__(
+        self,
+        repository: StartupRepository,
+        snapshot_repo: PortfolioSnapshotRepository,
+    ) -> None:
         self._repository = repository
+        self._snapshot_repo = snapshot_repo
 
-    async def execute(self, startup: Startup) -> None:
-        await self._repository.delete(startup)
+    async def execute(self, startup: Startup, purge_later: bool = False) -> None:
+        """Delete a startup and, through the foreign key cascade, its history.
+
+        With ``purge_later`` the startup is only marked deleted, which hides
+        it at once, and ``PurgeDeletedStartups`` removes it in batches.
+        """
+        if purge_later:
+            await self._repository.soft_delete(startup)
+        else:
+            await self._repository.delete(startup)
+        await self._snapshot_repo.delete_all()
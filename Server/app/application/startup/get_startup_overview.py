@@ -0,0 +1,46 @@
+import uuid
+
+from app.application.startup.readmodels import StartupOverview
+from app.repositories.board_meeting_repository import BoardMeetingRepository
+from app.repositories.monthly_indicator_repository import MonthlyIndicatorRepository
+from app.repositories.startup_repository import StartupRepository
+
+DEFAULT_INDICATORS = 12
+DEFAULT_MEETINGS = 10
+MAX_ITEMS = 120
+
+
+class GetStartupOverview:
+    def __init__(
+        self,
+        startup_repo: StartupRepository,
+        indicator_repo: MonthlyIndicatorRepository,
+        meeting_repo: BoardMeetingRepository,
+    ) -> None:
+        self._startup_repo = startup_repo
+        self._indicator_repo = indicator_repo
+        self._meeting_repo = meeting_repo
+
+    async def execute(
+        self,
+        startup_id: uuid.UUID,
+        indicators: int = DEFAULT_INDICATORS,
+        meetings: int = DEFAULT_MEETINGS,
+    ) -> StartupOverview | None:
+        """Return the startup page in one call, or None if it does not exist.
+
+        The reads are cheap key and LIMIT lookups, so they run one after
+        another in the request transaction rather than fanning out.
+        """
+        startup = await self._startup_repo.get_with_details(startup_id)
+        if startup is None:
+            return None
+        latest_indicators = await self._indicator_repo.get_history(
+            startup_id, limit=indicators
+        )
+        recent_meetings = await self._meeting_repo.get_recent(startup_id, meetings)
+        return StartupOverview(
+            startup=startup,
+            indicators=latest_indicators,
+            board_meetings=recent_meetings,
+        )
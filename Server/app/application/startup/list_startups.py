@@ -1,10 +1,82 @@
-from app.domain.models.startup import Startup
-from app.repositories.startup_repository import StartupRepository
+import uuid
+from collections import Counter
+
+from app.application.startup.readmodels import StartupFacets
+from app.domain.models.startup import Startup, StartupStatus
+from app.repositories.startup_repository import StartupFilters, StartupRepository
+from app.repositories.watermark import Watermark
+
+MAX_PAGE_SIZE = 200
 
 
 class ListStartups:
     def __init__(self, repository: StartupRepository) -> None:
         self._repository = repository
 
-    async def execute(self) -> tuple[list[Startup], int]:
-        return await self._repository.get_all()
+    async def execute(
+        self,
+        filters: StartupFilters = StartupFilters(),
+        limit: int | None = None,
+        after: list | None = None,
+    ) -> tuple[list[Startup], int, StartupFacets, list | None]:
+        """Return the startups, their total, the facets and the next page key.
+
+        Startups come ordered by name. Without ``limit`` every match is
+        returned; ``after`` is the key returned for the previous page.
+        """
+        if (
+            filters.invested_from is not None
+            and filters.invested_to is not None
+            and filters.invested_from > filters.invested_to
+        ):
+            raise ValueError("Data inicial deve ser anterior a data final")
+        if limit is not None and (limit < 1 or limit > MAX_PAGE_SIZE):
+            raise ValueError(f"Limite deve estar entre 1 e {MAX_PAGE_SIZE}")
+        if after is not None and limit is None:
+            raise ValueError("Cursor requer um limite")
+
+        items = await self._repository.get_page(
+            filters,
+            limit=limit + 1 if limit is not None else None,
+            after=self._parse_key(after) if after is not None else None,
+        )
+        next_key = None
+        if limit is not None and len(items) > limit:
+            items = items[:limit]
+            next_key = [items[-1].name, str(items[-1].id)]
+
+        total, facets = _facets(
+            filters, await self._repository.get_facet_counts(filters)
+        )
+        return items, total, facets, next_key
+
+    async def version(self) -> Watermark:
+        return await self._repository.get_watermark()
+
+    def _parse_key(self, key: list) -> tuple[str, uuid.UUID]:
+        try:
+            name, last_id = key
+            if not isinstance(name, str):
+                raise ValueError
+            return name, uuid.UUID(last_id)
+        except (TypeError, ValueError, AttributeError):
+            raise ValueError("Cursor invalido") from None
+
+
+def _facets(filters: StartupFilters, rows: list) -> tuple[int, StartupFacets]:
+    """Fold (status, sector) counts into the total and both facets."""
+    total = 0
+    statuses: Counter[str] = Counter({status.value: 0 for status in StartupStatus})
+    sectors: Counter[str] = Counter()
+    for row in rows:
+        status_match = not filters.statuses or row.status in filters.statuses
+        sector_match = not filters.sectors or row.sector in filters.sectors
+        if sector_match:
+            statuses[row.status.value] += row.startups
+        if status_match:
+            sectors[row.sector] += row.startups
+        if status_match and sector_match:
+            total += row.startups
+    return total, StartupFacets(
+        status=dict(statuses), sector=dict(sorted(sectors.items()))
+    )
@@ -0,0 +1,36 @@
+from app.repositories.portfolio_snapshot_repository import (
+    PortfolioSnapshotRepository,
+)
+from app.repositories.startup_repository import StartupRepository
+
+PURGE_BATCH_SIZE = 1000
+
+
+class PurgeDeletedStartups:
+    def __init__(
+        self,
+        repository: StartupRepository,
+        snapshot_repo: PortfolioSnapshotRepository,
+    ) -> None:
+        self._repository = repository
+        self._snapshot_repo = snapshot_repo
+
+    async def execute(self) -> int:
+        """Delete one batch of a soft-deleted startup; return the rows removed.
+
+        Each batch takes up to ``PURGE_BATCH_SIZE`` rows of every history
+        table. Once a startup has none left, its own row goes too. Callers
+        repeat, one transaction per batch, until nothing is left to purge.
+        """
+        startup_id = await self._repository.get_next_deleted_id()
+        if startup_id is None:
+            return 0
+        deleted = await self._repository.delete_history_batch(
+            startup_id, PURGE_BATCH_SIZE
+        )
+        if deleted == 0:
+            await self._repository.delete_by_id(startup_id)
+            # Aggregates over the history no longer include the startup.
+            await self._snapshot_repo.delete_all()
+            deleted = 1
+        return deleted
@@ -0,0 +1,30 @@
+from dataclasses import dataclass
+
+from app.domain.models.board_meeting import BoardMeeting
+from app.domain.models.monthly_indicator import MonthlyIndicator
+from app.domain.models.startup import Startup
+
+
+@dataclass(frozen=True)
+class StartupFacets:
+    """Startup counts per status and per sector.
+
+    Each facet ignores its own selection, so the counts show what picking
+    another value would return.
+    """
+
+    status: dict[str, int]
+    sector: dict[str, int]
+
+
+@dataclass(frozen=True)
+class StartupOverview:
+    """A startup with everything its page shows, read from one snapshot.
+
+    ``startup.executives`` and ``startup.monthly_indicator_tokens`` (live
+    tokens only) are loaded; the indicators and meetings are the latest ones.
+    """
+
+    startup: Startup
+    indicators: list[MonthlyIndicator]
+    board_meetings: list[BoardMeeting]
@@ -1,12 +1,22 @@
 from app.domain.models.startup import Startup
+from app.repositories.portfolio_snapshot_repository import (
+    PortfolioSnapshotRepository,
+)
 from app.repositories.startup_repository import StartupRepository
 
 
 class UpdateStartup:
-    def __init__(self, repository: StartupRepository) -> None:
+    def __init__(
+        self,
+        repository: StartupRepository,
+        snapshot_repo: PortfolioSnapshotRepository,
+    ) -> None:
         self._repository = repository
+        self._snapshot_repo = snapshot_repo
 
     async def execute(self, startup: Startup, updates: dict) -> Startup:
         for field, value in updates.items():
             setattr(startup, field, value)
-        return await self._repository.update(startup)
+        updated = await self._repository.update(startup)
+        await self._snapshot_repo.delete_all()
+        return updated
@@ -10,6 +10,20 @@ class Settings(BaseSettings):
     db_pool_size: int = 5
     db_max_overflow: int = 10
     db_pool_pre_ping: bool = True
+    portfolio_summary_cache_size: int = 64
+    public_form_cache_size: int = 1024
+    public_form_cache_ttl_seconds: int = 300
+    startup_exists_cache_size: int = 4096
+    startup_exists_cache_ttl_seconds: int = 60
+    schedule_indicator_tokens: bool = False
+    sweep_indicator_tokens: bool = False
+    indicator_token_sweep_interval_seconds: int = 3600
+    queue_public_submissions: bool = False
+    public_submission_drain_interval_seconds: int = 2
+    indicator_draft_flush_interval_seconds: int = 5
+    indicator_draft_buffer_size: int = 10000
+    soft_delete_startups: bool = False
+    startup_purge_interval_seconds: int = 30
 
     class Config:
         env_file = ".env"
@@ -1,13 +1,18 @@
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 
 from app.application.board_meeting.create_board_meeting import CreateBoardMeeting
 from app.application.board_meeting.delete_board_meeting import DeleteBoardMeeting
 from app.application.board_meeting.get_board_meeting import GetBoardMeeting
 from app.application.board_meeting.list_board_meetings import ListBoardMeetings
 from app.application.board_meeting.update_board_meeting import UpdateBoardMeeting
-from app.controllers.dependencies import board_meeting_builder, verify_startup_exists
+from app.controllers.conditional import conditional
+from app.controllers.dependencies import (
+    board_meeting_builder,
+    board_meeting_write_builder,
+    verify_startup_exists,
+)
 from app.domain.models.board_meeting import BoardMeeting
 from app.domain.schemas.board_meeting import (
     BoardMeetingCreate,
@@ -23,9 +28,14 @@ router = APIRouter(
 
 @router.get("", response_model=BoardMeetingListResponse)
 async def list_board_meetings(
+    request: Request,
+    response: Response,
     startup_id: uuid.UUID = Depends(verify_startup_exists),
     use_case: ListBoardMeetings = Depends(board_meeting_builder(ListBoardMeetings)),
 ):
+    unchanged = conditional(request, response, await use_case.version(startup_id))
+    if unchanged is not None:
+        return unchanged
     items, total = await use_case.execute(startup_id)
     return BoardMeetingListResponse(
         items=[BoardMeetingResponse.model_validate(m) for m in items],
@@ -39,7 +49,9 @@ async def list_board_meetings(
 async def create_board_meeting(
     data: BoardMeetingCreate,
     startup_id: uuid.UUID = Depends(verify_startup_exists),
-    use_case: CreateBoardMeeting = Depends(board_meeting_builder(CreateBoardMeeting)),
+    use_case: CreateBoardMeeting = Depends(
+        board_meeting_write_builder(CreateBoardMeeting)
+    ),
 ):
     meeting = BoardMeeting(startup_id=startup_id, **data.model_dump())
     created = await use_case.execute(meeting)
@@ -49,6 +61,8 @@ async def create_board_meeting(
 @router.get("/{meeting_id}", response_model=BoardMeetingResponse)
 async def get_board_meeting(
     meeting_id: uuid.UUID,
+    request: Request,
+    response: Response,
     startup_id: uuid.UUID = Depends(verify_startup_exists),
     use_case: GetBoardMeeting = Depends(board_meeting_builder(GetBoardMeeting)),
 ):
@@ -58,6 +72,15 @@ async def get_board_meeting(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Reunião com id {meeting_id} não encontrada",
         )
+    unchanged = conditional(
+        request,
+        response,
+        meeting.id,
+        meeting.updated_at,
+        last_modified=meeting.updated_at,
+    )
+    if unchanged is not None:
+        return unchanged
     return BoardMeetingResponse.model_validate(meeting)
 
 
@@ -67,7 +90,9 @@ async def update_board_meeting(
     data: BoardMeetingUpdate,
     startup_id: uuid.UUID = Depends(verify_startup_exists),
     get_uc: GetBoardMeeting = Depends(board_meeting_builder(GetBoardMeeting)),
-    update_uc: UpdateBoardMeeting = Depends(board_meeting_builder(UpdateBoardMeeting)),
+    update_uc: UpdateBoardMeeting = Depends(
+        board_meeting_write_builder(UpdateBoardMeeting)
+    ),
 ):
     meeting = await get_uc.execute(meeting_id)
     if not meeting or meeting.startup_id != startup_id:
@@ -84,7 +109,9 @@ async def delete_board_meeting(
     meeting_id: uuid.UUID,
     startup_id: uuid.UUID = Depends(verify_startup_exists),
     get_uc: GetBoardMeeting = Depends(board_meeting_builder(GetBoardMeeting)),
-    delete_uc: DeleteBoardMeeting = Depends(board_meeting_builder(DeleteBoardMeeting)),
+    delete_uc: DeleteBoardMeeting = Depends(
+        board_meeting_write_builder(DeleteBoardMeeting)
+    ),
 ):
     meeting = await get_uc.execute(meeting_id)
     if not meeting or meeting.startup_id != startup_id:
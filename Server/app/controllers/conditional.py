@@ -0,0 +1,82 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Request, Response, status
+
+
+def etag_headers(*version: object) -> dict[str, str]:
+    """Validator headers for a representation identified by ``version``."""
+    digest = hashlib.blake2b(repr(version).encode(), digest_size=16).hexdigest()
+    return {"ETag": f'W/"{digest}"', "Cache-Control": "private, no-cache"}
+
+
+def not_modified(
+    request: Request,
+    headers: dict[str, str],
+    last_modified: datetime | None = None,
+) -> Response | None:
+    """Return a 304 when the client's copy is current, else ``None``.
+
+    ``If-None-Match`` wins over ``If-Modified-Since`` as in RFC 9110; the
+    latter is only evaluated when a ``last_modified`` is given.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        fresh = _etag_matches(if_none_match, headers["ETag"])
+    else:
+        fresh = _not_modified_since(
+            request.headers.get("if-modified-since"), last_modified
+        )
+    if fresh:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return None
+
+
+def conditional(
+    request: Request,
+    response: Response,
+    *version: object,
+    last_modified: datetime | None = None,
+) -> Response | None:
+    """Set validators on ``response`` and short-circuit with a 304 if fresh.
+
+    Compute ``version`` from cheap watermarks, before loading the data.
+    """
+    headers = etag_headers(*version)
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(_as_utc(last_modified), usegmt=True)
+    response.headers.update(headers)
+    return not_modified(request, headers, last_modified)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison: W/"x" and "x" refer to the same representation.
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def _not_modified_since(
+    if_modified_since: str | None, last_modified: datetime | None
+) -> bool:
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        return False
+    return _as_utc(last_modified).replace(microsecond=0) <= since
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite returns naive timestamps; the columns are always stored in UTC.
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
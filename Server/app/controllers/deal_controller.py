@@ -1,12 +1,13 @@
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 
 from app.application.deal.create_deal import CreateDeal
 from app.application.deal.delete_deal import DeleteDeal
 from app.application.deal.get_deal import GetDeal
 from app.application.deal.list_deals import ListDeals
 from app.application.deal.update_deal import UpdateDeal
+from app.controllers.conditional import conditional
 from app.controllers.dependencies import deal_builder
 from app.domain.models.deal import Deal
 from app.domain.schemas.deal import (
@@ -21,8 +22,13 @@ router = APIRouter(prefix="/deals", tags=["Deals"])
 
 @router.get("", response_model=DealListResponse)
 async def list_deals(
+    request: Request,
+    response: Response,
     use_case: ListDeals = Depends(deal_builder(ListDeals)),
 ):
+    unchanged = conditional(request, response, await use_case.version())
+    if unchanged is not None:
+        return unchanged
     items, total = await use_case.execute()
     return DealListResponse(
         items=[DealResponse.model_validate(d) for d in items],
@@ -43,6 +49,8 @@ async def create_deal(
 @router.get("/{deal_id}", response_model=DealResponse)
 async def get_deal(
     deal_id: uuid.UUID,
+    request: Request,
+    response: Response,
     use_case: GetDeal = Depends(deal_builder(GetDeal)),
 ):
     deal = await use_case.execute(deal_id)
@@ -51,6 +59,11 @@ async def get_deal(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Deal com id {deal_id} não encontrado",
         )
+    unchanged = conditional(
+        request, response, deal.id, deal.updated_at, last_modified=deal.updated_at
+    )
+    if unchanged is not None:
+        return unchanged
     return DealResponse.model_validate(deal)
 
 
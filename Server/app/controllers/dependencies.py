@@ -1,16 +1,29 @@
+import time
 import uuid
 from typing import Callable, TypeVar
 
 from fastapi import Depends, HTTPException, status
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.application.startup.get_startup import GetStartup
+from app.application.startup.check_startup_exists import CheckStartupExists
+from app.config import settings
 from app.database import get_session
 from app.infrastructure.bcrypt_password_hasher import BcryptPasswordHasher
+from app.infrastructure.lru_cache import LruCache
 from app.repositories.board_meeting_repository import BoardMeetingRepository
 from app.repositories.deal_repository import DealRepository
 from app.repositories.executive_repository import ExecutiveRepository
+from app.repositories.indicator_draft_repository import IndicatorDraftRepository
+from app.repositories.indicator_submission_repository import (
+    IndicatorSubmissionRepository,
+)
 from app.repositories.monthly_indicator_repository import MonthlyIndicatorRepository
+from app.repositories.portfolio_repository import PortfolioRepository
+from app.repositories.portfolio_snapshot_repository import (
+    PortfolioSnapshotRepository,
+)
+from app.repositories.search_repository import SearchRepository
 from app.repositories.startup_repository import StartupRepository
 from app.repositories.user_invite_repository import UserInviteRepository
 from app.repositories.user_repository import UserRepository
@@ -65,16 +78,34 @@ def _multi_repo_use_case_with_hasher_builder(
 
 
 startup_builder = _use_case_builder(StartupRepository)
+startup_write_builder = _multi_repo_use_case_builder(
+    StartupRepository, PortfolioSnapshotRepository
+)
+startup_overview_builder = _multi_repo_use_case_builder(
+    StartupRepository, MonthlyIndicatorRepository, BoardMeetingRepository
+)
 deal_builder = _use_case_builder(DealRepository)
 board_meeting_builder = _use_case_builder(BoardMeetingRepository)
+board_meeting_write_builder = _multi_repo_use_case_builder(
+    BoardMeetingRepository, PortfolioSnapshotRepository
+)
 executive_builder = _use_case_builder(ExecutiveRepository)
 monthly_indicator_builder = _use_case_builder(MonthlyIndicatorRepository)
-portfolio_builder = _multi_repo_use_case_builder(
-    StartupRepository, MonthlyIndicatorRepository, BoardMeetingRepository
+monthly_indicator_write_builder = _multi_repo_use_case_builder(
+    MonthlyIndicatorRepository, PortfolioSnapshotRepository
+)
+public_indicator_submit_builder = _multi_repo_use_case_builder(
+    MonthlyIndicatorRepository, PortfolioSnapshotRepository, IndicatorDraftRepository
+)
+indicator_submission_builder = _use_case_builder(IndicatorSubmissionRepository)
+monthly_indicator_import_builder = _multi_repo_use_case_builder(
+    MonthlyIndicatorRepository, StartupRepository, PortfolioSnapshotRepository
 )
-public_form_builder = _multi_repo_use_case_builder(
-    StartupRepository, MonthlyIndicatorRepository
+portfolio_builder = _multi_repo_use_case_builder(
+    PortfolioRepository, PortfolioSnapshotRepository
 )
+portfolio_read_builder = _use_case_builder(PortfolioRepository)
+search_builder = _use_case_builder(SearchRepository)
 user_builder = _use_case_builder(UserRepository)
 user_invite_builder = _use_case_builder(UserInviteRepository)
 user_invite_create_builder = _multi_repo_use_case_builder(
@@ -91,15 +122,49 @@ user_invite_consume_builder = _multi_repo_use_case_with_hasher_builder(
 )
 
 
+# startup id -> expiry on the monotonic clock. Every nested route checks its
+# startup; a hit skips the query. Deletes in this process drop the entry on
+# commit, and the TTL bounds how long another worker's delete can go
+# unnoticed; writes in that window fail on the foreign key and answer 404.
+_known_startups: LruCache[uuid.UUID, float] = LruCache(
+    settings.startup_exists_cache_size
+)
+
+
 async def verify_startup_exists(
     startup_id: uuid.UUID,
-    get_uc: GetStartup = Depends(startup_builder(GetStartup)),
+    check_uc: CheckStartupExists = Depends(startup_builder(CheckStartupExists)),
 ) -> uuid.UUID:
     """Validate that a startup exists; return its id or raise 404."""
-    startup = await get_uc.execute(startup_id)
-    if not startup:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Startup com id {startup_id} não encontrada",
+    expires_at = _known_startups.get(startup_id)
+    if expires_at is None or expires_at <= time.monotonic():
+        if not await check_uc.execute(startup_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Startup com id {startup_id} não encontrada",
+            )
+        _known_startups.put(
+            startup_id, time.monotonic() + settings.startup_exists_cache_ttl_seconds
         )
     return startup_id
+
+
+def startup_forgetter(
+    session: AsyncSession = Depends(get_session),
+) -> Callable[[uuid.UUID], None]:
+    """Return a callback that drops a deleted startup from the existence
+    cache once the request's transaction commits.
+
+    Dropping it earlier would let a concurrent check, still seeing the row,
+    cache the id again for a full TTL.
+    """
+
+    def forget(startup_id: uuid.UUID) -> None:
+        event.listen(
+            session.sync_session,
+            "after_commit",
+            lambda _session: _known_startups.pop(startup_id),
+            once=True,
+        )
+
+    return forget
@@ -0,0 +1,22 @@
+from fastapi import Request, status
+from fastapi.responses import JSONResponse
+from sqlalchemy.exc import IntegrityError
+
+from app.repositories.dialect import is_foreign_key_violation
+
+
+async def integrity_error_handler(
+    request: Request, exc: IntegrityError
+) -> JSONResponse:
+    """Answer 404 when a write references a startup deleted meanwhile.
+
+    Nested routes check their startup through a cache, so a startup deleted
+    by a concurrent request or on another worker can pass the check and only
+    fail on the foreign key. Other integrity errors stay server errors.
+    """
+    if not is_foreign_key_violation(exc):
+        raise exc
+    return JSONResponse(
+        status_code=status.HTTP_404_NOT_FOUND,
+        content={"detail": "Startup nao encontrada"},
+    )
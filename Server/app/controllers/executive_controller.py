@@ -1,12 +1,13 @@
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 
 from app.application.executive.create_executive import CreateExecutive
 from app.application.executive.delete_executive import DeleteExecutive
 from app.application.executive.get_executive import GetExecutive
 from app.application.executive.list_executives import ListExecutives
 from app.application.executive.update_executive import UpdateExecutive
+from app.controllers.conditional import conditional
 from app.controllers.dependencies import executive_builder, verify_startup_exists
 from app.domain.models.executive import Executive
 from app.domain.schemas.executive import (
@@ -21,9 +22,14 @@ router = APIRouter(prefix="/startups/{startup_id}/executives", tags=["Executives
 
 @router.get("", response_model=ExecutiveListResponse)
 async def list_executives(
+    request: Request,
+    response: Response,
     startup_id: uuid.UUID = Depends(verify_startup_exists),
     use_case: ListExecutives = Depends(executive_builder(ListExecutives)),
 ):
+    unchanged = conditional(request, response, await use_case.version(startup_id))
+    if unchanged is not None:
+        return unchanged
     items, total = await use_case.execute(startup_id)
     return ExecutiveListResponse(
         items=[ExecutiveResponse.model_validate(e) for e in items],
@@ -45,6 +51,8 @@ async def create_executive(
 @router.get("/{executive_id}", response_model=ExecutiveResponse)
 async def get_executive(
     executive_id: uuid.UUID,
+    request: Request,
+    response: Response,
     startup_id: uuid.UUID = Depends(verify_startup_exists),
     use_case: GetExecutive = Depends(executive_builder(GetExecutive)),
 ):
@@ -54,6 +62,15 @@ async def get_executive(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Executivo com id {executive_id} não encontrado",
         )
+    unchanged = conditional(
+        request,
+        response,
+        executive.id,
+        executive.updated_at,
+        last_modified=executive.updated_at,
+    )
+    if unchanged is not None:
+        return unchanged
     return ExecutiveResponse.model_validate(executive)
 
 
@@ -1,6 +1,25 @@
+import csv
+import io
+import json
+import time
 import uuid
+from collections.abc import AsyncIterator, Iterator
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Any, Literal
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    UploadFile,
+    status,
+)
+from fastapi.concurrency import run_in_threadpool
+from pydantic import ValidationError
 
 from app.application.monthly_indicator.create_monthly_indicator import (
     CreateMonthlyIndicator,
@@ -11,6 +30,9 @@ from app.application.monthly_indicator.create_monthly_indicator_token import (
 from app.application.monthly_indicator.delete_monthly_indicator import (
     DeleteMonthlyIndicator,
 )
+from app.application.monthly_indicator.enqueue_indicator_submission import (
+    EnqueueIndicatorSubmission,
+)
 from app.application.monthly_indicator.get_monthly_indicator import GetMonthlyIndicator
 from app.application.monthly_indicator.get_monthly_indicator_token import (
     GetMonthlyIndicatorToken,
@@ -18,25 +40,53 @@ from app.application.monthly_indicator.get_monthly_indicator_token import (
 from app.application.monthly_indicator.get_public_indicator_form import (
     GetPublicIndicatorForm,
 )
+from app.application.monthly_indicator.import_monthly_indicators import (
+    IMPORT_BATCH_SIZE,
+    ImportMonthlyIndicators,
+)
+from app.application.monthly_indicator.issue_monthly_indicator_tokens import (
+    IssueMonthlyIndicatorTokens,
+)
 from app.application.monthly_indicator.list_monthly_indicator_tokens import (
     ListMonthlyIndicatorTokens,
 )
 from app.application.monthly_indicator.list_monthly_indicators import (
+    MAX_PAGE_SIZE,
     ListMonthlyIndicators,
 )
+from app.application.monthly_indicator.readmodels import PublicFormTarget
+from app.application.monthly_indicator.revoke_monthly_indicator_token import (
+    RevokeMonthlyIndicatorToken,
+)
+from app.application.monthly_indicator.submit_public_indicator import (
+    SubmitPublicIndicator,
+)
 from app.application.monthly_indicator.update_monthly_indicator import (
     UpdateMonthlyIndicator,
 )
+from app.config import settings
+from app.controllers.conditional import conditional
 from app.controllers.dependencies import (
+    indicator_submission_builder,
     monthly_indicator_builder,
-    public_form_builder,
+    monthly_indicator_import_builder,
+    monthly_indicator_write_builder,
+    public_indicator_submit_builder,
     verify_startup_exists,
 )
+from app.controllers.pagination import decode_cursor, encode_cursor
 from app.domain.models.monthly_indicator import MonthlyIndicator
+from app.domain.models.monthly_indicator_token import MonthlyIndicatorToken
 from app.domain.schemas.monthly_indicator import (
     MonthlyIndicatorCreate,
+    MonthlyIndicatorImportResult,
+    MonthlyIndicatorImportRow,
     MonthlyIndicatorListResponse,
+    MonthlyIndicatorMetricsListResponse,
+    MonthlyIndicatorMetricsResponse,
     MonthlyIndicatorResponse,
+    MonthlyIndicatorTokenBatchCreate,
+    MonthlyIndicatorTokenBatchResponse,
     MonthlyIndicatorTokenCreate,
     MonthlyIndicatorTokenListResponse,
     MonthlyIndicatorTokenResponse,
@@ -45,10 +95,26 @@ from app.domain.schemas.monthly_indicator import (
     PublicIndicatorForm,
     PublicIndicatorSubmit,
 )
+from app.infrastructure.form_token_signer import FormTokenClaims, FormTokenSigner
+from app.infrastructure.lru_cache import LruCache
+from app.infrastructure.write_coalescer import indicator_drafts
+from app.repositories.monthly_indicator_repository import VALUE_FIELDS
+
+# Import columns that make a CSV row an indicator rather than a bare startup.
+_INDICATOR_COLUMNS = {"month", "year", *VALUE_FIELDS}
 
 public_router = APIRouter(tags=["Monthly Indicators"])
 router = APIRouter(tags=["Monthly Indicators"])
 
+_form_tokens = FormTokenSigner(settings.secret_key)
+
+# token id -> (expiry on the monotonic clock, resolved target). Founders reload
+# the form repeatedly around deadlines; a hit skips the token and startup
+# lookup, while the existing indicator is always read fresh.
+_public_form_cache: LruCache[uuid.UUID, tuple[float, PublicFormTarget]] = LruCache(
+    settings.public_form_cache_size
+)
+
 
 # --- Public routes (no auth) ---
 
@@ -58,56 +124,127 @@ router = APIRouter(tags=["Monthly Indicators"])
     response_model=PublicIndicatorForm,
 )
 async def public_get_monthly_indicator(
-    token: uuid.UUID,
-    get_token: GetMonthlyIndicatorToken = Depends(
-        monthly_indicator_builder(GetMonthlyIndicatorToken)
-    ),
+    token: str,
     get_form: GetPublicIndicatorForm = Depends(
-        public_form_builder(GetPublicIndicatorForm)
+        monthly_indicator_builder(GetPublicIndicatorForm)
     ),
 ):
-    indicator_token = await get_token.execute(token)
-    if not indicator_token:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Token invalido ou expirado",
-        )
-
-    startup, indicator = await get_form.execute(indicator_token)
-    if not startup:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Startup nao encontrada",
-        )
+    token_id = _verify_form_token(token).token_id
+    target = _cached_form_target(token_id)
+    if target is not None:
+        indicator, draft = await get_form.get_existing(target)
+    else:
+        resolved = await get_form.execute(token_id)
+        if resolved is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Token invalido ou expirado",
+            )
+        target, indicator, draft = resolved
+        _cache_form_target(token_id, target)
 
     existing = None
     if indicator:
         existing = PublicIndicatorData.model_validate(indicator)
 
+    # An autosave still in the buffer is newer than anything stored.
+    draft = indicator_drafts.get(token_id) or draft
+
     return PublicIndicatorForm(
-        startup_name=startup.name,
-        startup_logo_url=startup.logo_url,
-        month=indicator_token.month,
-        year=indicator_token.year,
+        startup_name=target.startup_name,
+        startup_logo_url=target.startup_logo_url,
+        month=target.month,
+        year=target.year,
         existing_indicator=existing,
+        draft=PublicIndicatorData.model_validate(draft) if draft else None,
+    )
+
+
+@public_router.put(
+    "/monthly-indicator/{token}/draft",
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def public_save_indicator_draft(
+    token: str,
+    data: PublicIndicatorSubmit,
+    get_form: GetPublicIndicatorForm = Depends(
+        monthly_indicator_builder(GetPublicIndicatorForm)
+    ),
+):
+    """Autosave the form. Only the latest save per link is kept in memory
+    and written by the periodic draft flush."""
+    token_id = _verify_form_token(token).token_id
+    # Autosaves of a link already checked skip the database; one revoked on
+    # another worker meanwhile is dropped by the flush's token check.
+    target = _cached_form_target(token_id)
+    if target is None:
+        resolved = await get_form.execute(token_id)
+        if resolved is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Token invalido ou expirado",
+            )
+        target = resolved[0]
+        _cache_form_target(token_id, target)
+    buffered = indicator_drafts.put(
+        token_id,
+        {
+            "startup_id": target.startup_id,
+            "month": target.month,
+            "year": target.year,
+            "updated_at": datetime.now(timezone.utc),
+            **data.model_dump(),
+        },
     )
+    if not buffered:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Muitos rascunhos pendentes, tente novamente",
+            headers={
+                "Retry-After": str(settings.indicator_draft_flush_interval_seconds)
+            },
+        )
 
 
 @public_router.post(
     "/monthly-indicator/{token}",
     status_code=status.HTTP_204_NO_CONTENT,
+    responses={status.HTTP_202_ACCEPTED: {"description": "Submission queued"}},
 )
 async def public_create_monthly_indicator(
-    token: uuid.UUID,
+    token: str,
     data: PublicIndicatorSubmit,
     get_token: GetMonthlyIndicatorToken = Depends(
         monthly_indicator_builder(GetMonthlyIndicatorToken)
     ),
-    create: CreateMonthlyIndicator = Depends(
-        monthly_indicator_builder(CreateMonthlyIndicator)
+    submit: SubmitPublicIndicator = Depends(
+        public_indicator_submit_builder(SubmitPublicIndicator)
+    ),
+    enqueue: EnqueueIndicatorSubmission = Depends(
+        indicator_submission_builder(EnqueueIndicatorSubmission)
     ),
 ):
-    indicator_token = await get_token.execute(token)
+    claims = _verify_form_token(token)
+    if settings.queue_public_submissions:
+        # Applied later by the drain job; the request costs one insert.
+        try:
+            queued = await enqueue.execute(
+                claims.token_id, claims.month, claims.year, data.model_dump()
+            )
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e),
+            )
+        if not queued:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Token invalido ou expirado",
+            )
+        indicator_drafts.pop(claims.token_id)
+        return Response(status_code=status.HTTP_202_ACCEPTED)
+
+    indicator_token = await get_token.execute(claims.token_id)
     if not indicator_token:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -121,12 +258,38 @@ async def public_create_monthly_indicator(
         **data.model_dump(),
     )
     try:
-        await create.execute(indicator)
+        await submit.execute(indicator)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         )
+    indicator_drafts.pop(claims.token_id)
+
+
+def _cached_form_target(token_id: uuid.UUID) -> PublicFormTarget | None:
+    cached = _public_form_cache.get(token_id)
+    if cached is None or cached[0] <= time.monotonic():
+        return None
+    return cached[1]
+
+
+def _cache_form_target(token_id: uuid.UUID, target: PublicFormTarget) -> None:
+    _public_form_cache.put(
+        token_id, (time.monotonic() + settings.public_form_cache_ttl_seconds, target)
+    )
+
+
+def _verify_form_token(token: str) -> FormTokenClaims:
+    """Return the claims of a signed form link; bad or expired links are a
+    404 decided without any database work."""
+    claims = _form_tokens.verify(token)
+    if claims is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Token invalido ou expirado",
+        )
+    return claims
 
 
 # --- Protected routes: indicators ---
@@ -134,18 +297,49 @@ async def public_create_monthly_indicator(
 
 @router.get(
     "/startups/{startup_id}/monthly-indicators",
-    response_model=MonthlyIndicatorListResponse,
+    response_model=MonthlyIndicatorListResponse | MonthlyIndicatorMetricsListResponse,
 )
 async def list_indicators(
+    request: Request,
+    response: Response,
+    start: str | None = Query(None, alias="from"),
+    end: str | None = Query(None, alias="to"),
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = Query(None),
+    fields: Literal["all", "metrics"] = Query("all"),
     startup_id: uuid.UUID = Depends(verify_startup_exists),
     use_case: ListMonthlyIndicators = Depends(
         monthly_indicator_builder(ListMonthlyIndicators)
     ),
 ):
-    items, total = await use_case.execute(startup_id)
+    unchanged = conditional(request, response, await use_case.version(startup_id))
+    if unchanged is not None:
+        return unchanged
+    try:
+        items, total, next_key = await use_case.execute(
+            startup_id,
+            start=start,
+            end=end,
+            limit=limit,
+            after=decode_cursor(cursor),
+            metrics_only=fields == "metrics",
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    next_cursor = encode_cursor(next_key) if next_key is not None else None
+    if fields == "metrics":
+        return MonthlyIndicatorMetricsListResponse(
+            items=[MonthlyIndicatorMetricsResponse.model_validate(i) for i in items],
+            total=total,
+            next_cursor=next_cursor,
+        )
     return MonthlyIndicatorListResponse(
         items=[MonthlyIndicatorResponse.model_validate(i) for i in items],
         total=total,
+        next_cursor=next_cursor,
     )
 
 
@@ -158,7 +352,7 @@ async def create_indicator(
     data: MonthlyIndicatorCreate,
     startup_id: uuid.UUID = Depends(verify_startup_exists),
     use_case: CreateMonthlyIndicator = Depends(
-        monthly_indicator_builder(CreateMonthlyIndicator)
+        monthly_indicator_write_builder(CreateMonthlyIndicator)
     ),
 ):
     indicator = MonthlyIndicator(startup_id=startup_id, **data.model_dump())
@@ -178,6 +372,8 @@ async def create_indicator(
 )
 async def get_indicator(
     indicator_id: uuid.UUID,
+    request: Request,
+    response: Response,
     startup_id: uuid.UUID = Depends(verify_startup_exists),
     use_case: GetMonthlyIndicator = Depends(
         monthly_indicator_builder(GetMonthlyIndicator)
@@ -189,6 +385,15 @@ async def get_indicator(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Indicador com id {indicator_id} não encontrado",
         )
+    unchanged = conditional(
+        request,
+        response,
+        indicator.id,
+        indicator.updated_at,
+        last_modified=indicator.updated_at,
+    )
+    if unchanged is not None:
+        return unchanged
     return MonthlyIndicatorResponse.model_validate(indicator)
 
 
@@ -204,7 +409,7 @@ async def update_indicator(
         monthly_indicator_builder(GetMonthlyIndicator)
     ),
     update_uc: UpdateMonthlyIndicator = Depends(
-        monthly_indicator_builder(UpdateMonthlyIndicator)
+        monthly_indicator_write_builder(UpdateMonthlyIndicator)
     ),
 ):
     indicator = await get_uc.execute(indicator_id)
@@ -236,7 +441,7 @@ async def delete_indicator(
         monthly_indicator_builder(GetMonthlyIndicator)
     ),
     delete_uc: DeleteMonthlyIndicator = Depends(
-        monthly_indicator_builder(DeleteMonthlyIndicator)
+        monthly_indicator_write_builder(DeleteMonthlyIndicator)
     ),
 ):
     indicator = await get_uc.execute(indicator_id)
@@ -248,6 +453,101 @@ async def delete_indicator(
     await delete_uc.execute(indicator)
 
 
+# --- Protected routes: bulk import ---
+
+
+@router.post(
+    "/monthly-indicators/import",
+    response_model=MonthlyIndicatorImportResult,
+)
+async def import_indicators(
+    file: UploadFile,
+    import_format: Literal["csv", "ndjson"] = Query("csv", alias="format"),
+    use_case: ImportMonthlyIndicators = Depends(
+        monthly_indicator_import_builder(ImportMonthlyIndicators)
+    ),
+):
+    # The upload is spooled to disk; it is decoded and parsed lazily in a
+    # worker thread, one chunk at a time, so the event loop never blocks and
+    # the file is never held in memory whole.
+    text = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    parse = _csv_records if import_format == "csv" else _ndjson_records
+    try:
+        imported = await use_case.execute(_in_threadpool(parse(text)))
+    except _MissingPeriodError as e:
+        # Raising rolls back the batches already written.
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail=str(e),
+        )
+    except UnicodeDecodeError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="O arquivo deve estar em UTF-8",
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    finally:
+        # Leave closing the upload to FastAPI.
+        text.detach()
+    return MonthlyIndicatorImportResult(imported=imported)
+
+
+class _MissingPeriodError(ValueError):
+    pass
+
+
+async def _in_threadpool(records: Iterator[dict[str, Any]]) -> AsyncIterator[dict]:
+    while chunk := await run_in_threadpool(list, islice(records, IMPORT_BATCH_SIZE)):
+        for record in chunk:
+            yield record
+
+
+def _csv_records(text: io.TextIOBase) -> Iterator[dict[str, Any]]:
+    reader = csv.DictReader(text)
+    for record in reader:
+        values = {
+            key: value
+            for key, value in record.items()
+            if key is not None and value not in ("", None)
+        }
+        if "month" not in values or "year" not in values:
+            # Rows of the portfolio export for startups without indicators
+            # carry no period and no values; anything else is an error.
+            if values.keys() & _INDICATOR_COLUMNS:
+                raise _MissingPeriodError(
+                    f"Linha {reader.line_num}: mes e ano sao obrigatorios"
+                )
+            continue
+        yield _validate_record(reader.line_num, values)
+
+
+def _ndjson_records(text: io.TextIOBase) -> Iterator[dict[str, Any]]:
+    for line_number, line in enumerate(text, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            record = None
+        if not isinstance(record, dict):
+            raise ValueError(f"Linha {line_number}: objeto JSON invalido")
+        yield _validate_record(line_number, record)
+
+
+def _validate_record(line_number: int, record: dict[str, Any]) -> dict[str, Any]:
+    try:
+        row = MonthlyIndicatorImportRow.model_validate(record)
+    except ValidationError as e:
+        error = e.errors()[0]
+        field = ".".join(str(part) for part in error["loc"])
+        raise ValueError(f"Linha {line_number}: {field}: {error['msg']}") from None
+    return row.model_dump()
+
+
 # --- Protected routes: tokens ---
 
 
@@ -270,7 +570,7 @@ async def create_monthly_indicator_token(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         )
-    return MonthlyIndicatorTokenResponse.model_validate(token)
+    return token_response(token)
 
 
 @router.get(
@@ -278,13 +578,87 @@ async def create_monthly_indicator_token(
     response_model=MonthlyIndicatorTokenListResponse,
 )
 async def list_monthly_indicator_tokens(
+    request: Request,
+    response: Response,
     startup_id: uuid.UUID = Depends(verify_startup_exists),
     list_uc: ListMonthlyIndicatorTokens = Depends(
         monthly_indicator_builder(ListMonthlyIndicatorTokens)
     ),
 ):
+    unchanged = conditional(request, response, await list_uc.version(startup_id))
+    if unchanged is not None:
+        return unchanged
     items, total = await list_uc.execute(startup_id)
     return MonthlyIndicatorTokenListResponse(
-        items=[MonthlyIndicatorTokenResponse.model_validate(t) for t in items],
+        items=[token_response(t) for t in items],
         total=total,
     )
+
+
+@router.delete(
+    "/startups/{startup_id}/monthly-indicator-tokens/{token_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+async def revoke_monthly_indicator_token(
+    token_id: uuid.UUID,
+    startup_id: uuid.UUID = Depends(verify_startup_exists),
+    revoke: RevokeMonthlyIndicatorToken = Depends(
+        monthly_indicator_builder(RevokeMonthlyIndicatorToken)
+    ),
+):
+    token = await revoke.execute(startup_id, token_id)
+    if token is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Token com id {token_id} não encontrado",
+        )
+    # Other workers may still render the form until their entry expires;
+    # submissions check the token row and are refused right away.
+    _public_form_cache.pop(token)
+
+
+@router.post(
+    "/monthly-indicator-tokens/batch",
+    response_model=MonthlyIndicatorTokenBatchResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def issue_monthly_indicator_tokens(
+    data: MonthlyIndicatorTokenBatchCreate,
+    issue: IssueMonthlyIndicatorTokens = Depends(
+        monthly_indicator_builder(IssueMonthlyIndicatorTokens)
+    ),
+):
+    try:
+        created, skipped = await issue.execute(
+            data.month, data.year, data.startup_ids, data.statuses
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    return MonthlyIndicatorTokenBatchResponse(
+        items=[token_response(t) for t in created],
+        skipped=skipped,
+    )
+
+
+def token_response(token: MonthlyIndicatorToken) -> MonthlyIndicatorTokenResponse:
+    link = _form_tokens.sign(
+        FormTokenClaims(
+            token_id=token.token,
+            startup_id=token.startup_id,
+            month=token.month,
+            year=token.year,
+            expires_at=token.expires_at,
+        )
+    )
+    return MonthlyIndicatorTokenResponse(
+        id=token.id,
+        token=link,
+        startup_id=token.startup_id,
+        month=token.month,
+        year=token.year,
+        created_at=token.created_at,
+        expires_at=token.expires_at,
+    )
@@ -0,0 +1,26 @@
+import base64
+import json
+
+from fastapi import HTTPException, status
+
+
+def encode_cursor(key: list) -> str:
+    """Serialize a keyset position into an opaque, URL-safe cursor."""
+    raw = json.dumps(key, separators=(",", ":"), default=str).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str | None) -> list | None:
+    if cursor is None:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        key = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except ValueError:
+        key = None
+    if not isinstance(key, list):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cursor invalido",
+        )
+    return key
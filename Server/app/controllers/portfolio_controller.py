@@ -1,30 +1,311 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+import csv
+import io
+import json
+import uuid
+from collections.abc import AsyncIterator
+from dataclasses import asdict
+from typing import Any, Literal
 
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+
+from app.application.portfolio.export_portfolio import (
+    INDICATOR_FIELDS,
+    STARTUP_FIELDS,
+    ExportPortfolio,
+)
+from app.application.portfolio.get_portfolio_analytics import GetPortfolioAnalytics
+from app.application.portfolio.get_portfolio_cohorts import GetPortfolioCohorts
 from app.application.portfolio.get_portfolio_summary import GetPortfolioSummary
-from app.controllers.dependencies import portfolio_builder
+from app.application.portfolio.get_portfolio_timeseries import (
+    GetPortfolioTimeseries,
+)
+from app.application.portfolio.get_reporting_compliance import (
+    GetReportingCompliance,
+)
+from app.application.portfolio.list_portfolio_startups import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    ListPortfolioStartups,
+    SortField,
+    SortOrder,
+)
+from app.application.portfolio.readmodels import (
+    PortfolioSummary as PortfolioSummaryReadModel,
+)
+from app.config import settings
+from app.controllers.conditional import conditional, etag_headers, not_modified
+from app.controllers.dependencies import portfolio_builder, portfolio_read_builder
+from app.controllers.pagination import decode_cursor, encode_cursor
+from app.domain.schemas.common import CursorPage
 from app.domain.schemas.portfolio import (
     HealthDistribution,
+    PeriodAggregate,
+    PortfolioAnalytics,
+    PortfolioCohorts,
     PortfolioSummary,
+    PortfolioTimeseries,
+    ReportingCompliance,
     StartupSummary,
 )
 from app.domain.schemas.startup import StartupResponse
+from app.infrastructure.lru_cache import LruCache
 
 router = APIRouter(prefix="/portfolio", tags=["Portfolio"])
 
+# (month, year) -> (snapshot version, serialized body). Entries are only
+# served while the period snapshot keeps the same version, so writes made
+# through any worker invalidate them.
+_summary_cache: LruCache[tuple[int, int], tuple[uuid.UUID, bytes]] = LruCache(
+    settings.portfolio_summary_cache_size
+)
+
+# Encoded records are flushed to the client in chunks of about this size.
+_EXPORT_CHUNK_SIZE = 64 * 1024
+
 
 @router.get("/summary", response_model=PortfolioSummary)
 async def get_portfolio_summary(
+    request: Request,
     month: int | None = Query(None, ge=1, le=12),
     year: int | None = Query(None, ge=1),
     use_case: GetPortfolioSummary = Depends(portfolio_builder(GetPortfolioSummary)),
 ):
     try:
-        summary = await use_case.execute(month=month, year=year)
+        snapshot = await use_case.get_snapshot(month=month, year=year)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+    headers = etag_headers(snapshot.month, snapshot.year, snapshot.version)
+    unchanged = not_modified(request, headers)
+    if unchanged is not None:
+        return unchanged
+
+    key = (snapshot.month, snapshot.year)
+    cached = _summary_cache.get(key)
+    if cached is not None and cached[0] == snapshot.version:
+        body = cached[1]
+    else:
+        summary = await use_case.build_summary(snapshot)
+        body = _to_response(summary).model_dump_json().encode()
+        _summary_cache.put(key, (snapshot.version, body))
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@router.get("/startups", response_model=CursorPage[StartupSummary])
+async def list_portfolio_startups(
+    request: Request,
+    response: Response,
+    month: int | None = Query(None, ge=1, le=12),
+    year: int | None = Query(None, ge=1),
+    sort: SortField = Query("name"),
+    order: SortOrder = Query("asc"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = Query(None),
+    use_case: ListPortfolioStartups = Depends(
+        portfolio_read_builder(ListPortfolioStartups)
+    ),
+):
+    unchanged = conditional(request, response, await use_case.version())
+    if unchanged is not None:
+        return unchanged
+    try:
+        items, next_key = await use_case.execute(
+            month=month,
+            year=year,
+            sort=sort,
+            order=order,
+            limit=limit,
+            after=decode_cursor(cursor),
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    return CursorPage[StartupSummary](
+        items=[
+            StartupSummary(
+                startup=StartupResponse.model_validate(item.startup),
+                total_revenue=item.total_revenue,
+                cash_balance=item.cash_balance,
+                ebitda_burn=item.ebitda_burn,
+                headcount=item.headcount,
+            )
+            for item in items
+        ],
+        next_cursor=encode_cursor(next_key) if next_key is not None else None,
+    )
+
+
+@router.get("/timeseries", response_model=PortfolioTimeseries)
+async def get_portfolio_timeseries(
+    request: Request,
+    response: Response,
+    start: str | None = Query(None, alias="from"),
+    end: str | None = Query(None, alias="to"),
+    use_case: GetPortfolioTimeseries = Depends(
+        portfolio_read_builder(GetPortfolioTimeseries)
+    ),
+):
+    unchanged = conditional(request, response, await use_case.version())
+    if unchanged is not None:
+        return unchanged
+    try:
+        points = await use_case.execute(start=start, end=end)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    return PortfolioTimeseries(
+        points=[
+            PeriodAggregate(
+                month=p.month,
+                year=p.year,
+                revenue=p.revenue,
+                cash_balance=p.cash_balance,
+                ebitda_burn=p.ebitda_burn,
+                headcount=p.headcount,
+                reported=p.reported,
+                monthly_report_pct=p.monthly_report_pct,
+            )
+            for p in points
+        ]
+    )
+
+
+@router.get("/analytics", response_model=PortfolioAnalytics)
+async def get_portfolio_analytics(
+    request: Request,
+    response: Response,
+    month: int | None = Query(None, ge=1, le=12),
+    year: int | None = Query(None, ge=1),
+    use_case: GetPortfolioAnalytics = Depends(
+        portfolio_read_builder(GetPortfolioAnalytics)
+    ),
+):
+    unchanged = conditional(request, response, await use_case.version())
+    if unchanged is not None:
+        return unchanged
+    try:
+        result = await use_case.execute(month=month, year=year)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    return PortfolioAnalytics.model_validate(asdict(result))
+
+
+@router.get("/cohorts", response_model=PortfolioCohorts)
+async def get_portfolio_cohorts(
+    request: Request,
+    response: Response,
+    start: str | None = Query(None, alias="from"),
+    end: str | None = Query(None, alias="to"),
+    use_case: GetPortfolioCohorts = Depends(
+        portfolio_read_builder(GetPortfolioCohorts)
+    ),
+):
+    unchanged = conditional(request, response, await use_case.version())
+    if unchanged is not None:
+        return unchanged
+    try:
+        cohorts = await use_case.execute(start=start, end=end)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    return PortfolioCohorts.model_validate(
+        {"cohorts": [asdict(series) for series in cohorts]}
+    )
+
+
+@router.get("/compliance", response_model=ReportingCompliance)
+async def get_reporting_compliance(
+    request: Request,
+    response: Response,
+    start: str | None = Query(None, alias="from"),
+    end: str | None = Query(None, alias="to"),
+    missing_only: bool = Query(False),
+    use_case: GetReportingCompliance = Depends(
+        portfolio_read_builder(GetReportingCompliance)
+    ),
+):
+    unchanged = conditional(request, response, await use_case.version())
+    if unchanged is not None:
+        return unchanged
+    try:
+        result = await use_case.execute(start=start, end=end, missing_only=missing_only)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         )
+    return ReportingCompliance.model_validate(asdict(result))
+
+
+@router.get("/export")
+async def export_portfolio(
+    export_format: Literal["csv", "ndjson"] = Query("csv", alias="format"),
+    include_board_meetings: bool = Query(False),
+    use_case: ExportPortfolio = Depends(portfolio_read_builder(ExportPortfolio)),
+):
+    if export_format == "csv":
+        if include_board_meetings:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Reunioes de conselho so podem ser exportadas em NDJSON",
+            )
+        body = _csv_chunks(use_case.rows(), STARTUP_FIELDS + INDICATOR_FIELDS)
+        media_type = "text/csv"
+    else:
+        body = _ndjson_chunks(use_case.documents(include_board_meetings))
+        media_type = "application/x-ndjson"
+    filename = f"portfolio-export.{export_format}"
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+async def _csv_chunks(
+    records: AsyncIterator[dict[str, Any]], columns: tuple[str, ...]
+) -> AsyncIterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    async for record in records:
+        writer.writerow([record[column] for column in columns])
+        if buffer.tell() >= _EXPORT_CHUNK_SIZE:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+async def _ndjson_chunks(
+    records: AsyncIterator[dict[str, Any]],
+) -> AsyncIterator[str]:
+    lines: list[str] = []
+    size = 0
+    async for record in records:
+        line = json.dumps(record, default=str, ensure_ascii=False) + "\n"
+        lines.append(line)
+        size += len(line)
+        if size >= _EXPORT_CHUNK_SIZE:
+            yield "".join(lines)
+            lines, size = [], 0
+    yield "".join(lines)
+
+
+def _to_response(summary: PortfolioSummaryReadModel) -> PortfolioSummary:
     return PortfolioSummary(
         total_startups=summary.total_startups,
         revenue=summary.revenue,
@@ -37,14 +318,4 @@ async def get_portfolio_summary(
         ),
         monthly_report_pct=summary.monthly_report_pct,
         routines_up_to_date_pct=summary.routines_up_to_date_pct,
-        startups=[
-            StartupSummary(
-                startup=StartupResponse.model_validate(item.startup),
-                total_revenue=item.total_revenue,
-                cash_balance=item.cash_balance,
-                ebitda_burn=item.ebitda_burn,
-                headcount=item.headcount,
-            )
-            for item in summary.startups
-        ],
     )
@@ -0,0 +1,37 @@
+from dataclasses import asdict
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from app.application.search.search_portfolio import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    SearchPortfolio,
+)
+from app.controllers.dependencies import search_builder
+from app.controllers.pagination import decode_cursor, encode_cursor
+from app.domain.schemas.common import CursorPage
+from app.domain.schemas.search import SearchResult
+
+router = APIRouter(prefix="/search", tags=["Search"])
+
+
+@router.get("", response_model=CursorPage[SearchResult])
+async def search(
+    q: str = Query(..., max_length=200),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = Query(None),
+    use_case: SearchPortfolio = Depends(search_builder(SearchPortfolio)),
+):
+    try:
+        items, next_key = await use_case.execute(
+            q, limit=limit, after=decode_cursor(cursor)
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    return CursorPage[SearchResult](
+        items=[SearchResult.model_validate(asdict(item)) for item in items],
+        next_cursor=encode_cursor(next_key) if next_key is not None else None,
+    )
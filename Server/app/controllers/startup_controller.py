@@ -1,38 +1,93 @@
 import uuid
+from collections.abc import Callable
+from dataclasses import asdict
+from datetime import date
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 
 from app.application.startup.create_startup import CreateStartup
 from app.application.startup.delete_startup import DeleteStartup
 from app.application.startup.get_startup import GetStartup
-from app.application.startup.list_startups import ListStartups
+from app.application.startup.get_startup_overview import (
+    DEFAULT_INDICATORS,
+    DEFAULT_MEETINGS,
+    MAX_ITEMS,
+    GetStartupOverview,
+)
+from app.application.startup.list_startups import MAX_PAGE_SIZE, ListStartups
 from app.application.startup.update_startup import UpdateStartup
-from app.controllers.dependencies import startup_builder
-from app.domain.models.startup import Startup
+from app.config import settings
+from app.controllers.conditional import conditional
+from app.controllers.dependencies import (
+    startup_builder,
+    startup_forgetter,
+    startup_overview_builder,
+    startup_write_builder,
+)
+from app.controllers.monthly_indicator_controller import token_response
+from app.controllers.pagination import decode_cursor, encode_cursor
+from app.domain.models.startup import Startup, StartupStatus
+from app.domain.schemas.board_meeting import BoardMeetingResponse
+from app.domain.schemas.executive import ExecutiveResponse
+from app.domain.schemas.monthly_indicator import MonthlyIndicatorResponse
 from app.domain.schemas.startup import (
     StartupCreate,
+    StartupFacets,
     StartupListResponse,
+    StartupOverviewResponse,
     StartupResponse,
     StartupUpdate,
 )
+from app.repositories.startup_repository import StartupFilters
 
 router = APIRouter(prefix="/startups", tags=["Startups"])
 
 
 @router.get("", response_model=StartupListResponse)
 async def list_startups(
+    request: Request,
+    response: Response,
+    statuses: list[StartupStatus] = Query([], alias="status"),
+    sectors: list[str] = Query([], alias="sector"),
+    invested_from: date | None = Query(None),
+    invested_to: date | None = Query(None),
+    q: str | None = Query(None, max_length=255),
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = Query(None),
     use_case: ListStartups = Depends(startup_builder(ListStartups)),
 ):
-    items, total = await use_case.execute()
+    unchanged = conditional(request, response, await use_case.version())
+    if unchanged is not None:
+        return unchanged
+    filters = StartupFilters(
+        statuses=tuple(statuses),
+        sectors=tuple(sectors),
+        invested_from=invested_from,
+        invested_to=invested_to,
+        name_prefix=q,
+    )
+    try:
+        items, total, facets, next_key = await use_case.execute(
+            filters, limit=limit, after=decode_cursor(cursor)
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
     return StartupListResponse(
         items=[StartupResponse.model_validate(s) for s in items],
         total=total,
+        facets=StartupFacets.model_validate(asdict(facets)),
+        next_cursor=encode_cursor(next_key) if next_key is not None else None,
     )
 
 
 @router.get("/{startup_id}", response_model=StartupResponse)
 async def get_startup(
     startup_id: uuid.UUID,
+    request: Request,
+    response: Response,
     use_case: GetStartup = Depends(startup_builder(GetStartup)),
 ):
     startup = await use_case.execute(startup_id)
@@ -41,13 +96,51 @@ async def get_startup(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Startup com id {startup_id} não encontrada",
         )
+    unchanged = conditional(
+        request,
+        response,
+        startup.id,
+        startup.updated_at,
+        last_modified=startup.updated_at,
+    )
+    if unchanged is not None:
+        return unchanged
     return StartupResponse.model_validate(startup)
 
 
+@router.get("/{startup_id}/overview", response_model=StartupOverviewResponse)
+async def get_startup_overview(
+    startup_id: uuid.UUID,
+    indicators: int = Query(DEFAULT_INDICATORS, ge=1, le=MAX_ITEMS),
+    meetings: int = Query(DEFAULT_MEETINGS, ge=1, le=MAX_ITEMS),
+    use_case: GetStartupOverview = Depends(
+        startup_overview_builder(GetStartupOverview)
+    ),
+):
+    overview = await use_case.execute(startup_id, indicators, meetings)
+    if overview is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Startup com id {startup_id} não encontrada",
+        )
+    startup = overview.startup
+    return StartupOverviewResponse(
+        startup=StartupResponse.model_validate(startup),
+        indicators=[
+            MonthlyIndicatorResponse.model_validate(i) for i in overview.indicators
+        ],
+        board_meetings=[
+            BoardMeetingResponse.model_validate(m) for m in overview.board_meetings
+        ],
+        executives=[ExecutiveResponse.model_validate(e) for e in startup.executives],
+        tokens=[token_response(t) for t in startup.monthly_indicator_tokens],
+    )
+
+
 @router.post("", response_model=StartupResponse, status_code=status.HTTP_201_CREATED)
 async def create_startup(
     data: StartupCreate,
-    use_case: CreateStartup = Depends(startup_builder(CreateStartup)),
+    use_case: CreateStartup = Depends(startup_write_builder(CreateStartup)),
 ):
     startup = Startup(**data.model_dump())
     created = await use_case.execute(startup)
@@ -59,7 +152,7 @@ async def update_startup(
     startup_id: uuid.UUID,
     data: StartupUpdate,
     get_uc: GetStartup = Depends(startup_builder(GetStartup)),
-    update_uc: UpdateStartup = Depends(startup_builder(UpdateStartup)),
+    update_uc: UpdateStartup = Depends(startup_write_builder(UpdateStartup)),
 ):
     startup = await get_uc.execute(startup_id)
     if not startup:
@@ -75,7 +168,8 @@ async def update_startup(
 async def delete_startup(
     startup_id: uuid.UUID,
     get_uc: GetStartup = Depends(startup_builder(GetStartup)),
-    delete_uc: DeleteStartup = Depends(startup_builder(DeleteStartup)),
+    delete_uc: DeleteStartup = Depends(startup_write_builder(DeleteStartup)),
+    forget_startup: Callable[[uuid.UUID], None] = Depends(startup_forgetter),
 ):
     startup = await get_uc.execute(startup_id)
     if not startup:
@@ -83,4 +177,5 @@ async def delete_startup(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Startup com id {startup_id} não encontrada",
         )
-    await delete_uc.execute(startup)
+    await delete_uc.execute(startup, purge_later=settings.soft_delete_startups)
+    forget_startup(startup_id)
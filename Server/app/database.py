@@ -1,4 +1,5 @@
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
 from app.config import settings
 
 engine = create_async_engine(
@@ -10,6 +10,16 @@ from app.domain.models.monthly_indicator import MonthlyIndicator  # noqa: E402,
 from app.domain.models.board_meeting import BoardMeeting  # noqa: E402, F401
 from app.domain.models.executive import Executive  # noqa: E402, F401
 from app.domain.models.deal import Deal  # noqa: E402, F401
-from app.domain.models.monthly_indicator_token import MonthlyIndicatorToken  # noqa: E402, F401
+from app.domain.models.monthly_indicator_token import (  # noqa: E402, F401
+    MonthlyIndicatorToken,
+    MonthlyIndicatorTokenRun,
+)
 from app.domain.models.user import User  # noqa: E402, F401
 from app.domain.models.user_invite import UserInvite  # noqa: E402, F401
+from app.domain.models.portfolio_period_snapshot import (  # noqa: E402, F401
+    PortfolioPeriodSnapshot,
+    PortfolioSnapshotGeneration,
+)
+from app.domain.models.indicator_submission import IndicatorSubmission  # noqa: E402, F401
+from app.domain.models.indicator_draft import IndicatorDraft  # noqa: E402, F401
+from app.domain.models.search_index import SEARCH_COLUMNS  # noqa: E402, F401
@@ -0,0 +1,38 @@
+import uuid
+from datetime import datetime
+from decimal import Decimal
+
+from sqlalchemy import DateTime, ForeignKey, Integer, Numeric, SmallInteger, Text, func
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.domain.models import Base
+
+
+class IndicatorDraft(Base):
+    """Unsubmitted public form values for a startup and period."""
+
+    __tablename__ = "indicator_drafts"
+
+    startup_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("startups.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    month: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+    year: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+    total_revenue: Mapped[Decimal | None] = mapped_column(Numeric(15, 2), nullable=True)
+    recurring_revenue_pct: Mapped[Decimal | None] = mapped_column(
+        Numeric(7, 2), nullable=True
+    )
+    gross_margin_pct: Mapped[Decimal | None] = mapped_column(
+        Numeric(7, 2), nullable=True
+    )
+    cash_balance: Mapped[Decimal | None] = mapped_column(Numeric(15, 2), nullable=True)
+    headcount: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    ebitda_burn: Mapped[Decimal | None] = mapped_column(Numeric(15, 2), nullable=True)
+    achievements: Mapped[str | None] = mapped_column(Text, nullable=True)
+    challenges: Mapped[str | None] = mapped_column(Text, nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
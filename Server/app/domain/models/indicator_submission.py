@@ -0,0 +1,58 @@
+import uuid
+from datetime import datetime
+from decimal import Decimal
+
+from sqlalchemy import (
+    BigInteger,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    SmallInteger,
+    Text,
+    func,
+)
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.domain.models import Base
+
+
+class IndicatorSubmission(Base):
+    """A public form submission waiting to be applied to monthly_indicators.
+
+    Rows are appended by the public route and consumed in submission order,
+    so the latest submission for a period wins.
+    """
+
+    __tablename__ = "indicator_submissions"
+    __table_args__ = (
+        Index("ix_indicator_submissions_submitted_at", "submitted_at", "id"),
+    )
+
+    id: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"), primary_key=True
+    )
+    startup_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("startups.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    month: Mapped[int] = mapped_column(SmallInteger, nullable=False)
+    year: Mapped[int] = mapped_column(SmallInteger, nullable=False)
+    total_revenue: Mapped[Decimal | None] = mapped_column(Numeric(15, 2), nullable=True)
+    recurring_revenue_pct: Mapped[Decimal | None] = mapped_column(
+        Numeric(7, 2), nullable=True
+    )
+    gross_margin_pct: Mapped[Decimal | None] = mapped_column(
+        Numeric(7, 2), nullable=True
+    )
+    cash_balance: Mapped[Decimal | None] = mapped_column(Numeric(15, 2), nullable=True)
+    headcount: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    ebitda_burn: Mapped[Decimal | None] = mapped_column(Numeric(15, 2), nullable=True)
+    achievements: Mapped[str | None] = mapped_column(Text, nullable=True)
+    challenges: Mapped[str | None] = mapped_column(Text, nullable=True)
+    submitted_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING
 from sqlalchemy import (
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     SmallInteger,
@@ -30,6 +31,7 @@ class MonthlyIndicator(Base):
         UniqueConstraint(
             "startup_id", "month", "year", name="uq_indicator_startup_month_year"
         ),
+        Index("ix_monthly_indicators_year_month", "year", "month"),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
@@ -4,7 +4,7 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, ForeignKey, SmallInteger, UniqueConstraint, func
+from sqlalchemy import DateTime, ForeignKey, Index, SmallInteger, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -16,12 +16,24 @@ if TYPE_CHECKING:
 
 class MonthlyIndicatorToken(Base):
     __tablename__ = "monthly_indicator_tokens"
+    # Only live (unrevoked) tokens are indexed: revoked rows wait for the
+    # sweeper outside the indexes, and a revoked period can be issued again.
     __table_args__ = (
-        UniqueConstraint(
+        Index(
+            "uq_monthly_indicator_token_live_token",
+            "token",
+            unique=True,
+            postgresql_where=text("revoked_at IS NULL"),
+            sqlite_where=text("revoked_at IS NULL"),
+        ),
+        Index(
+            "uq_monthly_indicator_token_live_period",
             "startup_id",
             "month",
             "year",
-            name="uq_monthly_indicator_token_startup_month_year",
+            unique=True,
+            postgresql_where=text("revoked_at IS NULL"),
+            sqlite_where=text("revoked_at IS NULL"),
         ),
     )
 
@@ -29,7 +41,7 @@ class MonthlyIndicatorToken(Base):
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
     )
     token: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), nullable=False, default=uuid.uuid4, unique=True
+        UUID(as_uuid=True), nullable=False, default=uuid.uuid4
     )
     startup_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -41,7 +53,29 @@ class MonthlyIndicatorToken(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+    revoked_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
 
     startup: Mapped["Startup"] = relationship(
         "Startup", back_populates="monthly_indicator_tokens"
     )
+
+
+class MonthlyIndicatorTokenRun(Base):
+    """A period whose tokens the monthly job has issued.
+
+    Claimed in the issuing transaction, so however many workers or restarts
+    run the job a period is issued once.
+    """
+
+    __tablename__ = "monthly_indicator_token_runs"
+
+    month: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+    year: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+    issued_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
@@ -0,0 +1,52 @@
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+
+from sqlalchemy import BigInteger, Date, DateTime, Integer, Numeric, SmallInteger, func
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.domain.models import Base
+
+
+class PortfolioPeriodSnapshot(Base):
+    """Precomputed portfolio summary aggregates for one (month, year)."""
+
+    __tablename__ = "portfolio_period_snapshots"
+
+    month: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+    year: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+    reference_date: Mapped[date] = mapped_column(Date, nullable=False)
+    total_startups: Mapped[int] = mapped_column(Integer, nullable=False)
+    healthy: Mapped[int] = mapped_column(Integer, nullable=False)
+    warning: Mapped[int] = mapped_column(Integer, nullable=False)
+    critical: Mapped[int] = mapped_column(Integer, nullable=False)
+    revenue: Mapped[Decimal] = mapped_column(Numeric(18, 2), nullable=False)
+    previous_revenue: Mapped[Decimal] = mapped_column(Numeric(18, 2), nullable=False)
+    reported: Mapped[int] = mapped_column(Integer, nullable=False)
+    with_recent_meetings: Mapped[int] = mapped_column(Integer, nullable=False)
+    # Generation of the period when the aggregates were read; the snapshot is
+    # stale once the period's current generation moves past it.
+    generation: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=0, server_default="0"
+    )
+    version: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), nullable=False, default=uuid.uuid4
+    )
+    computed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+
+class PortfolioSnapshotGeneration(Base):
+    """Invalidation counter of one (month, year), bumped by every write.
+
+    The row for month 0, year 0 counts portfolio-wide invalidations; a
+    period's generation is its own counter plus that one.
+    """
+
+    __tablename__ = "portfolio_snapshot_generations"
+
+    month: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+    year: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+    generation: Mapped[int] = mapped_column(BigInteger, nullable=False)
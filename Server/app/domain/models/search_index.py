@@ -0,0 +1,70 @@
+"""Full-text search documents and their PostgreSQL indexes.
+
+Each searchable model gets a text document built from some of its columns.
+PostgreSQL indexes ``to_tsvector`` of that document with GIN for ranked
+word search, and the document itself with pg_trgm for substring matches.
+Queries must rebuild the exact same expressions to use the indexes, so the
+constants are rendered inline rather than as bind parameters.
+"""
+
+from sqlalchemy import ColumnElement, Index, func, literal_column
+
+from app.domain.models.board_meeting import BoardMeeting
+from app.domain.models.deal import Deal
+from app.domain.models.monthly_indicator import MonthlyIndicator
+from app.domain.models.startup import Startup
+
+SEARCH_CONFIG = literal_column("'portuguese'::regconfig")
+
+SEARCH_COLUMNS: dict[str, tuple[type, tuple[ColumnElement[str | None], ...]]] = {
+    "startup": (Startup, (Startup.name, Startup.notes)),
+    "board_meeting": (
+        BoardMeeting,
+        (BoardMeeting.summary, BoardMeeting.attention_points, BoardMeeting.next_steps),
+    ),
+    "monthly_indicator": (
+        MonthlyIndicator,
+        (
+            MonthlyIndicator.achievements,
+            MonthlyIndicator.challenges,
+            MonthlyIndicator.comments,
+        ),
+    ),
+    "deal": (Deal, (Deal.company, Deal.founders, Deal.notes)),
+}
+
+
+def search_document(
+    columns: tuple[ColumnElement[str | None], ...],
+) -> ColumnElement[str]:
+    """The columns joined by spaces, nulls as empty strings (IMMUTABLE)."""
+    parts = [func.coalesce(column, literal_column("''")) for column in columns]
+    document = parts[0]
+    for part in parts[1:]:
+        document = document.op("||")(literal_column("' '")).op("||")(part)
+    return document
+
+
+def search_vector(document: ColumnElement[str]) -> ColumnElement:
+    return func.to_tsvector(SEARCH_CONFIG, document)
+
+
+for _model, _columns in SEARCH_COLUMNS.values():
+    # The inline constants hide the table from Index, so attach explicitly.
+    _table = _model.__table__
+    _document = search_document(_columns)
+    _table.append_constraint(
+        Index(
+            f"ix_{_table.name}_search_vector",
+            search_vector(_document),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql")
+    )
+    _table.append_constraint(
+        Index(
+            f"ix_{_table.name}_search_trgm",
+            _document.label("search_document"),
+            postgresql_using="gin",
+            postgresql_ops={"search_document": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql")
+    )
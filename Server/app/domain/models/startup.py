@@ -5,7 +5,7 @@ import uuid
 from datetime import date, datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Date, DateTime, Enum, String, Text, func
+from sqlalchemy import Date, DateTime, Enum, Index, String, Text, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -26,6 +26,20 @@ class StartupStatus(str, enum.Enum):
 
 class Startup(Base):
     __tablename__ = "startups"
+    __table_args__ = (
+        # List filters, each ending in the (name, id) keyset order.
+        Index("ix_startups_name_id", "name", "id"),
+        Index("ix_startups_status_name_id", "status", "name", "id"),
+        Index("ix_startups_sector_name_id", "sector", "name", "id"),
+        Index("ix_startups_investment_date", "investment_date"),
+        # Only soft-deleted startups, which wait here for the purge job.
+        Index(
+            "ix_startups_deleted_at",
+            "deleted_at",
+            postgresql_where=text("deleted_at IS NOT NULL"),
+            sqlite_where=text("deleted_at IS NOT NULL"),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
@@ -47,16 +61,45 @@ class Startup(Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
+    deleted_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
 
+    # The foreign keys cascade on delete, so deleting a startup leaves its
+    # history to the database instead of loading it into the session.
     monthly_indicators: Mapped[list["MonthlyIndicator"]] = relationship(
-        "MonthlyIndicator", back_populates="startup", cascade="all, delete-orphan"
+        "MonthlyIndicator",
+        back_populates="startup",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     board_meetings: Mapped[list["BoardMeeting"]] = relationship(
-        "BoardMeeting", back_populates="startup", cascade="all, delete-orphan"
+        "BoardMeeting",
+        back_populates="startup",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     executives: Mapped[list["Executive"]] = relationship(
-        "Executive", back_populates="startup", cascade="all, delete-orphan"
+        "Executive",
+        back_populates="startup",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        order_by="Executive.name",
     )
     monthly_indicator_tokens: Mapped[list["MonthlyIndicatorToken"]] = relationship(
-        "MonthlyIndicatorToken", back_populates="startup", cascade="all, delete-orphan"
+        "MonthlyIndicatorToken",
+        back_populates="startup",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        order_by="[MonthlyIndicatorToken.year.desc(),"
+        " MonthlyIndicatorToken.month.desc()]",
     )
+
+
+# Case-insensitive name prefix search; text_pattern_ops lets LIKE 'abc%' use
+# the index under any collation.
+Index(
+    "ix_startups_lower_name_prefix",
+    func.lower(Startup.name).label("lower_name"),
+    postgresql_ops={"lower_name": "text_pattern_ops"},
+)
@@ -11,6 +11,11 @@ class PaginatedResponse(BaseModel, Generic[T]):
     total: int
 
 
+class CursorPage(BaseModel, Generic[T]):
+    items: list[T]
+    next_cursor: str | None = None
+
+
 class FinancialMetrics(BaseModel):
     total_revenue: Decimal | None = None
     cash_balance: Decimal | None = None
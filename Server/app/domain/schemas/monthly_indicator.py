@@ -6,6 +6,7 @@ from decimal import Decimal
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from app.domain.models.startup import StartupStatus
 from app.domain.schemas.common import PaginatedResponse
 
 _MAX_MONEY = Decimal("9999999999999.99")
@@ -58,21 +59,53 @@ class MonthlyIndicatorResponse(MonthlyIndicatorBase):
 
 
 class MonthlyIndicatorListResponse(PaginatedResponse[MonthlyIndicatorResponse]):
-    pass
+    next_cursor: str | None = None
+
+
+class MonthlyIndicatorMetricsResponse(BaseModel):
+    """Numeric columns of an indicator, without the free-text fields."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: uuid.UUID
+    startup_id: uuid.UUID
+    month: int
+    year: int
+    total_revenue: Decimal | None = None
+    recurring_revenue_pct: Decimal | None = None
+    gross_margin_pct: Decimal | None = None
+    cash_balance: Decimal | None = None
+    headcount: int | None = None
+    ebitda_burn: Decimal | None = None
+    created_at: datetime
+    updated_at: datetime
+
+
+class MonthlyIndicatorMetricsListResponse(
+    PaginatedResponse[MonthlyIndicatorMetricsResponse]
+):
+    next_cursor: str | None = None
+
+
+class MonthlyIndicatorImportRow(MonthlyIndicatorBase):
+    startup_id: uuid.UUID
+
+
+class MonthlyIndicatorImportResult(BaseModel):
+    imported: int
 
 
 # --- Token schemas (private routes) ---
 
 
 class MonthlyIndicatorTokenResponse(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
-
     id: uuid.UUID
-    token: uuid.UUID
+    token: str
     startup_id: uuid.UUID
     month: int
     year: int
     created_at: datetime
+    expires_at: datetime
 
 
 class MonthlyIndicatorTokenCreate(BaseModel):
@@ -80,6 +113,18 @@ class MonthlyIndicatorTokenCreate(BaseModel):
     year: int = Field(..., ge=2000, le=2100)
 
 
+class MonthlyIndicatorTokenBatchCreate(MonthlyIndicatorTokenCreate):
+    """Issue tokens to every startup, optionally narrowed by id and status."""
+
+    startup_ids: list[uuid.UUID] | None = None
+    statuses: list[StartupStatus] | None = None
+
+
+class MonthlyIndicatorTokenBatchResponse(BaseModel):
+    items: list[MonthlyIndicatorTokenResponse]
+    skipped: int
+
+
 class MonthlyIndicatorTokenListResponse(
     PaginatedResponse[MonthlyIndicatorTokenResponse]
 ):
@@ -108,6 +153,7 @@ class PublicIndicatorForm(BaseModel):
     month: int
     year: int
     existing_indicator: PublicIndicatorData | None = None
+    draft: PublicIndicatorData | None = None
 
 
 class PublicIndicatorSubmit(BaseModel):
@@ -1,3 +1,4 @@
+import uuid
 from decimal import Decimal
 from typing import Literal
 
@@ -28,4 +29,78 @@ class PortfolioSummary(BaseModel):
     health: HealthDistribution
     monthly_report_pct: float
     routines_up_to_date_pct: float
-    startups: list[StartupSummary]
+
+
+class PeriodAggregate(BaseModel):
+    month: int
+    year: int
+    revenue: Decimal
+    cash_balance: Decimal
+    ebitda_burn: Decimal
+    headcount: int
+    reported: int
+    monthly_report_pct: float
+
+
+class PortfolioTimeseries(BaseModel):
+    points: list[PeriodAggregate]
+
+
+class MetricDistribution(BaseModel):
+    count: int
+    p10: float | None
+    p25: float | None
+    median: float | None
+    p75: float | None
+    p90: float | None
+
+
+class PortfolioAnalytics(BaseModel):
+    month: int
+    year: int
+    reported: int
+    gross_margin_revenue: float
+    weighted_gross_margin_pct: float | None
+    revenue_growth_mom: MetricDistribution
+    revenue_growth_yoy: MetricDistribution
+    runway_months: MetricDistribution
+    burn_multiple: MetricDistribution
+    gross_margin_revenue_per_startup: MetricDistribution
+
+
+class CohortPoint(BaseModel):
+    month: int
+    year: int
+    revenue: Decimal
+    ebitda_burn: Decimal
+    headcount: int
+    reported: int
+    monthly_report_pct: float
+
+
+class CohortSeries(BaseModel):
+    dimension: Literal["vintage", "sector", "total"]
+    cohort: str | None
+    startups: int
+    points: list[CohortPoint]
+
+
+class PortfolioCohorts(BaseModel):
+    cohorts: list[CohortSeries]
+
+
+class ReportingPeriod(BaseModel):
+    month: int
+    year: int
+
+
+class StartupCompliance(BaseModel):
+    startup_id: uuid.UUID
+    name: str
+    cells: list[Literal["reported", "pending", "missing"] | None]
+    missing: int
+
+
+class ReportingCompliance(BaseModel):
+    periods: list[ReportingPeriod]
+    startups: list[StartupCompliance]
@@ -0,0 +1,13 @@
+import uuid
+from typing import Literal
+
+from pydantic import BaseModel
+
+
+class SearchResult(BaseModel):
+    kind: Literal["startup", "board_meeting", "monthly_indicator", "deal"]
+    id: uuid.UUID
+    startup_id: uuid.UUID | None
+    title: str
+    snippet: str
+    rank: float
@@ -4,7 +4,13 @@ from datetime import date, datetime
 from pydantic import BaseModel, ConfigDict, Field
 
 from app.domain.models.startup import StartupStatus
+from app.domain.schemas.board_meeting import BoardMeetingResponse
 from app.domain.schemas.common import PaginatedResponse
+from app.domain.schemas.executive import ExecutiveResponse
+from app.domain.schemas.monthly_indicator import (
+    MonthlyIndicatorResponse,
+    MonthlyIndicatorTokenResponse,
+)
 
 
 class StartupBase(BaseModel):
@@ -39,5 +45,19 @@ class StartupResponse(StartupBase):
     updated_at: datetime
 
 
+class StartupFacets(BaseModel):
+    status: dict[str, int]
+    sector: dict[str, int]
+
+
 class StartupListResponse(PaginatedResponse[StartupResponse]):
-    pass
+    facets: StartupFacets | None = None
+    next_cursor: str | None = None
+
+
+class StartupOverviewResponse(BaseModel):
+    startup: StartupResponse
+    indicators: list[MonthlyIndicatorResponse]
+    board_meetings: list[BoardMeetingResponse]
+    executives: list[ExecutiveResponse]
+    tokens: list[MonthlyIndicatorTokenResponse]
@@ -10,3 +10,26 @@ def validate_period_not_future(month: int, year: int) -> None:
 def validate_username_no_spaces(username: str) -> None:
     if " " in username:
         raise ValueError("Username nao pode conter espacos")
+
+
+def parse_period(value: str) -> tuple[int, int]:
+    """Parse a ``YYYY-MM`` string into ``(month, year)``."""
+    try:
+        year_str, month_str = value.split("-")
+        year, month = int(year_str), int(month_str)
+    except ValueError:
+        raise ValueError(f"Periodo '{value}' deve estar no formato YYYY-MM")
+    if month < 1 or month > 12:
+        raise ValueError("Mes deve estar entre 1 e 12")
+    return month, year
+
+
+def validate_period_range(
+    start: tuple[int, int], end: tuple[int, int], max_months: int
+) -> None:
+    start_index = start[1] * 12 + start[0]
+    end_index = end[1] * 12 + end[0]
+    if start_index > end_index:
+        raise ValueError("Periodo inicial deve ser anterior ao periodo final")
+    if end_index - start_index + 1 > max_months:
+        raise ValueError(f"Intervalo nao pode exceder {max_months} meses")
@@ -0,0 +1,77 @@
+import base64
+import binascii
+import hashlib
+import hmac
+import struct
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+# token id, startup id, month, year, expiry as unix seconds
+_PAYLOAD = struct.Struct(">16s16sBHI")
+_MAC_SIZE = 16
+
+
+@dataclass(frozen=True)
+class FormTokenClaims:
+    token_id: uuid.UUID
+    startup_id: uuid.UUID
+    month: int
+    year: int
+    expires_at: datetime
+
+
+class FormTokenSigner:
+    """Signs public indicator form links so they can be checked in-process.
+
+    A link is the URL-safe base64 of the packed claims followed by a
+    truncated HMAC-SHA256; malformed, forged and expired links are rejected
+    without touching the database.
+    """
+
+    def __init__(self, secret_key: str) -> None:
+        # Derived so the JWT signing key is never used for anything else.
+        self._key = hmac.digest(
+            secret_key.encode(), b"monthly-indicator-form", hashlib.sha256
+        )
+
+    def sign(self, claims: FormTokenClaims) -> str:
+        expires_at = claims.expires_at
+        if expires_at.tzinfo is None:
+            # Databases without time zone support return naive UTC values.
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        payload = _PAYLOAD.pack(
+            claims.token_id.bytes,
+            claims.startup_id.bytes,
+            claims.month,
+            claims.year,
+            int(expires_at.timestamp()),
+        )
+        raw = payload + self._mac(payload)
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    def verify(self, value: str, now: datetime | None = None) -> FormTokenClaims | None:
+        try:
+            raw = base64.urlsafe_b64decode(value + "=" * (-len(value) % 4))
+        except (binascii.Error, ValueError):
+            return None
+        if len(raw) != _PAYLOAD.size + _MAC_SIZE:
+            return None
+        payload, mac = raw[: _PAYLOAD.size], raw[_PAYLOAD.size :]
+        if not hmac.compare_digest(mac, self._mac(payload)):
+            return None
+
+        token_id, startup_id, month, year, expires = _PAYLOAD.unpack(payload)
+        expires_at = datetime.fromtimestamp(expires, timezone.utc)
+        if expires_at <= (now or datetime.now(timezone.utc)):
+            return None
+        return FormTokenClaims(
+            token_id=uuid.UUID(bytes=token_id),
+            startup_id=uuid.UUID(bytes=startup_id),
+            month=month,
+            year=year,
+            expires_at=expires_at,
+        )
+
+    def _mac(self, payload: bytes) -> bytes:
+        return hmac.digest(self._key, payload, hashlib.sha256)[:_MAC_SIZE]
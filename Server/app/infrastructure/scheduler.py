@@ -0,0 +1,49 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+
+logger = logging.getLogger(__name__)
+
+Job = Callable[[], Awaitable[object]]
+
+
+def seconds_until_next_month(now: datetime) -> float:
+    """Seconds from ``now`` until midnight of the next first of the month."""
+    start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    if start.month == 12:
+        start = start.replace(year=start.year + 1, month=1)
+    else:
+        start = start.replace(month=start.month + 1)
+    return (start - now).total_seconds()
+
+
+async def run_monthly(job: Job) -> None:
+    """Run ``job`` now and then at the start of every month (UTC), forever.
+
+    Running at startup catches up on a month start missed while the process
+    was down, so jobs must be idempotent. Failures are logged and the loop
+    keeps going.
+    """
+    while True:
+        await _run(job)
+        await asyncio.sleep(seconds_until_next_month(datetime.now(UTC)))
+
+
+async def run_every(seconds: float, job: Job) -> None:
+    """Run ``job`` now and then every ``seconds``, forever."""
+    while True:
+        await _run(job)
+        await asyncio.sleep(seconds)
+
+
+async def run_once(job: Job) -> None:
+    """Run ``job`` a single time, logging a failure instead of raising."""
+    await _run(job)
+
+
+async def _run(job: Job) -> None:
+    try:
+        await job()
+    except Exception:
+        logger.exception("Background job %s failed", getattr(job, "__name__", job))
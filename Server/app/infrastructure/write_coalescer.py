@@ -0,0 +1,54 @@
+import uuid
+from typing import Any, Generic, Hashable, TypeVar
+
+from app.config import settings
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class WriteCoalescer(Generic[K, V]):
+    """In-process buffer that keeps only the latest pending write per key.
+
+    Writers overwrite freely; a periodic flush drains everything at once, so
+    many writes to one key cost a single database write. At most ``max_size``
+    keys are pending; new keys are refused until the next flush.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self._pending: dict[K, V] = {}
+        self._max_size = max_size
+
+    def put(self, key: K, value: V) -> bool:
+        """Buffer the write; False if the buffer is full and ``key`` is new."""
+        if key not in self._pending and len(self._pending) >= self._max_size:
+            return False
+        self._pending[key] = value
+        return True
+
+    def get(self, key: K) -> V | None:
+        return self._pending.get(key)
+
+    def pop(self, key: K) -> None:
+        self._pending.pop(key, None)
+
+    def drain(self) -> dict[K, V]:
+        pending, self._pending = self._pending, {}
+        return pending
+
+    def restore(self, pending: dict[K, V]) -> None:
+        """Put back drained writes that failed, unless a newer one arrived.
+
+        They were already accepted, so they are kept even past ``max_size``.
+        """
+        for key, value in pending.items():
+            self._pending.setdefault(key, value)
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+
+# Public form autosaves keyed by token id, until the next flush.
+indicator_drafts: WriteCoalescer[uuid.UUID, dict[str, Any]] = WriteCoalescer(
+    settings.indicator_draft_buffer_size
+)
@@ -0,0 +1,142 @@
+"""Background jobs run by the in-process scheduler, outside any request."""
+
+import logging
+from datetime import UTC, datetime
+
+from app.application.monthly_indicator.apply_queued_indicator_submissions import (
+    APPLY_BATCH_SIZE,
+    ApplyQueuedIndicatorSubmissions,
+)
+from app.application.monthly_indicator.flush_indicator_drafts import (
+    FlushIndicatorDrafts,
+)
+from app.application.monthly_indicator.issue_monthly_indicator_tokens import (
+    IssueMonthlyIndicatorTokens,
+    previous_period,
+)
+from app.application.monthly_indicator.purge_dead_indicator_tokens import (
+    PURGE_BATCH_SIZE,
+    PurgeDeadIndicatorTokens,
+)
+from app.application.startup.purge_deleted_startups import PurgeDeletedStartups
+from app.database import async_session
+from app.infrastructure.write_coalescer import indicator_drafts
+from app.repositories.indicator_draft_repository import IndicatorDraftRepository
+from app.repositories.indicator_submission_repository import (
+    IndicatorSubmissionRepository,
+)
+from app.repositories.monthly_indicator_repository import MonthlyIndicatorRepository
+from app.repositories.portfolio_snapshot_repository import (
+    PortfolioSnapshotRepository,
+)
+from app.repositories.startup_repository import StartupRepository
+
+logger = logging.getLogger(__name__)
+
+
+async def issue_monthly_indicator_tokens() -> None:
+    """Issue tokens for the period that has just closed to every startup.
+
+    Every worker runs this at startup and each month start; only the first to
+    claim the period issues it. The period follows the scheduler's UTC clock.
+    """
+    month, year = previous_period(datetime.now(UTC).date())
+    async with async_session() as session, session.begin():
+        use_case = IssueMonthlyIndicatorTokens(MonthlyIndicatorRepository(session))
+        issued = await use_case.execute_scheduled(month, year)
+    if issued is None:
+        return
+    created, skipped = issued
+    logger.info(
+        "Issued %d monthly indicator tokens for %02d/%d (%d already existed)",
+        len(created),
+        month,
+        year,
+        skipped,
+    )
+
+
+async def purge_dead_indicator_tokens() -> None:
+    """Delete revoked and expired tokens in bounded batches.
+
+    Each batch commits on its own, so row locks are held briefly and the
+    public routes are never blocked behind one large delete.
+    """
+    purged = 0
+    while True:
+        async with async_session() as session, session.begin():
+            use_case = PurgeDeadIndicatorTokens(MonthlyIndicatorRepository(session))
+            deleted = await use_case.execute()
+        purged += deleted
+        if deleted < PURGE_BATCH_SIZE:
+            break
+    if purged:
+        logger.info("Purged %d dead monthly indicator tokens", purged)
+
+
+async def purge_deleted_startups() -> None:
+    """Remove soft-deleted startups and their history in bounded batches.
+
+    Each batch commits on its own, so no transaction holds locks on a large
+    history for long and worker memory stays flat.
+    """
+    purged = 0
+    while True:
+        async with async_session() as session, session.begin():
+            use_case = PurgeDeletedStartups(
+                StartupRepository(session), PortfolioSnapshotRepository(session)
+            )
+            deleted = await use_case.execute()
+        if deleted == 0:
+            break
+        purged += deleted
+    if purged:
+        logger.info("Purged %d rows of deleted startups", purged)
+
+
+async def apply_queued_indicator_submissions() -> None:
+    """Drain the public submission queue, one transaction per batch."""
+    applied = 0
+    while True:
+        async with async_session() as session, session.begin():
+            use_case = ApplyQueuedIndicatorSubmissions(
+                IndicatorSubmissionRepository(session),
+                MonthlyIndicatorRepository(session),
+                PortfolioSnapshotRepository(session),
+                IndicatorDraftRepository(session),
+            )
+            batch = await use_case.execute()
+        applied += batch.count
+        if batch.superseded:
+            logger.warning(
+                "Queued indicator submissions superseded by later writes: %s",
+                ", ".join(
+                    f"{startup_id} {month}/{year}"
+                    for startup_id, month, year in batch.superseded
+                ),
+            )
+        if batch.count < APPLY_BATCH_SIZE:
+            break
+    if applied:
+        logger.info("Applied %d queued indicator submissions", applied)
+
+
+async def flush_indicator_drafts() -> None:
+    """Write the latest autosave of every public form in one transaction.
+
+    If the write fails the drafts go back into the buffer, behind any newer
+    autosave, and the next flush retries them.
+    """
+    drafts = indicator_drafts.drain()
+    if not drafts:
+        return
+    try:
+        async with async_session() as session, session.begin():
+            use_case = FlushIndicatorDrafts(
+                IndicatorDraftRepository(session), MonthlyIndicatorRepository(session)
+            )
+            await use_case.execute(drafts)
+    except BaseException:
+        # Also on cancellation, so shutdown's final flush still has them.
+        indicator_drafts.restore(drafts)
+        raise
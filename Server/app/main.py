@@ -1,13 +1,16 @@
+import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy.exc import IntegrityError
 
 from app.config import settings
 from app.database import engine
 from app.controllers.auth_controller import router as auth_router
 from app.controllers.auth_dependency import get_current_user
 from app.controllers.deal_controller import router as deal_router
+from app.controllers.errors import integrity_error_handler
 from app.controllers.executive_controller import router as executive_router
 from app.controllers.health_controller import router as health_router
 from app.controllers.board_meeting_controller import router as board_meeting_router
@@ -18,17 +21,67 @@ from app.controllers.monthly_indicator_controller import (
     router as monthly_indicator_router,
 )
 from app.controllers.portfolio_controller import router as portfolio_router
+from app.controllers.search_controller import router as search_router
 from app.controllers.startup_controller import router as startup_router
 from app.controllers.user_controller import router as user_router
 from app.controllers.user_invite_controller import (
     public_router as user_invite_public_router,
 )
 from app.controllers.user_invite_controller import router as user_invite_router
+from app.infrastructure.scheduler import run_every, run_monthly, run_once
+from app.jobs import (
+    apply_queued_indicator_submissions,
+    flush_indicator_drafts,
+    issue_monthly_indicator_tokens,
+    purge_dead_indicator_tokens,
+    purge_deleted_startups,
+)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    jobs = [
+        asyncio.create_task(
+            run_every(
+                settings.indicator_draft_flush_interval_seconds,
+                flush_indicator_drafts,
+            )
+        )
+    ]
+    if settings.schedule_indicator_tokens:
+        jobs.append(asyncio.create_task(run_monthly(issue_monthly_indicator_tokens)))
+    if settings.sweep_indicator_tokens:
+        jobs.append(
+            asyncio.create_task(
+                run_every(
+                    settings.indicator_token_sweep_interval_seconds,
+                    purge_dead_indicator_tokens,
+                )
+            )
+        )
+    if settings.soft_delete_startups:
+        jobs.append(
+            asyncio.create_task(
+                run_every(
+                    settings.startup_purge_interval_seconds, purge_deleted_startups
+                )
+            )
+        )
+    if settings.queue_public_submissions:
+        jobs.append(
+            asyncio.create_task(
+                run_every(
+                    settings.public_submission_drain_interval_seconds,
+                    apply_queued_indicator_submissions,
+                )
+            )
+        )
     yield
+    for job in jobs:
+        job.cancel()
+    await asyncio.gather(*jobs, return_exceptions=True)
+    # Autosaves buffered since the last flush would otherwise be lost.
+    await run_once(flush_indicator_drafts)
     await engine.dispose()
 
 
@@ -46,6 +99,7 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_exception_handler(IntegrityError, integrity_error_handler)
 
 # Public routes (no auth required)
 app.include_router(health_router, prefix="/api")
@@ -63,3 +117,4 @@ app.include_router(board_meeting_router, prefix="/api", dependencies=protected)
 app.include_router(executive_router, prefix="/api", dependencies=protected)
 app.include_router(portfolio_router, prefix="/api", dependencies=protected)
 app.include_router(deal_router, prefix="/api", dependencies=protected)
+app.include_router(search_router, prefix="/api", dependencies=protected)
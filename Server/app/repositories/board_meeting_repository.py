@@ -1,10 +1,10 @@
 import uuid
-from datetime import date, timedelta
 
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.models.board_meeting import BoardMeeting
+from app.repositories.watermark import Watermark, get_watermark
 
 
 class BoardMeetingRepository:
@@ -28,6 +28,22 @@ class BoardMeetingRepository:
         )
         return list(result.scalars().all()), total
 
+    async def get_recent(self, startup_id: uuid.UUID, limit: int) -> list[BoardMeeting]:
+        result = await self._session.execute(
+            select(BoardMeeting)
+            .where(BoardMeeting.startup_id == startup_id)
+            .order_by(BoardMeeting.meeting_date.desc())
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def get_watermark(self, startup_id: uuid.UUID) -> Watermark:
+        return await get_watermark(
+            self._session,
+            BoardMeeting.updated_at,
+            BoardMeeting.startup_id == startup_id,
+        )
+
     async def get_by_id(self, meeting_id: uuid.UUID) -> BoardMeeting | None:
         result = await self._session.execute(
             select(BoardMeeting).where(BoardMeeting.id == meeting_id)
@@ -48,23 +64,3 @@ class BoardMeetingRepository:
     async def delete(self, meeting: BoardMeeting) -> None:
         await self._session.delete(meeting)
         await self._session.flush()
-
-    async def get_startup_ids_with_recent_meetings(
-        self,
-        startup_ids: list[uuid.UUID],
-        cutoff_days: int,
-        reference_date: date,
-    ) -> set[uuid.UUID]:
-        if not startup_ids:
-            return set()
-
-        cutoff = reference_date - timedelta(days=cutoff_days)
-        result = await self._session.execute(
-            select(BoardMeeting.startup_id)
-            .where(
-                BoardMeeting.startup_id.in_(startup_ids),
-                BoardMeeting.meeting_date >= cutoff,
-            )
-            .distinct()
-        )
-        return set(result.scalars().all())
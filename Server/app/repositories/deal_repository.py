@@ -4,6 +4,7 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.models.deal import Deal
+from app.repositories.watermark import Watermark, get_watermark
 
 
 class DealRepository:
@@ -21,6 +22,9 @@ class DealRepository:
         )
         return list(result.scalars().all()), total
 
+    async def get_watermark(self) -> Watermark:
+        return await get_watermark(self._session, Deal.updated_at)
+
     async def get_by_id(self, deal_id: uuid.UUID) -> Deal | None:
         result = await self._session.execute(select(Deal).where(Deal.id == deal_id))
         return result.scalar_one_or_none()
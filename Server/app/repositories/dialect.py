@@ -0,0 +1,22 @@
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def insert_for(session: AsyncSession, model: type):  # noqa: ANN201
+    """Return the dialect-specific INSERT so callers can use ON CONFLICT."""
+    if session.get_bind().dialect.name == "sqlite":
+        return sqlite.insert(model)
+    return postgresql.insert(model)
+
+
+def supports_grouping_sets(session: AsyncSession) -> bool:
+    return session.get_bind().dialect.name == "postgresql"
+
+
+def is_foreign_key_violation(error: IntegrityError) -> bool:
+    """Whether the database refused a row whose parent does not exist."""
+    # asyncpg reports SQLSTATE 23503; SQLite only says so in the message.
+    if getattr(error.orig, "sqlstate", None) == "23503":
+        return True
+    return "FOREIGN KEY constraint failed" in str(error.orig)
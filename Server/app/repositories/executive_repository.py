@@ -4,6 +4,7 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.models.executive import Executive
+from app.repositories.watermark import Watermark, get_watermark
 
 
 class ExecutiveRepository:
@@ -27,6 +28,13 @@ class ExecutiveRepository:
         )
         return list(result.scalars().all()), total
 
+    async def get_watermark(self, startup_id: uuid.UUID) -> Watermark:
+        return await get_watermark(
+            self._session,
+            Executive.updated_at,
+            Executive.startup_id == startup_id,
+        )
+
     async def get_by_id(self, executive_id: uuid.UUID) -> Executive | None:
         result = await self._session.execute(
             select(Executive).where(Executive.id == executive_id)
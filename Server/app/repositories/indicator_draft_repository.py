@@ -0,0 +1,51 @@
+import uuid
+
+from sqlalchemy import delete, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.models.indicator_draft import IndicatorDraft
+from app.repositories.dialect import insert_for
+from app.repositories.indicator_submission_repository import SUBMISSION_FIELDS
+
+
+class IndicatorDraftRepository:
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def get(
+        self, startup_id: uuid.UUID, month: int, year: int
+    ) -> IndicatorDraft | None:
+        return await self._session.get(
+            IndicatorDraft, (startup_id, month, year), populate_existing=True
+        )
+
+    async def save_many(self, rows: list[dict]) -> None:
+        """Insert or replace many drafts in one multi-row statement.
+
+        Each row carries ``startup_id``, ``month``, ``year``, the
+        ``updated_at`` of the autosave and every ``SUBMISSION_FIELDS`` key; a
+        saved draft replaces the stored one whole. Rows must not repeat a
+        period.
+        """
+        stmt = insert_for(self._session, IndicatorDraft).values(rows)
+        await self._session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["startup_id", "month", "year"],
+                set_={
+                    **{field: stmt.excluded[field] for field in SUBMISSION_FIELDS},
+                    "updated_at": stmt.excluded.updated_at,
+                },
+            )
+        )
+
+    async def delete_many(self, periods: list[tuple[uuid.UUID, int, int]]) -> None:
+        """Delete the drafts of the given ``(startup_id, month, year)``."""
+        if not periods:
+            return
+        await self._session.execute(
+            delete(IndicatorDraft).where(
+                tuple_(
+                    IndicatorDraft.startup_id, IndicatorDraft.month, IndicatorDraft.year
+                ).in_(periods)
+            )
+        )
@@ -0,0 +1,90 @@
+import uuid
+from typing import Any
+
+from sqlalchemy import delete, func, insert, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.models.indicator_submission import IndicatorSubmission
+from app.domain.models.monthly_indicator_token import MonthlyIndicatorToken
+from app.domain.models.startup import Startup
+from app.repositories.startup_repository import LIVE_STARTUP
+
+SUBMISSION_FIELDS = (
+    "total_revenue",
+    "recurring_revenue_pct",
+    "gross_margin_pct",
+    "cash_balance",
+    "headcount",
+    "ebitda_burn",
+    "achievements",
+    "challenges",
+)
+
+# Arbitrary application-wide key for pg_try_advisory_xact_lock.
+_DRAIN_LOCK_KEY = 0x1D1CA7025
+
+
+class IndicatorSubmissionRepository:
+    """Staging queue of public form submissions not yet applied."""
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def enqueue(self, token: uuid.UUID, values: dict[str, Any]) -> bool:
+        """Queue a submission for the live token, in one INSERT ... SELECT.
+
+        The startup and period are copied from the token row; returns False
+        when the token does not exist, was revoked or its startup was deleted.
+        """
+        columns = IndicatorSubmission.__table__.c
+        source = (
+            select(
+                MonthlyIndicatorToken.startup_id,
+                MonthlyIndicatorToken.month,
+                MonthlyIndicatorToken.year,
+                *(
+                    literal(values.get(field), columns[field].type).label(field)
+                    for field in SUBMISSION_FIELDS
+                ),
+            )
+            .join(Startup, Startup.id == MonthlyIndicatorToken.startup_id)
+            .where(
+                MonthlyIndicatorToken.token == token,
+                MonthlyIndicatorToken.revoked_at.is_(None),
+                LIVE_STARTUP,
+            )
+        )
+        result = await self._session.execute(
+            insert(IndicatorSubmission)
+            .from_select(["startup_id", "month", "year", *SUBMISSION_FIELDS], source)
+            .returning(IndicatorSubmission.id)
+        )
+        return result.first() is not None
+
+    async def try_lock(self) -> bool:
+        """Take the drain lock for the current transaction, without waiting.
+
+        Only one drainer may run at a time, otherwise an older submission
+        could be applied after a newer one for the same period. Databases
+        without advisory locks run a single process and always succeed.
+        """
+        if self._session.get_bind().dialect.name != "postgresql":
+            return True
+        result = await self._session.execute(
+            select(func.pg_try_advisory_xact_lock(_DRAIN_LOCK_KEY))
+        )
+        return result.scalar_one()
+
+    async def get_oldest(self, limit: int) -> list[IndicatorSubmission]:
+        """Return the first ``limit`` submissions in submission order."""
+        result = await self._session.execute(
+            select(IndicatorSubmission)
+            .order_by(IndicatorSubmission.submitted_at, IndicatorSubmission.id)
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def delete(self, ids: list[int]) -> None:
+        await self._session.execute(
+            delete(IndicatorSubmission).where(IndicatorSubmission.id.in_(ids))
+        )
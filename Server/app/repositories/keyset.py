@@ -0,0 +1,29 @@
+from typing import Any
+
+from sqlalchemy import ColumnElement, and_, or_
+
+
+def keyset_after(
+    column: ColumnElement,
+    id_column: ColumnElement,
+    after: tuple[Any, Any],
+    descending: bool,
+) -> ColumnElement[bool]:
+    """Rows strictly after ``after`` in ``column, id_column`` order, NULLS LAST.
+
+    Both columns are assumed to be sorted in the same direction.
+    """
+    value, last_id = after
+    id_beyond = id_column < last_id if descending else id_column > last_id
+    if value is None:
+        return and_(column.is_(None), id_beyond)
+    beyond = column < value if descending else column > value
+    return or_(beyond, column.is_(None), and_(column == value, id_beyond))
+
+
+def keyset_order(
+    column: ColumnElement, id_column: ColumnElement, descending: bool
+) -> list[ColumnElement]:
+    if descending:
+        return [column.desc().nulls_last(), id_column.desc()]
+    return [column.asc().nulls_last(), id_column.asc()]
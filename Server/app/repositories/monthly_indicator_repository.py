@@ -1,32 +1,156 @@
 import uuid
+from datetime import datetime
 
-from sqlalchemy import func, select
+from sqlalchemy import (
+    ColumnElement,
+    Row,
+    and_,
+    case,
+    delete,
+    exists,
+    func,
+    or_,
+    select,
+    tuple_,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
+from app.domain.models.indicator_draft import IndicatorDraft
 from app.domain.models.monthly_indicator import MonthlyIndicator
-from app.domain.models.monthly_indicator_token import MonthlyIndicatorToken
+from app.domain.models.monthly_indicator_token import (
+    MonthlyIndicatorToken,
+    MonthlyIndicatorTokenRun,
+)
+from app.domain.models.startup import Startup, StartupStatus
+from app.repositories.dialect import insert_for
+from app.repositories.startup_repository import LIVE_STARTUP
+from app.repositories.watermark import Watermark, get_watermark
+
+VALUE_FIELDS = (
+    "total_revenue",
+    "recurring_revenue_pct",
+    "gross_margin_pct",
+    "cash_balance",
+    "headcount",
+    "ebitda_burn",
+    "achievements",
+    "challenges",
+    "comments",
+)
+
+METRIC_COLUMNS = (
+    MonthlyIndicator.id,
+    MonthlyIndicator.startup_id,
+    MonthlyIndicator.month,
+    MonthlyIndicator.year,
+    MonthlyIndicator.total_revenue,
+    MonthlyIndicator.recurring_revenue_pct,
+    MonthlyIndicator.gross_margin_pct,
+    MonthlyIndicator.cash_balance,
+    MonthlyIndicator.headcount,
+    MonthlyIndicator.ebitda_burn,
+    MonthlyIndicator.created_at,
+    MonthlyIndicator.updated_at,
+)
+
+_LIVE_TOKEN = MonthlyIndicatorToken.revoked_at.is_(None)
+
+_PERIOD_KEY = (
+    MonthlyIndicator.startup_id,
+    MonthlyIndicator.month,
+    MonthlyIndicator.year,
+)
+
+
+def _same_period(model: type) -> ColumnElement[bool]:
+    """Join ``model`` to the startup and period of the token row."""
+    return and_(
+        model.startup_id == MonthlyIndicatorToken.startup_id,
+        model.month == MonthlyIndicatorToken.month,
+        model.year == MonthlyIndicatorToken.year,
+    )
+
+
+def _period_is(
+    model: type, startup_id: uuid.UUID, month: int, year: int
+) -> ColumnElement[bool]:
+    return and_(
+        model.startup_id == startup_id, model.month == month, model.year == year
+    )
+
+
+def _history_criteria(
+    startup_id: uuid.UUID,
+    start: tuple[int, int] | None,
+    end: tuple[int, int] | None,
+) -> list[ColumnElement[bool]]:
+    period = tuple_(MonthlyIndicator.year, MonthlyIndicator.month)
+    criteria = [MonthlyIndicator.startup_id == startup_id]
+    if start is not None:
+        criteria.append(period >= tuple_(start[1], start[0]))
+    if end is not None:
+        criteria.append(period <= tuple_(end[1], end[0]))
+    return criteria
 
 
 class MonthlyIndicatorRepository:
     def __init__(self, session: AsyncSession):
         self._session = session
 
-    async def get_all_by_startup(
-        self, startup_id: uuid.UUID
-    ) -> tuple[list[MonthlyIndicator], int]:
-        count_result = await self._session.execute(
+    async def get_history(
+        self,
+        startup_id: uuid.UUID,
+        start: tuple[int, int] | None = None,
+        end: tuple[int, int] | None = None,
+        limit: int | None = None,
+        before: tuple[int, int] | None = None,
+        metrics_only: bool = False,
+    ) -> list[MonthlyIndicator]:
+        """Return a startup's indicators, newest period first.
+
+        ``start``/``end`` are inclusive ``(month, year)`` bounds and ``before``
+        is the ``(month, year)`` keyset position of the previous page. With
+        ``metrics_only`` the text columns are not loaded and raise on access.
+        """
+        stmt = select(MonthlyIndicator).where(
+            *_history_criteria(startup_id, start, end)
+        )
+        if before is not None:
+            stmt = stmt.where(
+                tuple_(MonthlyIndicator.year, MonthlyIndicator.month)
+                < tuple_(before[1], before[0])
+            )
+        if metrics_only:
+            stmt = stmt.options(load_only(*METRIC_COLUMNS, raiseload=True))
+        stmt = stmt.order_by(
+            MonthlyIndicator.year.desc(), MonthlyIndicator.month.desc()
+        )
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        result = await self._session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def count_history(
+        self,
+        startup_id: uuid.UUID,
+        start: tuple[int, int] | None = None,
+        end: tuple[int, int] | None = None,
+    ) -> int:
+        result = await self._session.execute(
             select(func.count())
             .select_from(MonthlyIndicator)
-            .where(MonthlyIndicator.startup_id == startup_id)
+            .where(*_history_criteria(startup_id, start, end))
         )
-        total = count_result.scalar_one()
+        return result.scalar_one()
 
-        result = await self._session.execute(
-            select(MonthlyIndicator)
-            .where(MonthlyIndicator.startup_id == startup_id)
-            .order_by(MonthlyIndicator.year.desc(), MonthlyIndicator.month.desc())
+    async def get_watermark(self, startup_id: uuid.UUID) -> Watermark:
+        return await get_watermark(
+            self._session,
+            MonthlyIndicator.updated_at,
+            MonthlyIndicator.startup_id == startup_id,
         )
-        return list(result.scalars().all()), total
 
     async def get_by_id(self, indicator_id: uuid.UUID) -> MonthlyIndicator | None:
         result = await self._session.execute(
@@ -46,37 +170,116 @@ class MonthlyIndicatorRepository:
         )
         return result.scalar_one_or_none()
 
-    async def create(self, indicator: MonthlyIndicator) -> MonthlyIndicator:
-        self._session.add(indicator)
-        await self._session.flush()
-        await self._session.refresh(indicator)
-        return indicator
+    async def get_updated_at(
+        self, periods: list[tuple[uuid.UUID, int, int]]
+    ) -> dict[tuple[uuid.UUID, int, int], datetime]:
+        """Return when each reported ``(startup_id, month, year)`` last changed."""
+        if not periods:
+            return {}
+        key = (
+            MonthlyIndicator.startup_id,
+            MonthlyIndicator.month,
+            MonthlyIndicator.year,
+        )
+        result = await self._session.execute(
+            select(*key, MonthlyIndicator.updated_at).where(tuple_(*key).in_(periods))
+        )
+        return {(row[0], row[1], row[2]): row[3] for row in result.all()}
 
     async def update(self, indicator: MonthlyIndicator) -> MonthlyIndicator:
         await self._session.flush()
         await self._session.refresh(indicator)
         return indicator
 
-    async def delete(self, indicator: MonthlyIndicator) -> None:
-        await self._session.delete(indicator)
-        await self._session.flush()
+    async def upsert(self, indicator: MonthlyIndicator) -> MonthlyIndicator:
+        """Insert the indicator or merge it into its period in one statement.
 
-    async def get_by_startups_and_period(
-        self, startup_ids: list[uuid.UUID], month: int, year: int
-    ) -> dict[uuid.UUID, MonthlyIndicator]:
-        if not startup_ids:
-            return {}
+        On an existing period only non-null values overwrite the stored ones;
+        the merged row is returned.
+        """
+        values = {field: getattr(indicator, field) for field in VALUE_FIELDS}
+        stmt = self._upsert_statement(
+            [
+                {
+                    "startup_id": indicator.startup_id,
+                    "month": indicator.month,
+                    "year": indicator.year,
+                    **values,
+                }
+            ]
+        ).returning(MonthlyIndicator)
+        result = await self._session.execute(
+            stmt, execution_options={"populate_existing": True}
+        )
+        return result.scalar_one()
 
+    async def upsert_many(self, rows: list[dict]) -> set[tuple[uuid.UUID, int, int]]:
+        """Insert or merge many indicators in one multi-row statement.
+
+        Each row carries ``startup_id``, ``month``, ``year`` and every
+        ``VALUE_FIELDS`` key, merged like ``upsert``. Rows must not repeat a
+        period. Returns the ``(startup_id, month, year)`` of the rows written.
+        """
         result = await self._session.execute(
-            select(MonthlyIndicator).where(
-                MonthlyIndicator.startup_id.in_(startup_ids),
-                MonthlyIndicator.month == month,
-                MonthlyIndicator.year == year,
-            )
+            self._upsert_statement(rows).returning(*_PERIOD_KEY)
         )
-        indicators = list(result.scalars().all())
+        return {tuple(row) for row in result.all()}
 
-        return {ind.startup_id: ind for ind in indicators}
+    async def merge_submissions(self, rows: list[dict]) -> list[Row]:
+        """Merge submitted indicators field by field, in one statement.
+
+        Rows are shaped like those of ``upsert_many`` plus the ``updated_at``
+        of their submission, which becomes the row's own unless it already
+        changed later. A submitted value replaces the stored one unless that
+        is set and newer than the submission; fields left out are kept.
+        Returns the period key and the resulting values of every row.
+        """
+        stmt = insert_for(self._session, MonthlyIndicator).values(rows)
+        columns = MonthlyIndicator.__table__.c
+        submitted_later = columns.updated_at <= stmt.excluded.updated_at
+        result = await self._session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["startup_id", "month", "year"],
+                set_={
+                    **{
+                        field: case(
+                            (
+                                and_(
+                                    stmt.excluded[field].is_not(None),
+                                    or_(columns[field].is_(None), submitted_later),
+                                ),
+                                stmt.excluded[field],
+                            ),
+                            else_=columns[field],
+                        )
+                        for field in VALUE_FIELDS
+                    },
+                    "updated_at": case(
+                        (submitted_later, stmt.excluded.updated_at),
+                        else_=columns.updated_at,
+                    ),
+                },
+            ).returning(*_PERIOD_KEY, *(columns[field] for field in VALUE_FIELDS))
+        )
+        return result.all()
+
+    def _upsert_statement(self, rows: list[dict]):  # noqa: ANN202
+        stmt = insert_for(self._session, MonthlyIndicator).values(rows)
+        columns = MonthlyIndicator.__table__.c
+        return stmt.on_conflict_do_update(
+            index_elements=["startup_id", "month", "year"],
+            set_={
+                **{
+                    field: func.coalesce(stmt.excluded[field], columns[field])
+                    for field in VALUE_FIELDS
+                },
+                "updated_at": func.now(),
+            },
+        )
+
+    async def delete(self, indicator: MonthlyIndicator) -> None:
+        await self._session.delete(indicator)
+        await self._session.flush()
 
     # --- Token methods ---
 
@@ -84,10 +287,58 @@ class MonthlyIndicatorRepository:
         self, token: uuid.UUID
     ) -> MonthlyIndicatorToken | None:
         result = await self._session.execute(
-            select(MonthlyIndicatorToken).where(MonthlyIndicatorToken.token == token)
+            select(MonthlyIndicatorToken)
+            .join(Startup, Startup.id == MonthlyIndicatorToken.startup_id)
+            .where(MonthlyIndicatorToken.token == token, _LIVE_TOKEN, LIVE_STARTUP)
         )
         return result.scalar_one_or_none()
 
+    async def get_live_tokens(self, tokens: set[uuid.UUID]) -> set[uuid.UUID]:
+        """Return which of ``tokens`` exist, were not revoked and belong to a
+        startup that was not deleted."""
+        result = await self._session.execute(
+            select(MonthlyIndicatorToken.token)
+            .join(Startup, Startup.id == MonthlyIndicatorToken.startup_id)
+            .where(MonthlyIndicatorToken.token.in_(tokens), _LIVE_TOKEN, LIVE_STARTUP)
+        )
+        return set(result.scalars().all())
+
+    async def get_public_form(self, token: uuid.UUID) -> Row | None:
+        """Resolve a token to its startup and period, with the indicator
+        already reported and the saved draft (or None), in one statement."""
+        result = await self._session.execute(
+            select(
+                MonthlyIndicatorToken.startup_id,
+                MonthlyIndicatorToken.month,
+                MonthlyIndicatorToken.year,
+                Startup.name,
+                Startup.logo_url,
+                MonthlyIndicator,
+                IndicatorDraft,
+            )
+            .join(Startup, Startup.id == MonthlyIndicatorToken.startup_id)
+            .outerjoin(MonthlyIndicator, _same_period(MonthlyIndicator))
+            .outerjoin(IndicatorDraft, _same_period(IndicatorDraft))
+            .where(MonthlyIndicatorToken.token == token, _LIVE_TOKEN, LIVE_STARTUP)
+        )
+        return result.one_or_none()
+
+    async def get_reported_and_draft(
+        self, startup_id: uuid.UUID, month: int, year: int
+    ) -> Row | None:
+        """Return the indicator reported for the period and its saved draft,
+        each None when absent, in one statement; None if the startup is
+        gone."""
+        period = {"startup_id": startup_id, "month": month, "year": year}
+        result = await self._session.execute(
+            select(MonthlyIndicator, IndicatorDraft)
+            .select_from(Startup)
+            .outerjoin(MonthlyIndicator, _period_is(MonthlyIndicator, **period))
+            .outerjoin(IndicatorDraft, _period_is(IndicatorDraft, **period))
+            .where(Startup.id == startup_id, LIVE_STARTUP)
+        )
+        return result.one_or_none()
+
     async def get_token_by_startup_and_period(
         self, startup_id: uuid.UUID, month: int, year: int
     ) -> MonthlyIndicatorToken | None:
@@ -96,6 +347,7 @@ class MonthlyIndicatorRepository:
                 MonthlyIndicatorToken.startup_id == startup_id,
                 MonthlyIndicatorToken.month == month,
                 MonthlyIndicatorToken.year == year,
+                _LIVE_TOKEN,
             )
         )
         return result.scalar_one_or_none()
@@ -106,13 +358,13 @@ class MonthlyIndicatorRepository:
         count_result = await self._session.execute(
             select(func.count())
             .select_from(MonthlyIndicatorToken)
-            .where(MonthlyIndicatorToken.startup_id == startup_id)
+            .where(MonthlyIndicatorToken.startup_id == startup_id, _LIVE_TOKEN)
         )
         total = count_result.scalar_one()
 
         result = await self._session.execute(
             select(MonthlyIndicatorToken)
-            .where(MonthlyIndicatorToken.startup_id == startup_id)
+            .where(MonthlyIndicatorToken.startup_id == startup_id, _LIVE_TOKEN)
             .order_by(
                 MonthlyIndicatorToken.year.desc(),
                 MonthlyIndicatorToken.month.desc(),
@@ -120,8 +372,139 @@ class MonthlyIndicatorRepository:
         )
         return list(result.scalars().all()), total
 
+    async def create_tokens_for_period(
+        self,
+        month: int,
+        year: int,
+        expires_at: datetime,
+        startup_ids: list[uuid.UUID] | None = None,
+        statuses: list[StartupStatus] | None = None,
+        skip_revoked: bool = False,
+    ) -> tuple[list[MonthlyIndicatorToken], int]:
+        """Issue a token for the period to every matching startup lacking one.
+
+        Returns the created tokens and the number of matching startups; those
+        that already had a live token are left untouched by ON CONFLICT DO
+        NOTHING. With ``skip_revoked``, startups whose token for the period
+        was revoked before it expired do not match.
+        """
+        stmt = select(Startup.id).where(LIVE_STARTUP)
+        if startup_ids is not None:
+            stmt = stmt.where(Startup.id.in_(startup_ids))
+        if statuses is not None:
+            stmt = stmt.where(Startup.status.in_(statuses))
+        if skip_revoked:
+            stmt = stmt.where(
+                ~exists().where(
+                    MonthlyIndicatorToken.startup_id == Startup.id,
+                    MonthlyIndicatorToken.month == month,
+                    MonthlyIndicatorToken.year == year,
+                    MonthlyIndicatorToken.revoked_at < MonthlyIndicatorToken.expires_at,
+                )
+            )
+        matched = list((await self._session.execute(stmt)).scalars().all())
+        if not matched:
+            return [], 0
+
+        result = await self._session.execute(
+            insert_for(self._session, MonthlyIndicatorToken)
+            .values(
+                [
+                    {
+                        "startup_id": startup_id,
+                        "month": month,
+                        "year": year,
+                        "expires_at": expires_at,
+                    }
+                    for startup_id in matched
+                ]
+            )
+            .on_conflict_do_nothing(
+                index_elements=["startup_id", "month", "year"],
+                index_where=_LIVE_TOKEN,
+            )
+            .returning(MonthlyIndicatorToken)
+        )
+        return list(result.scalars().all()), len(matched)
+
+    async def claim_token_run(self, month: int, year: int) -> bool:
+        """Record that the monthly job issues the period; False if it already
+        did. A concurrent claim waits on the key until the first commits."""
+        result = await self._session.execute(
+            insert_for(self._session, MonthlyIndicatorTokenRun)
+            .values(month=month, year=year)
+            .on_conflict_do_nothing(index_elements=["month", "year"])
+            .returning(MonthlyIndicatorTokenRun.month)
+        )
+        return result.first() is not None
+
+    async def get_tokens_watermark(self, startup_id: uuid.UUID) -> Watermark:
+        return await get_watermark(
+            self._session,
+            MonthlyIndicatorToken.created_at,
+            MonthlyIndicatorToken.startup_id == startup_id,
+            _LIVE_TOKEN,
+        )
+
     async def create_token(self, token: MonthlyIndicatorToken) -> MonthlyIndicatorToken:
         self._session.add(token)
         await self._session.flush()
         await self._session.refresh(token)
         return token
+
+    async def revoke_token(
+        self, startup_id: uuid.UUID, token_id: uuid.UUID
+    ) -> uuid.UUID | None:
+        """Revoke a live token of the startup; return its value, or None."""
+        result = await self._session.execute(
+            update(MonthlyIndicatorToken)
+            .where(
+                MonthlyIndicatorToken.id == token_id,
+                MonthlyIndicatorToken.startup_id == startup_id,
+                _LIVE_TOKEN,
+            )
+            .values(revoked_at=func.now())
+            .returning(MonthlyIndicatorToken.token)
+        )
+        return result.scalar_one_or_none()
+
+    async def revoke_expired_tokens(
+        self,
+        month: int,
+        year: int,
+        now: datetime,
+        startup_id: uuid.UUID | None = None,
+    ) -> None:
+        """Revoke the period's expired tokens so the period can be reissued.
+
+        With ``startup_id`` only that startup's token is touched; without it
+        the whole period is swept.
+        """
+        stmt = update(MonthlyIndicatorToken).where(
+            MonthlyIndicatorToken.month == month,
+            MonthlyIndicatorToken.year == year,
+            MonthlyIndicatorToken.expires_at <= now,
+            _LIVE_TOKEN,
+        )
+        if startup_id is not None:
+            stmt = stmt.where(MonthlyIndicatorToken.startup_id == startup_id)
+        await self._session.execute(stmt.values(revoked_at=func.now()))
+
+    async def delete_dead_tokens(self, now: datetime, limit: int) -> int:
+        """Delete up to ``limit`` revoked or expired tokens; return how many."""
+        dead = (
+            select(MonthlyIndicatorToken.id)
+            .where(
+                or_(
+                    MonthlyIndicatorToken.revoked_at.is_not(None),
+                    MonthlyIndicatorToken.expires_at <= now,
+                )
+            )
+            .limit(limit)
+        )
+        result = await self._session.execute(
+            delete(MonthlyIndicatorToken).where(
+                MonthlyIndicatorToken.id.in_(dead.scalar_subquery())
+            )
+        )
+        return result.rowcount
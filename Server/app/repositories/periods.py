@@ -0,0 +1,16 @@
+from sqlalchemy import ColumnElement, and_, tuple_
+
+
+def period_between(
+    model: type, start: tuple[int, int], end: tuple[int, int]
+) -> ColumnElement[bool]:
+    """Filter ``model`` rows whose (month, year) falls in an inclusive range.
+
+    Compares ``(year, month)`` row values so an index on those columns can be
+    used for the range scan.
+    """
+    period = tuple_(model.year, model.month)
+    return and_(
+        period >= tuple_(start[1], start[0]),
+        period <= tuple_(end[1], end[0]),
+    )
@@ -0,0 +1,419 @@
+import uuid
+from collections.abc import AsyncIterator
+from datetime import date, datetime
+from typing import Any
+
+from sqlalchemy import (
+    ColumnElement,
+    FromClause,
+    Row,
+    String,
+    and_,
+    case,
+    cast,
+    extract,
+    func,
+    literal,
+    literal_column,
+    null,
+    select,
+    tuple_,
+    union_all,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.models.board_meeting import BoardMeeting
+from app.domain.models.monthly_indicator import MonthlyIndicator
+from app.domain.models.monthly_indicator_token import MonthlyIndicatorToken
+from app.domain.models.startup import Startup, StartupStatus
+from app.repositories.dialect import supports_grouping_sets
+from app.repositories.keyset import keyset_after, keyset_order
+from app.repositories.periods import period_between
+from app.repositories.startup_repository import LIVE_STARTUP
+from app.repositories.watermark import Watermark, get_watermark
+
+MONITORING_SORT_COLUMNS = {
+    "name": Startup.name,
+    "total_revenue": MonthlyIndicator.total_revenue,
+    "cash_balance": MonthlyIndicator.cash_balance,
+    "ebitda_burn": MonthlyIndicator.ebitda_burn,
+    "headcount": MonthlyIndicator.headcount,
+}
+
+EXPORT_BATCH_SIZE = 500
+
+EXPORT_STARTUP_COLUMNS = (
+    Startup.id.label("startup_id"),
+    Startup.name.label("startup_name"),
+    Startup.sector,
+    Startup.status,
+    Startup.investment_date,
+)
+EXPORT_INDICATOR_COLUMNS = (
+    MonthlyIndicator.year,
+    MonthlyIndicator.month,
+    MonthlyIndicator.total_revenue,
+    MonthlyIndicator.recurring_revenue_pct,
+    MonthlyIndicator.gross_margin_pct,
+    MonthlyIndicator.cash_balance,
+    MonthlyIndicator.ebitda_burn,
+    MonthlyIndicator.headcount,
+    MonthlyIndicator.achievements,
+    MonthlyIndicator.challenges,
+    MonthlyIndicator.comments,
+)
+EXPORT_BOARD_MEETING_COLUMNS = (
+    BoardMeeting.startup_id,
+    BoardMeeting.meeting_date,
+    BoardMeeting.participants,
+    BoardMeeting.summary,
+    BoardMeeting.attention_points,
+    BoardMeeting.next_steps,
+)
+
+
+class PortfolioRepository:
+    """Read queries that aggregate across the whole portfolio."""
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def get_watermark(self) -> tuple[Watermark, Watermark]:
+        """Watermarks of startups and monthly indicators, in one statement."""
+        result = await self._session.execute(
+            select(
+                select(func.count())
+                .select_from(Startup)
+                .where(LIVE_STARTUP)
+                .scalar_subquery(),
+                select(func.max(Startup.updated_at))
+                .where(LIVE_STARTUP)
+                .scalar_subquery(),
+                select(func.count()).select_from(MonthlyIndicator).scalar_subquery(),
+                select(func.max(MonthlyIndicator.updated_at)).scalar_subquery(),
+            )
+        )
+        startups, startups_at, indicators, indicators_at = result.one()
+        return (startups, startups_at), (indicators, indicators_at)
+
+    async def get_token_watermark(self) -> Watermark:
+        """Changes whenever a token is issued, revoked or purged."""
+        return await get_watermark(
+            self._session,
+            func.coalesce(
+                MonthlyIndicatorToken.revoked_at, MonthlyIndicatorToken.created_at
+            ),
+        )
+
+    async def get_period_aggregates(
+        self,
+        month: int,
+        year: int,
+        previous_month: int,
+        previous_year: int,
+        meetings_since: date,
+    ) -> Row:
+        """Return every summary aggregate for a period in a single statement.
+
+        Each joined subquery yields at most one row per startup, so the outer
+        joins never fan out and plain aggregates over ``startups`` are exact.
+        """
+        current = (
+            select(MonthlyIndicator.startup_id, MonthlyIndicator.total_revenue)
+            .where(MonthlyIndicator.month == month, MonthlyIndicator.year == year)
+            .subquery("current_indicator")
+        )
+        previous = (
+            select(MonthlyIndicator.startup_id, MonthlyIndicator.total_revenue)
+            .where(
+                MonthlyIndicator.month == previous_month,
+                MonthlyIndicator.year == previous_year,
+            )
+            .subquery("previous_indicator")
+        )
+        recent_meetings = (
+            select(BoardMeeting.startup_id)
+            .where(BoardMeeting.meeting_date >= meetings_since)
+            .distinct()
+            .subquery("recent_meeting")
+        )
+
+        result = await self._session.execute(
+            select(
+                func.count(Startup.id).label("total_startups"),
+                func.count(Startup.id)
+                .filter(Startup.status == StartupStatus.HEALTHY)
+                .label("healthy"),
+                func.count(Startup.id)
+                .filter(Startup.status == StartupStatus.WARNING)
+                .label("warning"),
+                func.count(Startup.id)
+                .filter(Startup.status == StartupStatus.CRITICAL)
+                .label("critical"),
+                func.coalesce(func.sum(current.c.total_revenue), 0).label("revenue"),
+                func.coalesce(func.sum(previous.c.total_revenue), 0).label(
+                    "previous_revenue"
+                ),
+                func.count(current.c.startup_id).label("reported"),
+                func.count(recent_meetings.c.startup_id).label("with_recent_meetings"),
+            )
+            .select_from(Startup)
+            .outerjoin(current, current.c.startup_id == Startup.id)
+            .outerjoin(previous, previous.c.startup_id == Startup.id)
+            .outerjoin(recent_meetings, recent_meetings.c.startup_id == Startup.id)
+            .where(LIVE_STARTUP)
+        )
+        return result.one()
+
+    async def get_monitoring_page(
+        self,
+        month: int,
+        year: int,
+        sort: str,
+        descending: bool,
+        limit: int,
+        after: tuple[Any, uuid.UUID] | None = None,
+    ) -> list[Row]:
+        """Return a keyset page of startups with their financials for the period."""
+        column = MONITORING_SORT_COLUMNS[sort]
+        stmt = (
+            select(
+                Startup,
+                MonthlyIndicator.total_revenue,
+                MonthlyIndicator.cash_balance,
+                MonthlyIndicator.ebitda_burn,
+                MonthlyIndicator.headcount,
+            )
+            .outerjoin(
+                MonthlyIndicator,
+                (MonthlyIndicator.startup_id == Startup.id)
+                & (MonthlyIndicator.month == month)
+                & (MonthlyIndicator.year == year),
+            )
+            .where(LIVE_STARTUP)
+        )
+        if after is not None:
+            stmt = stmt.where(keyset_after(column, Startup.id, after, descending))
+        result = await self._session.execute(
+            stmt.order_by(*keyset_order(column, Startup.id, descending)).limit(limit)
+        )
+        return list(result.all())
+
+    async def get_period_series(
+        self, start: tuple[int, int], end: tuple[int, int]
+    ) -> list[Row]:
+        """Return per-period indicator totals for an inclusive range.
+
+        Periods without any indicator are absent from the result.
+        """
+        total_startups = (
+            select(func.count(Startup.id)).where(LIVE_STARTUP).scalar_subquery()
+        )
+        result = await self._session.execute(
+            select(
+                MonthlyIndicator.year,
+                MonthlyIndicator.month,
+                func.sum(MonthlyIndicator.total_revenue).label("revenue"),
+                func.sum(MonthlyIndicator.cash_balance).label("cash_balance"),
+                func.sum(MonthlyIndicator.ebitda_burn).label("ebitda_burn"),
+                func.sum(MonthlyIndicator.headcount).label("headcount"),
+                func.count(MonthlyIndicator.startup_id).label("reported"),
+                total_startups.label("total_startups"),
+            )
+            .join(Startup, Startup.id == MonthlyIndicator.startup_id)
+            .where(period_between(MonthlyIndicator, start, end), LIVE_STARTUP)
+            .group_by(MonthlyIndicator.year, MonthlyIndicator.month)
+            .order_by(MonthlyIndicator.year, MonthlyIndicator.month)
+        )
+        return list(result.all())
+
+    async def get_indicator_history(
+        self, start: tuple[int, int], end: tuple[int, int]
+    ) -> list[Row]:
+        """Return the raw financial columns of every indicator in the range."""
+        result = await self._session.execute(
+            select(
+                MonthlyIndicator.startup_id,
+                MonthlyIndicator.year,
+                MonthlyIndicator.month,
+                MonthlyIndicator.total_revenue,
+                MonthlyIndicator.gross_margin_pct,
+                MonthlyIndicator.cash_balance,
+                MonthlyIndicator.ebitda_burn,
+            )
+            .join(Startup, Startup.id == MonthlyIndicator.startup_id)
+            .where(period_between(MonthlyIndicator, start, end), LIVE_STARTUP)
+        )
+        return list(result.all())
+
+    async def stream_indicator_history(self) -> AsyncIterator[Row]:
+        """Stream every startup joined with its indicators, in startup order.
+
+        Rows come from a server-side cursor in batches of
+        ``EXPORT_BATCH_SIZE``; startups without indicators yield one row with
+        null indicator columns.
+        """
+        result = await self._session.stream(
+            select(*EXPORT_STARTUP_COLUMNS, *EXPORT_INDICATOR_COLUMNS)
+            .outerjoin(MonthlyIndicator, MonthlyIndicator.startup_id == Startup.id)
+            .where(LIVE_STARTUP)
+            .order_by(Startup.id, MonthlyIndicator.year, MonthlyIndicator.month)
+            .execution_options(yield_per=EXPORT_BATCH_SIZE)
+        )
+        async for row in result:
+            yield row
+
+    async def stream_board_meetings(self) -> AsyncIterator[Row]:
+        """Stream every board meeting ordered like ``stream_indicator_history``."""
+        result = await self._session.stream(
+            select(*EXPORT_BOARD_MEETING_COLUMNS)
+            .join(Startup, Startup.id == BoardMeeting.startup_id)
+            .where(LIVE_STARTUP)
+            .order_by(BoardMeeting.startup_id, BoardMeeting.meeting_date)
+            .execution_options(yield_per=EXPORT_BATCH_SIZE)
+        )
+        async for row in result:
+            yield row
+
+    async def get_reporting_cells(
+        self, start: tuple[int, int], end: tuple[int, int], now: datetime
+    ) -> list[Row]:
+        """Return every startup with its reporting state for the range.
+
+        Each row carries the startup columns and one period where it has an
+        indicator (``reported``) or a live, unexpired token (``issued``).
+        Startups with neither in the range yield a single row with null
+        period columns. Rows come ordered by startup name.
+        """
+        cells = union_all(
+            select(
+                MonthlyIndicator.startup_id,
+                MonthlyIndicator.year,
+                MonthlyIndicator.month,
+                literal(1).label("reported"),
+                literal(0).label("issued"),
+            ).where(period_between(MonthlyIndicator, start, end)),
+            select(
+                MonthlyIndicatorToken.startup_id,
+                MonthlyIndicatorToken.year,
+                MonthlyIndicatorToken.month,
+                literal(0).label("reported"),
+                literal(1).label("issued"),
+            ).where(
+                period_between(MonthlyIndicatorToken, start, end),
+                MonthlyIndicatorToken.revoked_at.is_(None),
+                MonthlyIndicatorToken.expires_at > now,
+            ),
+        ).subquery("cells")
+        per_period = (
+            select(
+                cells.c.startup_id,
+                cells.c.year,
+                cells.c.month,
+                func.max(cells.c.reported).label("reported"),
+                func.max(cells.c.issued).label("issued"),
+            )
+            .group_by(cells.c.startup_id, cells.c.year, cells.c.month)
+            .subquery("per_period")
+        )
+        result = await self._session.execute(
+            select(
+                Startup.id,
+                Startup.name,
+                Startup.investment_date,
+                per_period.c.year,
+                per_period.c.month,
+                per_period.c.reported,
+                per_period.c.issued,
+            )
+            .outerjoin(per_period, per_period.c.startup_id == Startup.id)
+            .where(LIVE_STARTUP)
+            .order_by(Startup.name, Startup.id)
+        )
+        return list(result.all())
+
+    async def get_cohort_series(
+        self, start: tuple[int, int], end: tuple[int, int]
+    ) -> list[Row]:
+        """Return per-period indicator totals for every cohort in the range."""
+        result = await self._session.execute(
+            self._cohort_rollup(
+                MonthlyIndicator.__table__.join(
+                    Startup.__table__, MonthlyIndicator.startup_id == Startup.id
+                ),
+                and_(period_between(MonthlyIndicator, start, end), LIVE_STARTUP),
+                [MonthlyIndicator.year, MonthlyIndicator.month],
+                [
+                    func.sum(MonthlyIndicator.total_revenue).label("revenue"),
+                    func.sum(MonthlyIndicator.ebitda_burn).label("ebitda_burn"),
+                    func.sum(MonthlyIndicator.headcount).label("headcount"),
+                    func.count(MonthlyIndicator.id).label("reported"),
+                ],
+            )
+        )
+        return list(result.all())
+
+    async def get_cohort_sizes(self) -> list[Row]:
+        """Return the number of startups in every cohort."""
+        result = await self._session.execute(
+            self._cohort_rollup(
+                Startup.__table__,
+                LIVE_STARTUP,
+                [],
+                [func.count(Startup.id).label("startups")],
+            )
+        )
+        return list(result.all())
+
+    def _cohort_rollup(
+        self,
+        source: FromClause,
+        where: ColumnElement[bool] | None,
+        keys: list[ColumnElement],
+        measures: list[ColumnElement],
+    ):  # noqa: ANN202
+        """Aggregate ``measures`` by ``keys`` per vintage, per sector and overall.
+
+        Output columns are ``dimension`` ("vintage", "sector" or "total"),
+        ``cohort`` (vintage year or sector as text, null for the total), then
+        ``keys`` and ``measures``. PostgreSQL computes every grouping in one
+        pass with GROUPING SETS; other databases run the equivalent UNION ALL.
+        """
+        dimensions = {
+            "vintage": extract("year", Startup.investment_date),
+            "sector": Startup.sector,
+        }
+
+        def grouped(*columns: ColumnElement):  # noqa: ANN202
+            stmt = select(*columns, *keys, *measures).select_from(source)
+            return stmt.where(where) if where is not None else stmt
+
+        if supports_grouping_sets(self._session):
+            vintage, sector = dimensions.values()
+            dimension = case(
+                (func.grouping(vintage) == 0, "vintage"),
+                (func.grouping(sector) == 0, "sector"),
+                else_="total",
+            )
+            cohort = func.coalesce(cast(vintage, String), sector)
+            total = tuple_(*keys) if keys else literal_column("()")
+            return grouped(
+                dimension.label("dimension"), cohort.label("cohort")
+            ).group_by(
+                func.grouping_sets(
+                    *(tuple_(column, *keys) for column in dimensions.values()), total
+                )
+            )
+
+        parts = [
+            grouped(
+                literal(name).label("dimension"), cast(column, String).label("cohort")
+            ).group_by(column, *keys)
+            for name, column in dimensions.items()
+        ]
+        parts.append(
+            grouped(
+                literal("total").label("dimension"), null().label("cohort")
+            ).group_by(*keys)
+        )
+        return union_all(*parts)
@@ -0,0 +1,122 @@
+import uuid
+
+from sqlalchemy import delete, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.models.portfolio_period_snapshot import (
+    PortfolioPeriodSnapshot,
+    PortfolioSnapshotGeneration,
+)
+from app.repositories.dialect import insert_for
+
+# The generation row every period adds to its own.
+_PORTFOLIO_WIDE = (0, 0)
+
+_AGGREGATE_FIELDS = (
+    "reference_date",
+    "total_startups",
+    "healthy",
+    "warning",
+    "critical",
+    "revenue",
+    "previous_revenue",
+    "reported",
+    "with_recent_meetings",
+    "generation",
+)
+
+
+class PortfolioSnapshotRepository:
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def get(self, month: int, year: int) -> PortfolioPeriodSnapshot | None:
+        return await self._session.get(PortfolioPeriodSnapshot, (month, year))
+
+    async def get_generation(self, month: int, year: int) -> int:
+        """The period's current generation, as committed writes left it."""
+        result = await self._session.execute(
+            select(func.coalesce(func.sum(PortfolioSnapshotGeneration.generation), 0))
+            .where(
+                tuple_(
+                    PortfolioSnapshotGeneration.month, PortfolioSnapshotGeneration.year
+                ).in_([(month, year), _PORTFOLIO_WIDE])
+            )
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one()
+
+    async def save(self, snapshot: PortfolioPeriodSnapshot) -> PortfolioPeriodSnapshot:
+        """Insert or replace the snapshot unless a newer generation is stored.
+
+        ``snapshot.generation`` must be the one read before its aggregates:
+        a write that commits in between bumps the period past it, so the
+        saved snapshot is already stale and the next reader rebuilds it.
+        A rebuild that lost the race to a newer one is returned unsaved.
+        """
+        snapshot.version = uuid.uuid4()
+        values = {field: getattr(snapshot, field) for field in _AGGREGATE_FIELDS}
+        stmt = insert_for(self._session, PortfolioPeriodSnapshot).values(
+            month=snapshot.month, year=snapshot.year, version=snapshot.version, **values
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["month", "year"],
+            set_={
+                **{field: stmt.excluded[field] for field in _AGGREGATE_FIELDS},
+                "version": stmt.excluded.version,
+                "computed_at": func.now(),
+            },
+            where=PortfolioPeriodSnapshot.generation <= stmt.excluded.generation,
+        ).returning(PortfolioPeriodSnapshot)
+        result = await self._session.execute(
+            stmt, execution_options={"populate_existing": True}
+        )
+        return result.scalar_one_or_none() or snapshot
+
+    async def delete_periods(self, periods: list[tuple[int, int]]) -> None:
+        """Invalidate the snapshots of ``periods``."""
+        if not periods:
+            return
+        await self._bump_generations(periods)
+        await self._session.execute(
+            delete(PortfolioPeriodSnapshot).where(
+                tuple_(PortfolioPeriodSnapshot.month, PortfolioPeriodSnapshot.year).in_(
+                    periods
+                )
+            )
+        )
+
+    async def delete_through(self, month: int, year: int) -> None:
+        """Invalidate every snapshot for (month, year) and all earlier periods.
+
+        Earlier periods without a generation row cannot be enumerated, so the
+        portfolio-wide generation is bumped; later periods rebuild once more.
+        """
+        await self._bump_generations([_PORTFOLIO_WIDE])
+        await self._session.execute(
+            delete(PortfolioPeriodSnapshot).where(
+                PortfolioPeriodSnapshot.year * 12 + PortfolioPeriodSnapshot.month
+                <= year * 12 + month
+            )
+        )
+
+    async def delete_all(self) -> None:
+        """Invalidate every snapshot."""
+        await self._bump_generations([_PORTFOLIO_WIDE])
+        await self._session.execute(delete(PortfolioPeriodSnapshot))
+
+    async def _bump_generations(self, periods: list[tuple[int, int]]) -> None:
+        # Committed with the write itself, so a rebuild that read the data
+        # before the write also read the generation before the bump.
+        stmt = insert_for(self._session, PortfolioSnapshotGeneration).values(
+            [
+                {"month": month, "year": year, "generation": 1}
+                for month, year in sorted(set(periods))
+            ]
+        )
+        await self._session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["month", "year"],
+                set_={"generation": PortfolioSnapshotGeneration.generation + 1},
+            )
+        )
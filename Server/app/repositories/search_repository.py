@@ -0,0 +1,119 @@
+import uuid
+
+from sqlalchemy import (
+    ColumnElement,
+    Row,
+    Select,
+    and_,
+    func,
+    literal,
+    null,
+    or_,
+    select,
+    union_all,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.models.deal import Deal
+from app.domain.models.search_index import (
+    SEARCH_COLUMNS,
+    SEARCH_CONFIG,
+    search_document,
+    search_vector,
+)
+from app.domain.models.startup import Startup
+from app.repositories.keyset import keyset_after, keyset_order
+from app.repositories.startup_repository import LIVE_STARTUP
+
+
+def _contains_terms(
+    document: ColumnElement[str], terms: list[str]
+) -> ColumnElement[bool]:
+    """Every term appears somewhere in the document, ignoring case."""
+    return and_(
+        *(
+            document.ilike(
+                "%"
+                + term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+                + "%",
+                escape="\\",
+            )
+            for term in terms
+        )
+    )
+
+
+class SearchRepository:
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def search(
+        self,
+        query: str,
+        limit: int,
+        after: tuple[float, uuid.UUID] | None = None,
+    ) -> list[Row]:
+        """Rank startups, board meetings, indicators and deals against ``query``.
+
+        Rows carry ``kind``, ``id``, ``startup_id``, ``title``, ``document``
+        and ``rank``, ordered by rank then id, descending. On PostgreSQL a
+        row matches the web-search style query through the tsvector index
+        or contains every term through the trigram index, and is ranked with
+        ``ts_rank``; elsewhere only the substring match applies, ranked 0.
+        """
+        terms = query.split()
+        full_text = self._session.get_bind().dialect.name == "postgresql"
+        ts_query = func.websearch_to_tsquery(SEARCH_CONFIG, query)
+
+        parts = []
+        for kind, (model, columns) in SEARCH_COLUMNS.items():
+            document = search_document(columns)
+            match = _contains_terms(document, terms)
+            rank = literal(0.0)
+            if full_text:
+                vector = search_vector(document)
+                match = or_(vector.op("@@")(ts_query), match)
+                rank = func.ts_rank(vector, ts_query)
+            parts.append(
+                self._source(kind, model)
+                .add_columns(document.label("document"), rank.label("rank"))
+                .where(match)
+            )
+        results = union_all(*parts).subquery("results")
+
+        stmt = select(results)
+        if after is not None:
+            stmt = stmt.where(keyset_after(results.c.rank, results.c.id, after, True))
+        result = await self._session.execute(
+            stmt.order_by(*keyset_order(results.c.rank, results.c.id, True)).limit(
+                limit
+            )
+        )
+        return list(result.all())
+
+    def _source(self, kind: str, model: type) -> Select:
+        """Identity columns of a search result, titled by startup or company."""
+        if model is Deal:
+            return select(
+                literal(kind).label("kind"),
+                Deal.id,
+                null().label("startup_id"),
+                Deal.company.label("title"),
+            )
+        if model is Startup:
+            return select(
+                literal(kind).label("kind"),
+                Startup.id,
+                Startup.id.label("startup_id"),
+                Startup.name.label("title"),
+            ).where(LIVE_STARTUP)
+        return (
+            select(
+                literal(kind).label("kind"),
+                model.id,
+                model.startup_id,
+                Startup.name.label("title"),
+            )
+            .join(Startup, Startup.id == model.startup_id)
+            .where(LIVE_STARTUP)
+        )
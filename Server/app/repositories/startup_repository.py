@@ -1,32 +1,137 @@
 import uuid
+from dataclasses import dataclass
+from datetime import date
 
-from sqlalchemy import func, select
+from sqlalchemy import ColumnElement, Row, delete, exists, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
-from app.domain.models.startup import Startup
+from app.domain.models.board_meeting import BoardMeeting
+from app.domain.models.executive import Executive
+from app.domain.models.monthly_indicator import MonthlyIndicator
+from app.domain.models.monthly_indicator_token import MonthlyIndicatorToken
+from app.domain.models.startup import Startup, StartupStatus
+from app.repositories.keyset import keyset_after, keyset_order
+from app.repositories.watermark import Watermark, get_watermark
+
+# Soft-deleted startups wait for the purge job hidden from every read.
+LIVE_STARTUP = Startup.deleted_at.is_(None)
+
+# Histories the purge job deletes in batches before the startup row itself.
+_HISTORY_MODELS = (MonthlyIndicator, BoardMeeting, Executive, MonthlyIndicatorToken)
+
+
+@dataclass(frozen=True)
+class StartupFilters:
+    """Startup list filters; empty tuples and None mean no filter."""
+
+    statuses: tuple[StartupStatus, ...] = ()
+    sectors: tuple[str, ...] = ()
+    invested_from: date | None = None
+    invested_to: date | None = None
+    name_prefix: str | None = None
+
+
+def _range_criteria(filters: StartupFilters) -> list[ColumnElement[bool]]:
+    """Criteria of every filter except status and sector, the facets."""
+    criteria = [LIVE_STARTUP]
+    if filters.invested_from is not None:
+        criteria.append(Startup.investment_date >= filters.invested_from)
+    if filters.invested_to is not None:
+        criteria.append(Startup.investment_date <= filters.invested_to)
+    if filters.name_prefix:
+        # A plain prefix pattern, which the lower(name) index can serve.
+        escaped = (
+            filters.name_prefix.lower()
+            .replace("\\", "\\\\")
+            .replace("%", "\\%")
+            .replace("_", "\\_")
+        )
+        criteria.append(func.lower(Startup.name).like(f"{escaped}%", escape="\\"))
+    return criteria
 
 
 class StartupRepository:
     def __init__(self, session: AsyncSession):
         self._session = session
 
-    async def get_all(self) -> tuple[list[Startup], int]:
-        count_result = await self._session.execute(
-            select(func.count()).select_from(Startup)
-        )
-        total = count_result.scalar_one()
+    async def get_page(
+        self,
+        filters: StartupFilters,
+        limit: int | None = None,
+        after: tuple[str, uuid.UUID] | None = None,
+    ) -> list[Startup]:
+        """Return startups matching ``filters`` in (name, id) keyset order."""
+        stmt = select(Startup).where(*_range_criteria(filters))
+        if filters.statuses:
+            stmt = stmt.where(Startup.status.in_(filters.statuses))
+        if filters.sectors:
+            stmt = stmt.where(Startup.sector.in_(filters.sectors))
+        if after is not None:
+            stmt = stmt.where(keyset_after(Startup.name, Startup.id, after, False))
+        stmt = stmt.order_by(*keyset_order(Startup.name, Startup.id, False))
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        result = await self._session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def get_facet_counts(self, filters: StartupFilters) -> list[Row]:
+        """Count startups per (status, sector) under every other filter.
 
+        The status and sector filters are left out so callers can derive,
+        from this one grouping, the total and each facet's counts as if its
+        own selection were cleared.
+        """
         result = await self._session.execute(
-            select(Startup).order_by(Startup.created_at.desc())
+            select(Startup.status, Startup.sector, func.count().label("startups"))
+            .where(*_range_criteria(filters))
+            .group_by(Startup.status, Startup.sector)
         )
-        return list(result.scalars().all()), total
+        return list(result.all())
+
+    async def get_watermark(self) -> Watermark:
+        return await get_watermark(self._session, Startup.updated_at, LIVE_STARTUP)
 
     async def get_by_id(self, startup_id: uuid.UUID) -> Startup | None:
         result = await self._session.execute(
-            select(Startup).where(Startup.id == startup_id)
+            select(Startup).where(Startup.id == startup_id, LIVE_STARTUP)
+        )
+        return result.scalar_one_or_none()
+
+    async def exists(self, startup_id: uuid.UUID) -> bool:
+        result = await self._session.execute(
+            select(exists().where(Startup.id == startup_id, LIVE_STARTUP))
+        )
+        return result.scalar_one()
+
+    async def get_with_details(self, startup_id: uuid.UUID) -> Startup | None:
+        """Return a startup with its executives and live tokens loaded.
+
+        Each collection is selectin-loaded by one extra query, and refreshed
+        even when the startup is already in the session.
+        """
+        result = await self._session.execute(
+            select(Startup)
+            .where(Startup.id == startup_id, LIVE_STARTUP)
+            .options(
+                selectinload(Startup.executives),
+                selectinload(
+                    Startup.monthly_indicator_tokens.and_(
+                        MonthlyIndicatorToken.revoked_at.is_(None)
+                    )
+                ),
+            )
+            .execution_options(populate_existing=True)
         )
         return result.scalar_one_or_none()
 
+    async def get_existing_ids(self, startup_ids: set[uuid.UUID]) -> set[uuid.UUID]:
+        """Return the subset of ``startup_ids`` that exist."""
+        result = await self._session.execute(
+            select(Startup.id).where(Startup.id.in_(startup_ids), LIVE_STARTUP)
+        )
+        return set(result.scalars().all())
+
     async def create(self, startup: Startup) -> Startup:
         self._session.add(startup)
         await self._session.flush()
@@ -41,3 +146,32 @@ class StartupRepository:
     async def delete(self, startup: Startup) -> None:
         await self._session.delete(startup)
         await self._session.flush()
+
+    async def soft_delete(self, startup: Startup) -> None:
+        startup.deleted_at = func.now()
+        await self._session.flush()
+
+    async def get_next_deleted_id(self) -> uuid.UUID | None:
+        """Return the soft-deleted startup waiting longest for the purge."""
+        result = await self._session.execute(
+            select(Startup.id)
+            .where(Startup.deleted_at.is_not(None))
+            .order_by(Startup.deleted_at)
+            .limit(1)
+        )
+        return result.scalar_one_or_none()
+
+    async def delete_history_batch(self, startup_id: uuid.UUID, limit: int) -> int:
+        """Delete up to ``limit`` history rows of each kind; return how many."""
+        deleted = 0
+        for model in _HISTORY_MODELS:
+            batch = select(model.id).where(model.startup_id == startup_id).limit(limit)
+            result = await self._session.execute(
+                delete(model).where(model.id.in_(batch.scalar_subquery()))
+            )
+            deleted += result.rowcount
+        return deleted
+
+    async def delete_by_id(self, startup_id: uuid.UUID) -> None:
+        """Delete the row; anything left of its history goes by cascade."""
+        await self._session.execute(delete(Startup).where(Startup.id == startup_id))
@@ -0,0 +1,23 @@
+from datetime import datetime
+
+from sqlalchemy import ColumnElement, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+Watermark = tuple[int, datetime | None]
+
+
+async def get_watermark(
+    session: AsyncSession,
+    timestamp: ColumnElement[datetime],
+    *criteria: ColumnElement[bool],
+) -> Watermark:
+    """Row count and latest ``timestamp`` of the rows matching ``criteria``.
+
+    Inserts and updates move the timestamp and deletes move the count, so
+    the pair changes whenever the matching rows do.
+    """
+    result = await session.execute(
+        select(func.count(), func.max(timestamp)).where(*criteria)
+    )
+    count, latest = result.one()
+    return count, latest
@@ -6,6 +6,7 @@ os.environ.setdefault("SECRET_KEY", "test-secret-key-for-testing-only")
 
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
@@ -25,6 +26,15 @@ TEST_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
 engine = create_async_engine(TEST_DATABASE_URL, echo=False)
 TestSessionLocal = async_sessionmaker(engine, expire_on_commit=False)
 
+
+@event.listens_for(engine.sync_engine, "connect")
+def _enable_foreign_keys(dbapi_connection, _connection_record) -> None:
+    # SQLite ignores foreign keys unless asked; deletes rely on ON DELETE CASCADE.
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
 _hasher = BcryptPasswordHasher()
 _token_gen = JwtTokenGenerator(
     settings.secret_key, settings.access_token_expire_minutes
@@ -70,6 +70,23 @@ async def test_create_indicator_upsert(client, startup_id):
     assert list_resp.json()["total"] == 1
 
 
+@pytest.mark.asyncio
+async def test_create_indicator_upsert_keeps_omitted_fields(client, startup_id):
+    resp1 = await client.post(
+        f"/api/startups/{startup_id}/monthly-indicators",
+        json={"month": 3, "year": 2025, "total_revenue": 1000, "headcount": 5},
+    )
+    resp2 = await client.post(
+        f"/api/startups/{startup_id}/monthly-indicators",
+        json={"month": 3, "year": 2025, "headcount": 8},
+    )
+    assert resp2.status_code == 201
+    data = resp2.json()
+    assert data["id"] == resp1.json()["id"]
+    assert float(data["total_revenue"]) == 1000
+    assert data["headcount"] == 8
+
+
 @pytest.mark.asyncio
 async def test_get_indicator(client, startup_id):
     create_resp = await client.post(
@@ -126,3 +143,194 @@ async def test_indicator_startup_not_found(client):
     fake_id = "00000000-0000-0000-0000-000000000001"
     resp = await client.get(f"/api/startups/{fake_id}/monthly-indicators")
     assert resp.status_code == 404
+
+
+async def _create_history(client, startup_id, periods):
+    for year, month in periods:
+        resp = await client.post(
+            f"/api/startups/{startup_id}/monthly-indicators",
+            json={
+                "month": month,
+                "year": year,
+                "total_revenue": 1000 * month,
+                "achievements": "Texto longo",
+            },
+        )
+        assert resp.status_code == 201
+
+
+@pytest.mark.asyncio
+async def test_list_indicators_period_range(client, startup_id):
+    await _create_history(
+        client, startup_id, [(2025, 11), (2025, 12), (2026, 1), (2026, 2)]
+    )
+
+    resp = await client.get(
+        f"/api/startups/{startup_id}/monthly-indicators",
+        params={"from": "2025-12", "to": "2026-01"},
+    )
+    assert resp.status_code == 200
+    data = resp.json()
+    assert [(i["year"], i["month"]) for i in data["items"]] == [
+        (2026, 1),
+        (2025, 12),
+    ]
+    assert data["total"] == 2
+    assert data["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_list_indicators_keyset_pages(client, startup_id):
+    await _create_history(
+        client, startup_id, [(2025, 11), (2025, 12), (2026, 1), (2026, 2)]
+    )
+    url = f"/api/startups/{startup_id}/monthly-indicators"
+
+    first = (await client.get(url, params={"limit": 3})).json()
+    assert [(i["year"], i["month"]) for i in first["items"]] == [
+        (2026, 2),
+        (2026, 1),
+        (2025, 12),
+    ]
+    assert first["total"] == 4
+    assert first["next_cursor"] is not None
+
+    second = (
+        await client.get(url, params={"limit": 3, "cursor": first["next_cursor"]})
+    ).json()
+    assert [(i["year"], i["month"]) for i in second["items"]] == [(2025, 11)]
+    assert second["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_list_indicators_metrics_only(client, startup_id):
+    await _create_history(client, startup_id, [(2026, 1)])
+
+    resp = await client.get(
+        f"/api/startups/{startup_id}/monthly-indicators",
+        params={"fields": "metrics"},
+    )
+    assert resp.status_code == 200
+    item = resp.json()["items"][0]
+    assert float(item["total_revenue"]) == 1000
+    assert "achievements" not in item
+    assert "comments" not in item
+
+
+@pytest.mark.asyncio
+async def test_list_indicators_inverted_range(client, startup_id):
+    resp = await client.get(
+        f"/api/startups/{startup_id}/monthly-indicators",
+        params={"from": "2026-02", "to": "2025-12"},
+    )
+    assert resp.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_import_indicators_csv(client, startup_id):
+    await client.post(
+        f"/api/startups/{startup_id}/monthly-indicators",
+        json={"month": 1, "year": 2025, "headcount": 5, "comments": "Manter"},
+    )
+    body = (
+        "startup_id,startup_name,year,month,total_revenue,headcount,comments\n"
+        f'{startup_id},Test Startup,2025,1,1000.50,,"linha 1\nlinha 2"\n'
+        f"{startup_id},Test Startup,2025,2,2000,7,\n"
+    )
+
+    resp = await client.post(
+        "/api/monthly-indicators/import",
+        files={"file": ("indicators.csv", body, "text/csv")},
+    )
+    assert resp.status_code == 200
+    assert resp.json() == {"imported": 2}
+
+    items = (await client.get(f"/api/startups/{startup_id}/monthly-indicators")).json()[
+        "items"
+    ]
+    by_month = {i["month"]: i for i in items}
+    assert float(by_month[1]["total_revenue"]) == 1000.50
+    assert by_month[1]["headcount"] == 5
+    assert by_month[1]["comments"] == "linha 1\nlinha 2"
+    assert by_month[2]["headcount"] == 7
+
+
+@pytest.mark.asyncio
+async def test_import_indicators_ndjson(client, startup_id):
+    body = (
+        f'{{"startup_id": "{startup_id}", "month": 3, "year": 2025, "headcount": 4}}\n'
+        "\n"
+        f'{{"startup_id": "{startup_id}", "month": 4, "year": 2025}}\n'
+    )
+
+    resp = await client.post(
+        "/api/monthly-indicators/import",
+        params={"format": "ndjson"},
+        files={"file": ("indicators.ndjson", body, "application/x-ndjson")},
+    )
+    assert resp.status_code == 200
+    assert resp.json() == {"imported": 2}
+
+    list_resp = await client.get(f"/api/startups/{startup_id}/monthly-indicators")
+    assert list_resp.json()["total"] == 2
+
+
+@pytest.mark.asyncio
+async def test_import_indicators_invalid_row(client, startup_id):
+    body = f"startup_id,year,month,headcount\n{startup_id},2025,13,1\n"
+
+    resp = await client.post(
+        "/api/monthly-indicators/import",
+        files={"file": ("indicators.csv", body, "text/csv")},
+    )
+    assert resp.status_code == 400
+    assert resp.json()["detail"].startswith("Linha 2: month")
+
+
+@pytest.mark.asyncio
+async def test_import_indicators_counts_written_rows(client, startup_id):
+    body = (
+        "startup_id,year,month,headcount,total_revenue\n"
+        f"{startup_id},2025,1,5,\n"
+        f"{startup_id},2025,1,,1000\n"
+    )
+
+    resp = await client.post(
+        "/api/monthly-indicators/import",
+        files={"file": ("indicators.csv", body, "text/csv")},
+    )
+    assert resp.status_code == 200
+    assert resp.json() == {"imported": 1}
+
+
+@pytest.mark.asyncio
+async def test_import_indicators_rejects_rows_without_period(client, startup_id):
+    body = (
+        "startup_id,startup_name,year,month,headcount\n"
+        f"{startup_id},Test Startup,2025,1,5\n"
+        f"{startup_id},Test Startup,,,\n"
+        f"{startup_id},Test Startup,2025,,3\n"
+        f"{startup_id},Test Startup,,,4\n"
+    )
+
+    resp = await client.post(
+        "/api/monthly-indicators/import",
+        files={"file": ("indicators.csv", body, "text/csv")},
+    )
+    assert resp.status_code == 422
+    assert resp.json()["detail"] == "Linha 4: mes e ano sao obrigatorios"
+
+    list_resp = await client.get(f"/api/startups/{startup_id}/monthly-indicators")
+    assert list_resp.json()["total"] == 0
+
+
+@pytest.mark.asyncio
+async def test_import_indicators_rejects_non_utf8_file(client, startup_id):
+    body = f"startup_id,year,month,comments\n{startup_id},2025,1,gest\xe3o\n"
+
+    resp = await client.post(
+        "/api/monthly-indicators/import",
+        files={"file": ("indicators.csv", body.encode("latin-1"), "text/csv")},
+    )
+    assert resp.status_code == 400
+    assert resp.json()["detail"] == "O arquivo deve estar em UTF-8"
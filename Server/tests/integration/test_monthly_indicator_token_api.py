@@ -1,12 +1,37 @@
 import uuid
-from datetime import date
+from datetime import date, datetime, timedelta, timezone
 
 import pytest
 import pytest_asyncio
 from httpx import AsyncClient
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.application.monthly_indicator.apply_queued_indicator_submissions import (
+    ApplyQueuedIndicatorSubmissions,
+)
+from app.application.monthly_indicator.flush_indicator_drafts import (
+    FlushIndicatorDrafts,
+)
+from app.application.monthly_indicator.issue_monthly_indicator_tokens import (
+    IssueMonthlyIndicatorTokens,
+)
+from app.application.monthly_indicator.purge_dead_indicator_tokens import (
+    PurgeDeadIndicatorTokens,
+)
+from app.config import settings
+from app.controllers import monthly_indicator_controller
 from app.domain.models.monthly_indicator_token import MonthlyIndicatorToken
+from app.infrastructure.form_token_signer import FormTokenClaims, FormTokenSigner
+from app.infrastructure.write_coalescer import WriteCoalescer, indicator_drafts
+from app.repositories.indicator_draft_repository import IndicatorDraftRepository
+from app.repositories.indicator_submission_repository import (
+    IndicatorSubmissionRepository,
+)
+from app.repositories.monthly_indicator_repository import MonthlyIndicatorRepository
+from app.repositories.portfolio_snapshot_repository import (
+    PortfolioSnapshotRepository,
+)
 
 
 def _current_period() -> tuple[int, int]:
@@ -25,16 +50,24 @@ def _future_period() -> tuple[int, int]:
 async def future_token(session: AsyncSession, startup_id: str) -> str:
     """Insert a token with a future period directly in the DB, bypassing use-case validation."""
     month, year = _future_period()
-    token_value = uuid.uuid4()
     token = MonthlyIndicatorToken(
         startup_id=uuid.UUID(startup_id),
-        token=token_value,
+        token=uuid.uuid4(),
         month=month,
         year=year,
+        expires_at=datetime.now(timezone.utc) + timedelta(days=1),
     )
     session.add(token)
     await session.flush()
-    return str(token_value)
+    return FormTokenSigner(settings.secret_key).sign(
+        FormTokenClaims(
+            token_id=token.token,
+            startup_id=token.startup_id,
+            month=month,
+            year=year,
+            expires_at=token.expires_at,
+        )
+    )
 
 
 @pytest.mark.asyncio
@@ -162,6 +195,9 @@ async def test_public_submit_updates_existing_indicator(client, startup_id):
     assert len(items) == 1
     assert items[0]["headcount"] == 12
 
+    reload_resp = await client.get(f"/api/monthly-indicator/{token}")
+    assert reload_resp.json()["existing_indicator"]["headcount"] == 12
+
 
 @pytest.mark.asyncio
 async def test_public_invalid_token_returns_404(client):
@@ -270,3 +306,486 @@ async def test_public_submit_oversized_money_returns_422(client, startup_id):
         json={"total_revenue": 99_999_999_999_999_999},
     )
     assert resp.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_issue_tokens_batch(client, startup_id):
+    month, year = _current_period()
+    other = await client.post(
+        "/api/startups",
+        json={
+            "name": "Outra Startup",
+            "sector": "fintech",
+            "investment_date": "2025-06-01",
+            "status": "critico",
+        },
+    )
+    other_id = other.json()["id"]
+    await client.post(
+        f"/api/startups/{startup_id}/monthly-indicator-tokens",
+        json={"month": month, "year": year},
+    )
+
+    resp = await client.post(
+        "/api/monthly-indicator-tokens/batch",
+        json={"month": month, "year": year},
+    )
+    assert resp.status_code == 200
+    data = resp.json()
+    assert [t["startup_id"] for t in data["items"]] == [other_id]
+    assert data["skipped"] == 1
+
+    again = await client.post(
+        "/api/monthly-indicator-tokens/batch",
+        json={"month": month, "year": year, "statuses": ["critico"]},
+    )
+    assert again.json() == {"items": [], "skipped": 1}
+
+
+@pytest.mark.asyncio
+async def test_scheduled_issue_runs_once_and_skips_revoked_tokens(
+    client: AsyncClient, session: AsyncSession, startup_id: str
+):
+    month, year = _current_period()
+    resp = await client.post(
+        "/api/startups",
+        json={"name": "Other", "sector": "saas", "investment_date": "2025-01-01"},
+    )
+    other_id = uuid.UUID(resp.json()["id"])
+    url = f"/api/startups/{startup_id}/monthly-indicator-tokens"
+    revoked = (await client.post(url, json={"month": month, "year": year})).json()
+    await client.delete(f"{url}/{revoked['id']}")
+
+    use_case = IssueMonthlyIndicatorTokens(MonthlyIndicatorRepository(session))
+    created, skipped = await use_case.execute_scheduled(month, year)
+    assert [token.startup_id for token in created] == [other_id]
+    assert skipped == 0
+    assert await use_case.execute_scheduled(month, year) is None
+
+
+@pytest.mark.asyncio
+async def test_public_tampered_token_returns_404(client, startup_id):
+    month, year = _current_period()
+    token_resp = await client.post(
+        f"/api/startups/{startup_id}/monthly-indicator-tokens",
+        json={"month": month, "year": year},
+    )
+    token = token_resp.json()["token"]
+    tampered = token[:10] + ("A" if token[10] != "A" else "B") + token[11:]
+
+    resp = await client.get(f"/api/monthly-indicator/{tampered}")
+    assert resp.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_revoked_token_is_refused_and_can_be_reissued(client, startup_id):
+    month, year = _current_period()
+    url = f"/api/startups/{startup_id}/monthly-indicator-tokens"
+    created = (await client.post(url, json={"month": month, "year": year})).json()
+    assert (
+        await client.get(f"/api/monthly-indicator/{created['token']}")
+    ).status_code == 200
+
+    resp = await client.delete(f"{url}/{created['id']}")
+    assert resp.status_code == 204
+    assert (await client.get(url)).json()["total"] == 0
+
+    reissued = (await client.post(url, json={"month": month, "year": year})).json()
+    assert reissued["id"] != created["id"]
+
+    resp = await client.get(f"/api/monthly-indicator/{created['token']}")
+    assert resp.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_expired_token_is_replaced(
+    client: AsyncClient, session: AsyncSession, startup_id: str
+):
+    month, year = _current_period()
+    resp = await client.post(
+        "/api/startups",
+        json={"name": "Other", "sector": "saas", "investment_date": "2025-01-01"},
+    )
+    other_id = uuid.UUID(resp.json()["id"])
+    expired, other_expired = (
+        MonthlyIndicatorToken(
+            startup_id=owner,
+            month=month,
+            year=year,
+            expires_at=datetime.now(timezone.utc) - timedelta(days=1),
+        )
+        for owner in (uuid.UUID(startup_id), other_id)
+    )
+    session.add_all([expired, other_expired])
+    await session.flush()
+
+    resp = await client.post(
+        f"/api/startups/{startup_id}/monthly-indicator-tokens",
+        json={"month": month, "year": year},
+    )
+    assert resp.status_code == 200
+    assert resp.json()["id"] != str(expired.id)
+
+    await session.refresh(other_expired)
+    assert other_expired.revoked_at is None
+
+
+@pytest.mark.asyncio
+async def test_purge_deletes_only_dead_tokens(session: AsyncSession, startup_id: str):
+    now = datetime.now(timezone.utc)
+    live = MonthlyIndicatorToken(
+        startup_id=uuid.UUID(startup_id),
+        month=1,
+        year=2025,
+        expires_at=now + timedelta(days=1),
+    )
+    expired = MonthlyIndicatorToken(
+        startup_id=uuid.UUID(startup_id),
+        month=2,
+        year=2025,
+        expires_at=now - timedelta(days=1),
+    )
+    revoked = MonthlyIndicatorToken(
+        startup_id=uuid.UUID(startup_id),
+        month=1,
+        year=2025,
+        expires_at=now + timedelta(days=1),
+        revoked_at=now,
+    )
+    session.add_all([live, expired, revoked])
+    await session.flush()
+
+    deleted = await PurgeDeadIndicatorTokens(
+        MonthlyIndicatorRepository(session)
+    ).execute()
+
+    assert deleted == 2
+    remaining = (await session.execute(select(MonthlyIndicatorToken.id))).scalars()
+    assert list(remaining) == [live.id]
+
+
+@pytest.mark.asyncio
+async def test_public_submit_queued_is_applied_in_order(
+    client, session, startup_id, monkeypatch
+):
+    monkeypatch.setattr(settings, "queue_public_submissions", True)
+    month, year = _current_period()
+    token_resp = await client.post(
+        f"/api/startups/{startup_id}/monthly-indicator-tokens",
+        json={"month": month, "year": year},
+    )
+    token = token_resp.json()["token"]
+
+    first = await client.post(
+        f"/api/monthly-indicator/{token}",
+        json={"total_revenue": 1000, "headcount": 5},
+    )
+    second = await client.post(
+        f"/api/monthly-indicator/{token}",
+        json={"headcount": 12, "achievements": "Crescimento forte"},
+    )
+    assert first.status_code == 202
+    assert second.status_code == 202
+    resp = await client.get(f"/api/startups/{startup_id}/monthly-indicators")
+    assert resp.json()["items"] == []
+
+    apply = ApplyQueuedIndicatorSubmissions(
+        IndicatorSubmissionRepository(session),
+        MonthlyIndicatorRepository(session),
+        PortfolioSnapshotRepository(session),
+        IndicatorDraftRepository(session),
+    )
+    assert (await apply.execute()).count == 2
+    await session.commit()
+    assert (await apply.execute()).count == 0
+
+    resp = await client.get(f"/api/startups/{startup_id}/monthly-indicators")
+    [item] = resp.json()["items"]
+    assert float(item["total_revenue"]) == 1000.0
+    assert item["headcount"] == 12
+    assert item["achievements"] == "Crescimento forte"
+
+
+@pytest.mark.asyncio
+async def test_queued_submissions_apply_by_submission_time(
+    client, session, startup_id, monkeypatch
+):
+    monkeypatch.setattr(settings, "queue_public_submissions", True)
+    month, year = _current_period()
+    token_resp = await client.post(
+        f"/api/startups/{startup_id}/monthly-indicator-tokens",
+        json={"month": month, "year": year},
+    )
+    token = token_resp.json()["token"]
+    for headcount in (1, 2):
+        await client.post(
+            f"/api/monthly-indicator/{token}", json={"headcount": headcount}
+        )
+    # The first row by id was submitted last, e.g. by a worker with a lagging
+    # transaction start.
+    now = datetime.now(timezone.utc)
+    submissions = await IndicatorSubmissionRepository(session).get_oldest(10)
+    first, second = sorted(submissions, key=lambda submission: submission.id)
+    first.submitted_at = now - timedelta(minutes=1)
+    second.submitted_at = now - timedelta(minutes=2)
+    await session.commit()
+
+    apply = ApplyQueuedIndicatorSubmissions(
+        IndicatorSubmissionRepository(session),
+        MonthlyIndicatorRepository(session),
+        PortfolioSnapshotRepository(session),
+        IndicatorDraftRepository(session),
+    )
+    applied = await apply.execute()
+    assert applied.count == 2
+    assert applied.superseded == []
+    await session.commit()
+    resp = await client.get(f"/api/startups/{startup_id}/monthly-indicators")
+    assert resp.json()["items"][0]["headcount"] == 1
+
+    # A submission older than a direct write does not overwrite it.
+    await client.post(f"/api/monthly-indicator/{token}", json={"headcount": 3})
+    [stale] = await IndicatorSubmissionRepository(session).get_oldest(10)
+    stale.submitted_at = now - timedelta(minutes=1)
+    await session.commit()
+    monkeypatch.setattr(settings, "queue_public_submissions", False)
+    await client.post(f"/api/monthly-indicator/{token}", json={"headcount": 9})
+
+    applied = await apply.execute()
+    assert applied.count == 1
+    assert applied.superseded == [(uuid.UUID(startup_id), month, year)]
+    await session.commit()
+    resp = await client.get(f"/api/startups/{startup_id}/monthly-indicators")
+    assert resp.json()["items"][0]["headcount"] == 9
+
+
+@pytest.mark.asyncio
+async def test_queued_submission_merges_around_later_writes(
+    client, session, startup_id, monkeypatch
+):
+    monkeypatch.setattr(settings, "queue_public_submissions", True)
+    month, year = _current_period()
+    token_resp = await client.post(
+        f"/api/startups/{startup_id}/monthly-indicator-tokens",
+        json={"month": month, "year": year},
+    )
+    token = token_resp.json()["token"]
+    await client.post(
+        f"/api/monthly-indicator/{token}",
+        json={"total_revenue": 1000, "headcount": 5},
+    )
+    [queued] = await IndicatorSubmissionRepository(session).get_oldest(10)
+    submitted_at = datetime.now(timezone.utc) - timedelta(minutes=1)
+    queued.submitted_at = submitted_at
+    await session.commit()
+    # An analyst then saves only the comments of the same period.
+    await client.post(
+        f"/api/startups/{startup_id}/monthly-indicators",
+        json={"month": month, "year": year, "comments": "Revisado"},
+    )
+
+    apply = ApplyQueuedIndicatorSubmissions(
+        IndicatorSubmissionRepository(session),
+        MonthlyIndicatorRepository(session),
+        PortfolioSnapshotRepository(session),
+        IndicatorDraftRepository(session),
+    )
+    applied = await apply.execute()
+    assert applied.count == 1
+    assert applied.superseded == []
+    await session.commit()
+
+    resp = await client.get(f"/api/startups/{startup_id}/monthly-indicators")
+    [item] = resp.json()["items"]
+    assert float(item["total_revenue"]) == 1000.0
+    assert item["headcount"] == 5
+    assert item["comments"] == "Revisado"
+
+    # A submission into a period not written since sets its own time.
+    await client.post(f"/api/monthly-indicator/{token}", json={"headcount": 6})
+    [queued] = await IndicatorSubmissionRepository(session).get_oldest(10)
+    later = datetime.now(timezone.utc) + timedelta(minutes=1)
+    queued.submitted_at = later
+    await session.commit()
+    await apply.execute()
+    await session.commit()
+    updated_at = await MonthlyIndicatorRepository(session).get_updated_at(
+        [(uuid.UUID(startup_id), month, year)]
+    )
+    assert list(updated_at.values())[0].replace(tzinfo=None) == later.replace(
+        tzinfo=None
+    )
+
+
+@pytest.mark.asyncio
+async def test_public_submit_queued_with_revoked_token_returns_404(
+    client, startup_id, monkeypatch
+):
+    monkeypatch.setattr(settings, "queue_public_submissions", True)
+    month, year = _current_period()
+    token_resp = await client.post(
+        f"/api/startups/{startup_id}/monthly-indicator-tokens",
+        json={"month": month, "year": year},
+    )
+    revoke = await client.delete(
+        f"/api/startups/{startup_id}/monthly-indicator-tokens/{token_resp.json()['id']}"
+    )
+    assert revoke.status_code == 204
+
+    resp = await client.post(
+        f"/api/monthly-indicator/{token_resp.json()['token']}",
+        json={"headcount": 3},
+    )
+    assert resp.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_public_draft_is_coalesced_flushed_and_replaced_by_submit(
+    client, session, startup_id
+):
+    month, year = _current_period()
+    token_resp = await client.post(
+        f"/api/startups/{startup_id}/monthly-indicator-tokens",
+        json={"month": month, "year": year},
+    )
+    token = token_resp.json()["token"]
+
+    for headcount in (1, 2, 3):
+        resp = await client.put(
+            f"/api/monthly-indicator/{token}/draft",
+            json={"headcount": headcount, "achievements": "Rascunho"},
+        )
+        assert resp.status_code == 202
+    assert len(indicator_drafts) == 1
+    form = await client.get(f"/api/monthly-indicator/{token}")
+    assert form.json()["draft"]["headcount"] == 3
+
+    flush = FlushIndicatorDrafts(
+        IndicatorDraftRepository(session), MonthlyIndicatorRepository(session)
+    )
+    assert await flush.execute(indicator_drafts.drain()) == 1
+    await session.commit()
+    form = await client.get(f"/api/monthly-indicator/{token}")
+    assert form.json()["draft"]["headcount"] == 3
+    assert form.json()["draft"]["achievements"] == "Rascunho"
+
+    await client.put(f"/api/monthly-indicator/{token}/draft", json={"headcount": 4})
+    resp = await client.post(f"/api/monthly-indicator/{token}", json={"headcount": 5})
+    assert resp.status_code == 204
+    assert len(indicator_drafts) == 0
+    form = await client.get(f"/api/monthly-indicator/{token}")
+    assert form.json()["existing_indicator"]["headcount"] == 5
+    assert form.json()["draft"] is None
+
+
+@pytest.mark.asyncio
+async def test_public_draft_with_revoked_token_returns_404(client, startup_id):
+    month, year = _current_period()
+    token_resp = await client.post(
+        f"/api/startups/{startup_id}/monthly-indicator-tokens",
+        json={"month": month, "year": year},
+    )
+    await client.delete(
+        f"/api/startups/{startup_id}/monthly-indicator-tokens/{token_resp.json()['id']}"
+    )
+
+    resp = await client.put(
+        f"/api/monthly-indicator/{token_resp.json()['token']}/draft",
+        json={"headcount": 3},
+    )
+    assert resp.status_code == 404
+    assert len(indicator_drafts) == 0
+
+
+@pytest.mark.asyncio
+async def test_public_draft_returns_503_when_buffer_is_full(
+    client, startup_id, monkeypatch
+):
+    monkeypatch.setattr(
+        monthly_indicator_controller, "indicator_drafts", WriteCoalescer(0)
+    )
+    month, year = _current_period()
+    token_resp = await client.post(
+        f"/api/startups/{startup_id}/monthly-indicator-tokens",
+        json={"month": month, "year": year},
+    )
+
+    resp = await client.put(
+        f"/api/monthly-indicator/{token_resp.json()['token']}/draft",
+        json={"headcount": 3},
+    )
+    assert resp.status_code == 503
+    assert resp.headers["retry-after"] == str(
+        settings.indicator_draft_flush_interval_seconds
+    )
+
+
+@pytest.mark.asyncio
+async def test_submit_drops_drafts_saved_or_buffered_elsewhere(
+    client, session, startup_id
+):
+    month, year = _current_period()
+    token_resp = await client.post(
+        f"/api/startups/{startup_id}/monthly-indicator-tokens",
+        json={"month": month, "year": year},
+    )
+    token = token_resp.json()["token"]
+    await client.put(f"/api/monthly-indicator/{token}/draft", json={"headcount": 1})
+    flush = FlushIndicatorDrafts(
+        IndicatorDraftRepository(session), MonthlyIndicatorRepository(session)
+    )
+    assert await flush.execute(indicator_drafts.drain()) == 1
+    await session.commit()
+
+    # Another worker buffered an autosave before the submit and flushes after.
+    await client.put(f"/api/monthly-indicator/{token}/draft", json={"headcount": 2})
+    other_worker = indicator_drafts.drain()
+    for row in other_worker.values():
+        row["updated_at"] -= timedelta(minutes=1)
+
+    resp = await client.post(f"/api/monthly-indicator/{token}", json={"headcount": 5})
+    assert resp.status_code == 204
+    draft_repo = IndicatorDraftRepository(session)
+    assert await draft_repo.get(uuid.UUID(startup_id), month, year) is None
+
+    assert await flush.execute(other_worker) == 0
+    await session.commit()
+    assert await draft_repo.get(uuid.UUID(startup_id), month, year) is None
+
+
+@pytest.mark.asyncio
+async def test_public_autosaves_reuse_the_checked_link_until_revoked(
+    client, startup_id, monkeypatch
+):
+    month, year = _current_period()
+    token_resp = await client.post(
+        f"/api/startups/{startup_id}/monthly-indicator-tokens",
+        json={"month": month, "year": year},
+    )
+    token = token_resp.json()["token"]
+    lookups = []
+    resolve = MonthlyIndicatorRepository.get_public_form
+
+    async def counting_resolve(self, token_id):  # noqa: ANN001, ANN202
+        lookups.append(token_id)
+        return await resolve(self, token_id)
+
+    monkeypatch.setattr(MonthlyIndicatorRepository, "get_public_form", counting_resolve)
+
+    for headcount in (1, 2, 3):
+        resp = await client.put(
+            f"/api/monthly-indicator/{token}/draft", json={"headcount": headcount}
+        )
+        assert resp.status_code == 202
+    form = await client.get(f"/api/monthly-indicator/{token}")
+    assert form.json()["draft"]["headcount"] == 3
+    assert len(lookups) == 1
+
+    await client.delete(
+        f"/api/startups/{startup_id}/monthly-indicator-tokens/{token_resp.json()['id']}"
+    )
+    resp = await client.put(
+        f"/api/monthly-indicator/{token}/draft", json={"headcount": 4}
+    )
+    assert resp.status_code == 404
+    indicator_drafts.drain()
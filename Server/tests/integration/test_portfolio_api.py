@@ -1,7 +1,24 @@
+import csv
+import io
+import json
+import uuid
 from datetime import date
+from decimal import Decimal
 
 import pytest
 
+from app.application.monthly_indicator.create_monthly_indicator import (
+    CreateMonthlyIndicator,
+)
+from app.application.portfolio.get_portfolio_summary import GetPortfolioSummary
+from app.config import settings
+from app.domain.models.monthly_indicator import MonthlyIndicator
+from app.repositories.monthly_indicator_repository import MonthlyIndicatorRepository
+from app.repositories.portfolio_repository import PortfolioRepository
+from app.repositories.portfolio_snapshot_repository import (
+    PortfolioSnapshotRepository,
+)
+
 
 @pytest.mark.asyncio
 async def test_monitoring_summary_empty(client):
@@ -15,7 +32,7 @@ async def test_monitoring_summary_empty(client):
     assert data["revenue_variation_direction"] == "neutral"
     assert data["monthly_report_pct"] == 0.0
     assert data["routines_up_to_date_pct"] == 0.0
-    assert data["startups"] == []
+    assert "startups" not in data
 
 
 @pytest.mark.asyncio
@@ -45,7 +62,10 @@ async def test_monitoring_summary_with_startups(client):
     assert data["total_startups"] == 2
     assert data["health"]["healthy"] == 1
     assert data["health"]["warning"] == 1
-    assert len(data["startups"]) == 2
+
+    resp = await client.get("/api/portfolio/startups")
+    assert resp.status_code == 200
+    assert len(resp.json()["items"]) == 2
 
 
 @pytest.mark.asyncio
@@ -89,7 +109,9 @@ async def test_monitoring_summary_with_indicators(client):
     assert float(data["revenue"]) == 120000
     assert data["revenue_variation_pct"] == 20.0
     assert data["revenue_variation_direction"] == "up"
-    startup_item = data["startups"][0]
+
+    resp = await client.get("/api/portfolio/startups?month=2&year=2026")
+    startup_item = resp.json()["items"][0]
     assert float(startup_item["total_revenue"]) == 120000
     assert startup_item["headcount"] == 18
 
@@ -144,3 +166,580 @@ async def test_monitoring_summary_should_return_400_with_future_period(client):
     )
     assert resp.status_code == 400
     assert "nao pode ser no futuro" in resp.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_monitoring_summary_coverage(client):
+    reported_resp = await client.post(
+        "/api/startups",
+        json={
+            "name": "Startup Reported",
+            "sector": "saas",
+            "investment_date": "2025-01-01",
+        },
+    )
+    reported_id = reported_resp.json()["id"]
+    await client.post(
+        "/api/startups",
+        json={
+            "name": "Startup Silent",
+            "sector": "saas",
+            "investment_date": "2025-01-01",
+            "status": "critico",
+        },
+    )
+
+    await client.post(
+        f"/api/startups/{reported_id}/monthly-indicators",
+        json={"month": 3, "year": 2026, "total_revenue": 50000},
+    )
+    await client.post(
+        f"/api/startups/{reported_id}/board-meetings",
+        json={"meeting_date": "2026-02-10"},
+    )
+
+    resp = await client.get("/api/portfolio/summary?month=3&year=2026")
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["total_startups"] == 2
+    assert data["health"] == {"healthy": 1, "warning": 0, "critical": 1}
+    assert float(data["revenue"]) == 50000
+    assert data["monthly_report_pct"] == 50.0
+    assert data["routines_up_to_date_pct"] == 50.0
+
+    resp = await client.get("/api/portfolio/startups?month=3&year=2026")
+    by_name = {item["startup"]["name"]: item for item in resp.json()["items"]}
+    assert float(by_name["Startup Reported"]["total_revenue"]) == 50000
+    assert by_name["Startup Silent"]["total_revenue"] is None
+
+
+@pytest.mark.asyncio
+async def test_monitoring_summary_reflects_writes_after_snapshot(client):
+    startup_resp = await client.post(
+        "/api/startups",
+        json={
+            "name": "Startup Snapshot",
+            "sector": "saas",
+            "investment_date": "2025-01-01",
+        },
+    )
+    startup_id = startup_resp.json()["id"]
+
+    resp = await client.get("/api/portfolio/summary?month=2&year=2026")
+    assert float(resp.json()["revenue"]) == 0
+
+    await client.post(
+        f"/api/startups/{startup_id}/monthly-indicators",
+        json={"month": 2, "year": 2026, "total_revenue": 110000},
+    )
+    resp = await client.get("/api/portfolio/summary?month=2&year=2026")
+    assert float(resp.json()["revenue"]) == 110000
+    assert resp.json()["revenue_variation_pct"] is None
+
+    await client.post(
+        f"/api/startups/{startup_id}/monthly-indicators",
+        json={"month": 1, "year": 2026, "total_revenue": 100000},
+    )
+    resp = await client.get("/api/portfolio/summary?month=2&year=2026")
+    assert resp.json()["revenue_variation_pct"] == 10.0
+    assert resp.json()["routines_up_to_date_pct"] == 0.0
+
+    await client.post(
+        f"/api/startups/{startup_id}/board-meetings",
+        json={"meeting_date": "2026-01-20"},
+    )
+    resp = await client.get("/api/portfolio/summary?month=2&year=2026")
+    assert resp.json()["routines_up_to_date_pct"] == 100.0
+
+    await client.patch(f"/api/startups/{startup_id}", json={"status": "critico"})
+    resp = await client.get("/api/portfolio/summary?month=2&year=2026")
+    assert resp.json()["health"]["critical"] == 1
+
+
+@pytest.mark.asyncio
+async def test_monitoring_summary_cached_response_tracks_startup_changes(client):
+    startup_resp = await client.post(
+        "/api/startups",
+        json={
+            "name": "Startup Cached",
+            "sector": "saas",
+            "investment_date": "2025-01-01",
+        },
+    )
+    startup_id = startup_resp.json()["id"]
+
+    first = await client.get("/api/portfolio/summary?month=2&year=2026")
+    second = await client.get("/api/portfolio/summary?month=2&year=2026")
+    assert first.status_code == second.status_code == 200
+    assert first.content == second.content
+    assert second.headers["content-type"] == "application/json"
+
+    await client.patch(f"/api/startups/{startup_id}", json={"status": "atencao"})
+    resp = await client.get("/api/portfolio/summary?month=2&year=2026")
+    assert resp.json()["health"] == {"healthy": 0, "warning": 1, "critical": 0}
+
+
+@pytest.mark.asyncio
+async def test_monitoring_summary_should_return_304_while_snapshot_is_current(
+    client,
+):
+    first = await client.get("/api/portfolio/summary?month=2&year=2026")
+    etag = first.headers["etag"]
+
+    resp = await client.get(
+        "/api/portfolio/summary?month=2&year=2026", headers={"If-None-Match": etag}
+    )
+    assert resp.status_code == 304
+
+    await client.post(
+        "/api/startups",
+        json={"name": "Fresh", "sector": "saas", "investment_date": "2025-01-01"},
+    )
+    resp = await client.get(
+        "/api/portfolio/summary?month=2&year=2026", headers={"If-None-Match": etag}
+    )
+    assert resp.status_code == 200
+    assert resp.json()["total_startups"] == 1
+
+
+@pytest.mark.asyncio
+async def test_portfolio_startups_should_return_304_until_indicators_change(client):
+    await _create_startups_with_revenue(client, {"Only": None})
+    first = await client.get("/api/portfolio/startups?month=1&year=2026")
+    etag = first.headers["etag"]
+
+    resp = await client.get(
+        "/api/portfolio/startups?month=1&year=2026", headers={"If-None-Match": etag}
+    )
+    assert resp.status_code == 304
+
+    startup_id = first.json()["items"][0]["startup"]["id"]
+    await client.post(
+        f"/api/startups/{startup_id}/monthly-indicators",
+        json={"month": 1, "year": 2026, "total_revenue": 1000},
+    )
+    resp = await client.get(
+        "/api/portfolio/startups?month=1&year=2026", headers={"If-None-Match": etag}
+    )
+    assert resp.status_code == 200
+
+
+async def _create_startups_with_revenue(client, revenues):
+    for name, revenue in revenues.items():
+        resp = await client.post(
+            "/api/startups",
+            json={"name": name, "sector": "saas", "investment_date": "2025-01-01"},
+        )
+        if revenue is not None:
+            await client.post(
+                f"/api/startups/{resp.json()['id']}/monthly-indicators",
+                json={"month": 1, "year": 2026, "total_revenue": revenue},
+            )
+
+
+@pytest.mark.asyncio
+async def test_portfolio_startups_pages_by_name(client):
+    await _create_startups_with_revenue(
+        client, {"Charlie": None, "Alpha": None, "Bravo": None}
+    )
+
+    resp = await client.get("/api/portfolio/startups?month=1&year=2026&limit=2")
+    assert resp.status_code == 200
+    page = resp.json()
+    assert [i["startup"]["name"] for i in page["items"]] == ["Alpha", "Bravo"]
+    assert page["next_cursor"] is not None
+
+    resp = await client.get(
+        "/api/portfolio/startups",
+        params={"month": 1, "year": 2026, "limit": 2, "cursor": page["next_cursor"]},
+    )
+    page = resp.json()
+    assert [i["startup"]["name"] for i in page["items"]] == ["Charlie"]
+    assert page["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_portfolio_startups_sorts_by_metric_with_nulls_last(client):
+    await _create_startups_with_revenue(
+        client, {"Low": 100, "Missing": None, "High": 300, "Mid": 200}
+    )
+
+    names = []
+    cursor = None
+    while True:
+        params = {
+            "month": 1,
+            "year": 2026,
+            "sort": "total_revenue",
+            "order": "desc",
+            "limit": 1,
+        }
+        if cursor:
+            params["cursor"] = cursor
+        page = (await client.get("/api/portfolio/startups", params=params)).json()
+        names += [i["startup"]["name"] for i in page["items"]]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert names == ["High", "Mid", "Low", "Missing"]
+
+
+@pytest.mark.asyncio
+async def test_portfolio_startups_should_return_400_with_invalid_cursor(client):
+    resp = await client.get("/api/portfolio/startups?cursor=not-a-cursor")
+    assert resp.status_code == 400
+    assert "Cursor invalido" in resp.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_portfolio_analytics(client):
+    indicators = {
+        "Burning": [
+            (1, 2025, {"total_revenue": 50000}),
+            (12, 2025, {"total_revenue": 80000}),
+            (
+                1,
+                2026,
+                {
+                    "total_revenue": 100000,
+                    "gross_margin_pct": 60,
+                    "cash_balance": 600000,
+                    "ebitda_burn": -50000,
+                },
+            ),
+        ],
+        "Profitable": [
+            (12, 2025, {"total_revenue": 100000}),
+            (
+                1,
+                2026,
+                {"total_revenue": 110000, "gross_margin_pct": 40, "ebitda_burn": 5000},
+            ),
+        ],
+    }
+    for name, rows in indicators.items():
+        resp = await client.post(
+            "/api/startups",
+            json={"name": name, "sector": "saas", "investment_date": "2025-01-01"},
+        )
+        for month, year, values in rows:
+            await client.post(
+                f"/api/startups/{resp.json()['id']}/monthly-indicators",
+                json={"month": month, "year": year, **values},
+            )
+
+    resp = await client.get("/api/portfolio/analytics?month=1&year=2026")
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["reported"] == 2
+    assert data["gross_margin_revenue"] == 104000.0
+    assert data["weighted_gross_margin_pct"] == 49.5
+    assert data["revenue_growth_mom"]["count"] == 2
+    assert data["revenue_growth_mom"]["median"] == 17.5
+    assert data["revenue_growth_yoy"]["count"] == 1
+    assert data["revenue_growth_yoy"]["median"] == 100.0
+    assert data["runway_months"]["median"] == 12.0
+    assert data["burn_multiple"]["median"] == 2.5
+
+
+async def _create_export_fixture(client):
+    alpha = await client.post(
+        "/api/startups",
+        json={"name": "Alpha", "sector": "saas", "investment_date": "2025-01-01"},
+    )
+    await client.post(
+        "/api/startups",
+        json={"name": "Quiet", "sector": "fintech", "investment_date": "2025-02-01"},
+    )
+    alpha_id = alpha.json()["id"]
+    for month, revenue in ((1, 1000), (2, 1500)):
+        await client.post(
+            f"/api/startups/{alpha_id}/monthly-indicators",
+            json={"month": month, "year": 2026, "total_revenue": revenue},
+        )
+    await client.post(
+        f"/api/startups/{alpha_id}/board-meetings",
+        json={"meeting_date": "2026-02-10", "summary": "Q1 review"},
+    )
+    return alpha_id
+
+
+@pytest.mark.asyncio
+async def test_portfolio_export_csv(client):
+    alpha_id = await _create_export_fixture(client)
+
+    resp = await client.get("/api/portfolio/export")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/csv")
+    assert "portfolio-export.csv" in resp.headers["content-disposition"]
+
+    rows = list(csv.DictReader(io.StringIO(resp.text)))
+    alpha_rows = [r for r in rows if r["startup_name"] == "Alpha"]
+    assert [(r["month"], r["total_revenue"]) for r in alpha_rows] == [
+        ("1", "1000.00"),
+        ("2", "1500.00"),
+    ]
+    assert alpha_rows[0]["startup_id"] == alpha_id
+    quiet = [r for r in rows if r["startup_name"] == "Quiet"]
+    assert len(quiet) == 1
+    assert quiet[0]["month"] == ""
+
+
+@pytest.mark.asyncio
+async def test_portfolio_export_ndjson_with_board_meetings(client):
+    await _create_export_fixture(client)
+
+    resp = await client.get(
+        "/api/portfolio/export?format=ndjson&include_board_meetings=true"
+    )
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+
+    documents = {
+        doc["startup_name"]: doc
+        for doc in (json.loads(line) for line in resp.text.splitlines())
+    }
+    alpha = documents["Alpha"]
+    assert alpha["status"] == "saudavel"
+    assert [i["month"] for i in alpha["monthly_indicators"]] == [1, 2]
+    assert alpha["board_meetings"] == [
+        {
+            "meeting_date": "2026-02-10",
+            "participants": None,
+            "summary": "Q1 review",
+            "attention_points": None,
+            "next_steps": None,
+        }
+    ]
+    assert documents["Quiet"]["monthly_indicators"] == []
+    assert documents["Quiet"]["board_meetings"] == []
+
+
+@pytest.mark.asyncio
+async def test_soft_deleted_startup_is_left_out_of_series_and_export(
+    client, monkeypatch
+):
+    monkeypatch.setattr(settings, "soft_delete_startups", True)
+    alpha_id = await _create_export_fixture(client)
+    assert (await client.delete(f"/api/startups/{alpha_id}")).status_code == 204
+
+    resp = await client.get("/api/portfolio/timeseries?from=2026-01&to=2026-02")
+    for point in resp.json()["points"]:
+        assert point["reported"] == 0
+        assert float(point["revenue"]) == 0
+
+    resp = await client.get(
+        "/api/portfolio/export?format=ndjson&include_board_meetings=true"
+    )
+    documents = [json.loads(line) for line in resp.text.splitlines()]
+    assert [doc["startup_name"] for doc in documents] == ["Quiet"]
+    assert documents[0]["board_meetings"] == []
+
+
+@pytest.mark.asyncio
+async def test_portfolio_export_should_return_400_for_csv_with_board_meetings(
+    client,
+):
+    resp = await client.get("/api/portfolio/export?include_board_meetings=true")
+    assert resp.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_portfolio_cohorts(client):
+    startups = [
+        ("Old SaaS", "saas", "2024-03-01", 1000, 10),
+        ("New SaaS", "saas", "2025-06-01", 500, 5),
+        ("New Fintech", "fintech", "2025-09-01", None, None),
+    ]
+    for name, sector, invested, revenue, headcount in startups:
+        resp = await client.post(
+            "/api/startups",
+            json={"name": name, "sector": sector, "investment_date": invested},
+        )
+        if revenue is not None:
+            await client.post(
+                f"/api/startups/{resp.json()['id']}/monthly-indicators",
+                json={
+                    "month": 1,
+                    "year": 2026,
+                    "total_revenue": revenue,
+                    "headcount": headcount,
+                },
+            )
+
+    resp = await client.get("/api/portfolio/cohorts?from=2025-12&to=2026-01")
+    assert resp.status_code == 200
+    cohorts = {(c["dimension"], c["cohort"]): c for c in resp.json()["cohorts"]}
+    assert list(cohorts) == [
+        ("total", None),
+        ("vintage", "2024"),
+        ("vintage", "2025"),
+        ("sector", "fintech"),
+        ("sector", "saas"),
+    ]
+
+    total = cohorts[("total", None)]
+    assert total["startups"] == 3
+    assert [(p["month"], p["reported"]) for p in total["points"]] == [(12, 0), (1, 2)]
+    assert float(total["points"][1]["revenue"]) == 1500
+
+    vintage_2025 = cohorts[("vintage", "2025")]["points"][1]
+    assert float(vintage_2025["revenue"]) == 500
+    assert vintage_2025["monthly_report_pct"] == 50.0
+
+    saas = cohorts[("sector", "saas")]["points"][1]
+    assert saas["headcount"] == 15
+    assert saas["monthly_report_pct"] == 100.0
+    assert cohorts[("sector", "fintech")]["points"][1]["reported"] == 0
+
+
+@pytest.mark.asyncio
+async def test_portfolio_timeseries(client):
+    ids = []
+    for name in ("Series A", "Series B"):
+        resp = await client.post(
+            "/api/startups",
+            json={"name": name, "sector": "saas", "investment_date": "2025-01-01"},
+        )
+        ids.append(resp.json()["id"])
+
+    await client.post(
+        f"/api/startups/{ids[0]}/monthly-indicators",
+        json={
+            "month": 1,
+            "year": 2026,
+            "total_revenue": 100000,
+            "cash_balance": 400000,
+            "ebitda_burn": -20000,
+            "headcount": 10,
+        },
+    )
+    await client.post(
+        f"/api/startups/{ids[1]}/monthly-indicators",
+        json={"month": 1, "year": 2026, "total_revenue": 50000, "headcount": 5},
+    )
+    await client.post(
+        f"/api/startups/{ids[0]}/monthly-indicators",
+        json={"month": 3, "year": 2026, "total_revenue": 120000},
+    )
+
+    resp = await client.get("/api/portfolio/timeseries?from=2025-12&to=2026-03")
+    assert resp.status_code == 200
+    points = resp.json()["points"]
+    assert [(p["month"], p["year"]) for p in points] == [
+        (12, 2025),
+        (1, 2026),
+        (2, 2026),
+        (3, 2026),
+    ]
+    assert float(points[0]["revenue"]) == 0
+    assert points[0]["monthly_report_pct"] == 0.0
+    assert float(points[1]["revenue"]) == 150000
+    assert float(points[1]["cash_balance"]) == 400000
+    assert float(points[1]["ebitda_burn"]) == -20000
+    assert points[1]["headcount"] == 15
+    assert points[1]["reported"] == 2
+    assert points[1]["monthly_report_pct"] == 100.0
+    assert points[3]["monthly_report_pct"] == 50.0
+
+
+@pytest.mark.asyncio
+async def test_portfolio_timeseries_defaults_to_last_twelve_months(client):
+    resp = await client.get("/api/portfolio/timeseries")
+    assert resp.status_code == 200
+    points = resp.json()["points"]
+    today = date.today()
+    assert len(points) == 12
+    assert (points[-1]["month"], points[-1]["year"]) == (today.month, today.year)
+
+
+@pytest.mark.asyncio
+async def test_portfolio_timeseries_should_return_400_with_inverted_range(client):
+    resp = await client.get("/api/portfolio/timeseries?from=2026-03&to=2026-01")
+    assert resp.status_code == 400
+    assert "anterior" in resp.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_portfolio_timeseries_should_return_400_with_malformed_period(client):
+    resp = await client.get("/api/portfolio/timeseries?from=jan&to=2026-01")
+    assert resp.status_code == 400
+    assert "YYYY-MM" in resp.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_portfolio_compliance(client):
+    resp = await client.post(
+        "/api/startups",
+        json={"name": "Alpha", "sector": "saas", "investment_date": "2025-06-01"},
+    )
+    alpha_id = resp.json()["id"]
+    resp = await client.post(
+        "/api/startups",
+        json={"name": "Beta", "sector": "saas", "investment_date": "2026-02-10"},
+    )
+    beta_id = resp.json()["id"]
+    await client.post(
+        f"/api/startups/{alpha_id}/monthly-indicators",
+        json={"month": 1, "year": 2026, "headcount": 3},
+    )
+    await client.post(
+        f"/api/startups/{beta_id}/monthly-indicator-tokens",
+        json={"month": 2, "year": 2026},
+    )
+
+    resp = await client.get("/api/portfolio/compliance?from=2025-12&to=2026-02")
+    assert resp.status_code == 200
+    body = resp.json()
+    assert [(p["month"], p["year"]) for p in body["periods"]] == [
+        (12, 2025),
+        (1, 2026),
+        (2, 2026),
+    ]
+    assert [(s["name"], s["cells"], s["missing"]) for s in body["startups"]] == [
+        ("Alpha", ["missing", "reported", "missing"], 2),
+        ("Beta", [None, None, "pending"], 0),
+    ]
+
+    resp = await client.get(
+        "/api/portfolio/compliance?from=2025-12&to=2026-02&missing_only=true"
+    )
+    assert [s["startup_id"] for s in resp.json()["startups"]] == [alpha_id]
+
+
+@pytest.mark.asyncio
+async def test_summary_rebuild_interleaved_with_a_write_is_not_kept(
+    client, session, startup_id
+):
+    class WriteAfterCompute(PortfolioRepository):
+        async def get_period_aggregates(self, *args):
+            aggregates = await super().get_period_aggregates(*args)
+            # A write lands, and commits, between the compute and the save.
+            await CreateMonthlyIndicator(
+                MonthlyIndicatorRepository(session),
+                PortfolioSnapshotRepository(session),
+            ).execute(
+                MonthlyIndicator(
+                    startup_id=uuid.UUID(startup_id),
+                    month=1,
+                    year=2026,
+                    total_revenue=Decimal("500"),
+                )
+            )
+            await session.commit()
+            return aggregates
+
+    racing = GetPortfolioSummary(
+        WriteAfterCompute(session), PortfolioSnapshotRepository(session)
+    )
+    stale = await racing.get_snapshot(month=1, year=2026)
+    stale_version = stale.version
+    assert stale.reported == 0
+
+    fresh = await GetPortfolioSummary(
+        PortfolioRepository(session), PortfolioSnapshotRepository(session)
+    ).get_snapshot(month=1, year=2026)
+
+    assert fresh.reported == 1
+    assert fresh.version != stale_version
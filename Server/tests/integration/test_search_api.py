@@ -0,0 +1,46 @@
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_search_across_entities_with_pagination(client, startup_id):
+    await client.post(
+        f"/api/startups/{startup_id}/board-meetings",
+        json={"meeting_date": "2026-02-10", "attention_points": "Risco de CHURN alto"},
+    )
+    await client.post(
+        f"/api/startups/{startup_id}/monthly-indicators",
+        json={"month": 1, "year": 2026, "challenges": "Churn em clientes SMB"},
+    )
+    await client.post(
+        "/api/deals", json={"company": "Retem", "notes": "Reduz churn de SaaS"}
+    )
+    await client.post("/api/deals", json={"company": "Outra", "notes": "Sem relacao"})
+
+    resp = await client.get("/api/search", params={"q": "churn", "limit": 2})
+    assert resp.status_code == 200
+    first = resp.json()
+    assert len(first["items"]) == 2
+    assert first["next_cursor"] is not None
+
+    resp = await client.get(
+        "/api/search", params={"q": "churn", "limit": 2, "cursor": first["next_cursor"]}
+    )
+    second = resp.json()
+    assert second["next_cursor"] is None
+    items = first["items"] + second["items"]
+    assert sorted(item["kind"] for item in items) == [
+        "board_meeting",
+        "deal",
+        "monthly_indicator",
+    ]
+    by_kind = {item["kind"]: item for item in items}
+    assert by_kind["board_meeting"]["title"] == "Test Startup"
+    assert by_kind["board_meeting"]["startup_id"] == startup_id
+    assert by_kind["deal"]["startup_id"] is None
+    assert "churn" in by_kind["deal"]["snippet"]
+
+
+@pytest.mark.asyncio
+async def test_search_should_return_400_with_short_query(client):
+    resp = await client.get("/api/search", params={"q": " a "})
+    assert resp.status_code == 400
@@ -2,6 +2,18 @@ import uuid
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.startup.purge_deleted_startups import PurgeDeletedStartups
+from app.config import settings
+from app.controllers import dependencies
+from app.domain.models.monthly_indicator import MonthlyIndicator
+from app.domain.models.startup import Startup
+from app.repositories.portfolio_snapshot_repository import (
+    PortfolioSnapshotRepository,
+)
+from app.repositories.startup_repository import StartupRepository
 
 
 @pytest.mark.asyncio
@@ -113,3 +125,249 @@ async def test_delete_startup(client: AsyncClient):
 
     get_resp = await client.get(f"/api/startups/{startup_id}")
     assert get_resp.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_list_startups_should_return_304_until_collection_changes(client):
+    first = await client.get("/api/startups")
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"] == "private, no-cache"
+
+    resp = await client.get("/api/startups", headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+    assert resp.content == b""
+    assert resp.headers["etag"] == etag
+
+    await client.post(
+        "/api/startups",
+        json={"name": "New", "sector": "tech", "investment_date": "2026-01-15"},
+    )
+    resp = await client.get("/api/startups", headers={"If-None-Match": etag})
+    assert resp.status_code == 200
+    assert resp.json()["total"] == 1
+    assert resp.headers["etag"] != etag
+
+
+@pytest.mark.asyncio
+async def test_get_startup_should_honor_if_modified_since(client, startup_id):
+    first = await client.get(f"/api/startups/{startup_id}")
+    last_modified = first.headers["last-modified"]
+
+    resp = await client.get(
+        f"/api/startups/{startup_id}", headers={"If-Modified-Since": last_modified}
+    )
+    assert resp.status_code == 304
+
+    resp = await client.get(
+        f"/api/startups/{startup_id}",
+        headers={"If-Modified-Since": "Mon, 01 Jan 2001 00:00:00 GMT"},
+    )
+    assert resp.status_code == 200
+
+
+async def _create_filter_fixture(client: AsyncClient) -> None:
+    startups = [
+        ("Beta Saude", "Saude", "saudavel", "2024-05-01"),
+        ("Alpha Pay", "Fintech", "critico", "2023-01-15"),
+        ("alpha_labs", "Saude", "atencao", "2025-02-01"),
+        ("Gamma Pay", "Fintech", "saudavel", "2025-08-01"),
+    ]
+    for name, sector, status, invested in startups:
+        await client.post(
+            "/api/startups",
+            json={
+                "name": name,
+                "sector": sector,
+                "status": status,
+                "investment_date": invested,
+            },
+        )
+
+
+@pytest.mark.asyncio
+async def test_list_startups_filters_and_facets(client: AsyncClient):
+    await _create_filter_fixture(client)
+
+    response = await client.get(
+        "/api/startups",
+        params={"sector": "Fintech", "invested_from": "2023-06-01"},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert [s["name"] for s in data["items"]] == ["Gamma Pay"]
+    assert data["total"] == 1
+    assert data["facets"]["status"] == {"saudavel": 1, "atencao": 0, "critico": 0}
+    assert data["facets"]["sector"] == {"Fintech": 1, "Saude": 2}
+
+    response = await client.get(
+        "/api/startups", params=[("status", "saudavel"), ("status", "critico")]
+    )
+    assert [s["name"] for s in response.json()["items"]] == [
+        "Alpha Pay",
+        "Beta Saude",
+        "Gamma Pay",
+    ]
+
+    response = await client.get("/api/startups", params={"q": "ALPHA_"})
+    assert [s["name"] for s in response.json()["items"]] == ["alpha_labs"]
+
+
+@pytest.mark.asyncio
+async def test_list_startups_pages_by_name(client: AsyncClient):
+    await _create_filter_fixture(client)
+
+    names = []
+    cursor = None
+    while True:
+        params = {"limit": 3}
+        if cursor:
+            params["cursor"] = cursor
+        data = (await client.get("/api/startups", params=params)).json()
+        assert data["total"] == 4
+        names += [s["name"] for s in data["items"]]
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+    assert names == ["Alpha Pay", "Beta Saude", "Gamma Pay", "alpha_labs"]
+
+
+@pytest.mark.asyncio
+async def test_list_startups_should_return_400_with_inverted_dates(
+    client: AsyncClient,
+):
+    response = await client.get(
+        "/api/startups",
+        params={"invested_from": "2025-01-01", "invested_to": "2024-01-01"},
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_get_startup_overview(client: AsyncClient, startup_id: str):
+    base = f"/api/startups/{startup_id}"
+    for name in ("Bruna", "Ana"):
+        await client.post(f"{base}/executives", json={"name": name})
+    for month in (1, 2, 3):
+        await client.post(
+            f"{base}/monthly-indicators",
+            json={"month": month, "year": 2024, "total_revenue": month * 100},
+        )
+    for day in ("2024-01-10", "2024-03-10"):
+        await client.post(f"{base}/board-meetings", json={"meeting_date": day})
+    revoked = await client.post(
+        f"{base}/monthly-indicator-tokens", json={"month": 1, "year": 2024}
+    )
+    await client.delete(f"{base}/monthly-indicator-tokens/{revoked.json()['id']}")
+    await client.post(
+        f"{base}/monthly-indicator-tokens", json={"month": 2, "year": 2024}
+    )
+
+    response = await client.get(
+        f"{base}/overview", params={"indicators": 2, "meetings": 1}
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["startup"]["id"] == startup_id
+    assert [(i["month"], i["year"]) for i in data["indicators"]] == [
+        (3, 2024),
+        (2, 2024),
+    ]
+    assert [m["meeting_date"] for m in data["board_meetings"]] == ["2024-03-10"]
+    assert [e["name"] for e in data["executives"]] == ["Ana", "Bruna"]
+    assert [(t["month"], t["year"]) for t in data["tokens"]] == [(2, 2024)]
+
+
+@pytest.mark.asyncio
+async def test_get_startup_overview_should_return_404_when_missing(
+    client: AsyncClient,
+):
+    response = await client.get(f"/api/startups/{uuid.uuid4()}/overview")
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_nested_routes_should_return_404_after_startup_delete(
+    client: AsyncClient, startup_id: str
+):
+    nested = f"/api/startups/{startup_id}/executives"
+    assert (await client.get(nested)).status_code == 200
+    await client.delete(f"/api/startups/{startup_id}")
+
+    response = await client.get(nested)
+
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_nested_write_should_return_404_when_cached_startup_is_gone(
+    client: AsyncClient, session: AsyncSession, startup_id: str
+):
+    nested = f"/api/startups/{startup_id}/board-meetings"
+    assert (await client.get(nested)).status_code == 200
+    # Deleted on another worker: this worker's existence cache still has it.
+    await session.execute(delete(Startup).where(Startup.id == uuid.UUID(startup_id)))
+    await session.commit()
+
+    response = await client.post(nested, json={"meeting_date": "2026-02-10"})
+
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_deleted_startup_leaves_the_cache_only_on_commit(
+    session: AsyncSession, startup_id: str
+):
+    key = uuid.UUID(startup_id)
+    dependencies._known_startups.put(key, float("inf"))
+
+    dependencies.startup_forgetter(session)(key)
+    assert dependencies._known_startups.get(key) is not None
+    await session.commit()
+
+    assert dependencies._known_startups.get(key) is None
+
+
+async def _count(session: AsyncSession, model: type) -> int:
+    return (await session.execute(select(func.count()).select_from(model))).scalar_one()
+
+
+@pytest.mark.asyncio
+async def test_delete_startup_cascades_history_in_database(
+    client: AsyncClient, session: AsyncSession, startup_id: str
+):
+    await client.post(
+        f"/api/startups/{startup_id}/monthly-indicators",
+        json={"month": 1, "year": 2024, "total_revenue": 100},
+    )
+
+    response = await client.delete(f"/api/startups/{startup_id}")
+
+    assert response.status_code == 204
+    assert await _count(session, MonthlyIndicator) == 0
+
+
+@pytest.mark.asyncio
+async def test_soft_deleted_startup_is_hidden_then_purged(
+    client: AsyncClient, session: AsyncSession, startup_id: str, monkeypatch
+):
+    monkeypatch.setattr(settings, "soft_delete_startups", True)
+    await client.post(
+        f"/api/startups/{startup_id}/monthly-indicators",
+        json={"month": 1, "year": 2024, "total_revenue": 100},
+    )
+
+    assert (await client.delete(f"/api/startups/{startup_id}")).status_code == 204
+
+    assert (await client.get(f"/api/startups/{startup_id}")).status_code == 404
+    assert (await client.get("/api/startups")).json()["total"] == 0
+    assert await _count(session, MonthlyIndicator) == 1
+
+    purge = PurgeDeletedStartups(
+        StartupRepository(session), PortfolioSnapshotRepository(session)
+    )
+    assert await purge.execute() == 1
+    assert await purge.execute() == 1
+    assert await purge.execute() == 0
+    assert await _count(session, MonthlyIndicator) == 0
+    assert await _count(session, Startup) == 0
@@ -10,19 +10,22 @@ from app.application.monthly_indicator.create_monthly_indicator import (
 @pytest.fixture
 def repo():
     mock = AsyncMock()
-    mock.get_by_startup_and_period.return_value = None
-    mock.create.side_effect = lambda ind: ind
-    mock.update.side_effect = lambda ind: ind
+    mock.upsert.side_effect = lambda ind: ind
     return mock
 
 
 @pytest.fixture
-def use_case(repo):
-    return CreateMonthlyIndicator(repository=repo)
+def snapshot_repo():
+    return AsyncMock()
+
+
+@pytest.fixture
+def use_case(repo, snapshot_repo):
+    return CreateMonthlyIndicator(repository=repo, snapshot_repo=snapshot_repo)
 
 
 @pytest.mark.asyncio
-async def test_creates_new_indicator(use_case, repo):
+async def test_upserts_indicator(use_case, repo):
     indicator = MagicMock(month=1, year=2025, startup_id="abc")
 
     with patch(
@@ -31,39 +34,19 @@ async def test_creates_new_indicator(use_case, repo):
         result = await use_case.execute(indicator)
 
     assert result is indicator
-    repo.create.assert_awaited_once_with(indicator)
+    repo.upsert.assert_awaited_once_with(indicator)
 
 
 @pytest.mark.asyncio
-async def test_upserts_existing_indicator(use_case, repo):
-    existing = MagicMock(headcount=5, total_revenue=None)
-    repo.get_by_startup_and_period.return_value = existing
-
-    indicator = MagicMock(
-        month=1,
-        year=2025,
-        startup_id="abc",
-        headcount=10,
-        total_revenue=50000,
-        recurring_revenue_pct=None,
-        gross_margin_pct=None,
-        cash_balance=None,
-        ebitda_burn=None,
-        achievements=None,
-        challenges=None,
-        comments=None,
-    )
+async def test_invalidates_affected_snapshots(use_case, snapshot_repo):
+    indicator = MagicMock(month=12, year=2025, startup_id="abc")
 
     with patch(
         "app.application.monthly_indicator.create_monthly_indicator.validate_period_not_future"
     ):
-        result = await use_case.execute(indicator)
+        await use_case.execute(indicator)
 
-    assert result is existing
-    assert existing.headcount == 10
-    assert existing.total_revenue == 50000
-    repo.update.assert_awaited_once_with(existing)
-    repo.create.assert_not_awaited()
+    snapshot_repo.delete_periods.assert_awaited_once_with([(12, 2025), (1, 2026)])
 
 
 @pytest.mark.asyncio
@@ -33,6 +33,17 @@ async def test_creates_new_token(use_case, repo):
     repo.create_token.assert_awaited_once()
 
 
+@pytest.mark.asyncio
+async def test_revokes_expired_tokens_of_this_startup_only(use_case, repo):
+    repo.get_token_by_startup_and_period.return_value = MagicMock()
+    startup_id = uuid.uuid4()
+
+    await use_case.execute(startup_id, month=2, year=2026)
+
+    month, year, _, scoped_to = repo.revoke_expired_tokens.await_args.args
+    assert (month, year, scoped_to) == (2, 2026, startup_id)
+
+
 @pytest.mark.asyncio
 async def test_returns_existing_token_if_already_exists(use_case, repo):
     existing = MagicMock()
@@ -0,0 +1,46 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from app.infrastructure.form_token_signer import FormTokenClaims, FormTokenSigner
+
+NOW = datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+
+def _claims(**overrides) -> FormTokenClaims:
+    values = {
+        "token_id": uuid.uuid4(),
+        "startup_id": uuid.uuid4(),
+        "month": 2,
+        "year": 2026,
+        "expires_at": NOW + timedelta(days=30),
+    }
+    return FormTokenClaims(**{**values, **overrides})
+
+
+def test_round_trip():
+    signer = FormTokenSigner("secret")
+    claims = _claims()
+
+    assert signer.verify(signer.sign(claims), now=NOW) == claims
+
+
+def test_rejects_expired_token():
+    signer = FormTokenSigner("secret")
+    token = signer.sign(_claims(expires_at=NOW))
+
+    assert signer.verify(token, now=NOW) is None
+
+
+def test_rejects_token_signed_with_other_key():
+    token = FormTokenSigner("other").sign(_claims())
+
+    assert FormTokenSigner("secret").verify(token, now=NOW) is None
+
+
+def test_rejects_malformed_tokens():
+    signer = FormTokenSigner("secret")
+
+    assert signer.verify("", now=NOW) is None
+    assert signer.verify("not a token", now=NOW) is None
+    assert signer.verify(str(uuid.uuid4()), now=NOW) is None
+    assert signer.verify("ção", now=NOW) is None
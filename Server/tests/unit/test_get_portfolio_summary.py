@@ -1,4 +1,3 @@
-import uuid
 from datetime import date
 from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock
@@ -6,43 +5,60 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from app.application.portfolio.get_portfolio_summary import GetPortfolioSummary
-from app.domain.models.startup import StartupStatus
 
 
 @pytest.fixture
-def startup_repo():
+def portfolio_repo():
     return AsyncMock()
 
 
 @pytest.fixture
-def indicator_repo():
-    return AsyncMock()
-
-
-@pytest.fixture
-def meeting_repo():
-    return AsyncMock()
+def snapshot_repo():
+    mock = AsyncMock()
+    mock.get.return_value = None
+    mock.get_generation.return_value = 0
+    mock.save.side_effect = lambda snapshot: snapshot
+    return mock
 
 
 @pytest.fixture
-def use_case(startup_repo, indicator_repo, meeting_repo):
+def use_case(portfolio_repo, snapshot_repo):
     return GetPortfolioSummary(
-        startup_repo=startup_repo,
-        indicator_repo=indicator_repo,
-        meeting_repo=meeting_repo,
+        portfolio_repo=portfolio_repo, snapshot_repo=snapshot_repo
     )
 
 
-def _make_startup(status=StartupStatus.HEALTHY):
-    s = MagicMock()
-    s.id = uuid.uuid4()
-    s.status = status
-    return s
+def _make_aggregates(
+    total_startups=1,
+    healthy=1,
+    warning=0,
+    critical=0,
+    revenue=Decimal("0"),
+    previous_revenue=Decimal("0"),
+    reported=0,
+    with_recent_meetings=0,
+    reference_date=None,
+    generation=0,
+):
+    return MagicMock(
+        reference_date=reference_date,
+        generation=generation,
+        total_startups=total_startups,
+        healthy=healthy,
+        warning=warning,
+        critical=critical,
+        revenue=revenue,
+        previous_revenue=previous_revenue,
+        reported=reported,
+        with_recent_meetings=with_recent_meetings,
+    )
 
 
 @pytest.mark.asyncio
-async def test_empty_portfolio(use_case, startup_repo, indicator_repo, meeting_repo):
-    startup_repo.get_all.return_value = ([], 0)
+async def test_empty_portfolio(use_case, portfolio_repo):
+    portfolio_repo.get_period_aggregates.return_value = _make_aggregates(
+        total_startups=0, healthy=0
+    )
 
     result = await use_case.execute()
 
@@ -51,22 +67,13 @@ async def test_empty_portfolio(use_case, startup_repo, indicator_repo, meeting_r
     assert result.revenue_variation_pct is None
     assert result.revenue_variation_direction == "neutral"
     assert result.health.healthy == 0
-    indicator_repo.get_by_startups_and_period.assert_not_awaited()
 
 
 @pytest.mark.asyncio
-async def test_health_distribution(
-    use_case, startup_repo, indicator_repo, meeting_repo
-):
-    startups = [
-        _make_startup(StartupStatus.HEALTHY),
-        _make_startup(StartupStatus.HEALTHY),
-        _make_startup(StartupStatus.WARNING),
-        _make_startup(StartupStatus.CRITICAL),
-    ]
-    startup_repo.get_all.return_value = (startups, 4)
-    indicator_repo.get_by_startups_and_period.return_value = {}
-    meeting_repo.get_startup_ids_with_recent_meetings.return_value = set()
+async def test_health_distribution(use_case, portfolio_repo):
+    portfolio_repo.get_period_aggregates.return_value = _make_aggregates(
+        total_startups=4, healthy=2, warning=1, critical=1
+    )
 
     result = await use_case.execute()
 
@@ -77,66 +84,86 @@ async def test_health_distribution(
 
 
 @pytest.mark.asyncio
-async def test_revenue_aggregation(
-    use_case, startup_repo, indicator_repo, meeting_repo
-):
-    s1 = _make_startup()
-    s2 = _make_startup()
-    startup_repo.get_all.return_value = ([s1, s2], 2)
-
-    ind1 = MagicMock(
-        total_revenue=Decimal("100000"),
-        cash_balance=None,
-        ebitda_burn=None,
-        headcount=None,
-        month=1,
-        year=2026,
-    )
-    ind2 = MagicMock(
-        total_revenue=Decimal("50000"),
-        cash_balance=None,
-        ebitda_burn=None,
-        headcount=None,
-        month=1,
-        year=2026,
+async def test_revenue_aggregation(use_case, portfolio_repo):
+    portfolio_repo.get_period_aggregates.return_value = _make_aggregates(
+        total_startups=2, healthy=2, revenue=Decimal("150000"), reported=2
     )
-    indicator_repo.get_by_startups_and_period.side_effect = [
-        {s1.id: ind1, s2.id: ind2},
-        {},
-    ]
-    meeting_repo.get_startup_ids_with_recent_meetings.return_value = set()
 
     result = await use_case.execute(month=1, year=2026)
 
     assert result.revenue == Decimal("150000")
     assert result.revenue_variation_pct is None
     assert result.revenue_variation_direction == "neutral"
-    assert len(result.startups) == 2
-    assert indicator_repo.get_by_startups_and_period.await_count == 2
-    meeting_repo.get_startup_ids_with_recent_meetings.assert_awaited_once_with(
-        [s1.id, s2.id], 90, date(2026, 1, 31)
+    assert result.monthly_report_pct == 100.0
+    portfolio_repo.get_period_aggregates.assert_awaited_once_with(
+        1, 2026, 12, 2025, date(2025, 11, 2)
+    )
+
+
+@pytest.mark.asyncio
+async def test_uses_fresh_snapshot_without_recomputing(
+    use_case, portfolio_repo, snapshot_repo
+):
+    snapshot_repo.get.return_value = _make_aggregates(
+        total_startups=2, healthy=2, reported=1, reference_date=date(2026, 1, 31)
     )
 
+    result = await use_case.execute(month=1, year=2026)
+
+    assert result.total_startups == 2
+    assert result.monthly_report_pct == 50.0
+    portfolio_repo.get_period_aggregates.assert_not_awaited()
+    snapshot_repo.save.assert_not_awaited()
+
 
 @pytest.mark.asyncio
-async def test_revenue_variation_should_be_positive(
-    use_case, startup_repo, indicator_repo, meeting_repo
+async def test_rebuilds_snapshot_with_outdated_reference_date(
+    use_case, portfolio_repo, snapshot_repo
 ):
-    s1 = _make_startup()
-    startup_repo.get_all.return_value = ([s1], 1)
-
-    current = MagicMock(
-        total_revenue=Decimal("120000"),
-        cash_balance=None,
-        ebitda_burn=None,
-        headcount=None,
+    snapshot_repo.get.return_value = _make_aggregates(reference_date=date(2026, 1, 15))
+    portfolio_repo.get_period_aggregates.return_value = _make_aggregates()
+
+    await use_case.execute(month=1, year=2026)
+
+    portfolio_repo.get_period_aggregates.assert_awaited_once()
+    saved = snapshot_repo.save.await_args.args[0]
+    assert (saved.month, saved.year) == (1, 2026)
+    assert saved.reference_date == date(2026, 1, 31)
+
+
+@pytest.mark.asyncio
+async def test_rebuilds_snapshot_from_an_older_generation(
+    use_case, portfolio_repo, snapshot_repo
+):
+    snapshot_repo.get.return_value = _make_aggregates(
+        reference_date=date(2026, 1, 31), generation=3
+    )
+    snapshot_repo.get_generation.return_value = 4
+    portfolio_repo.get_period_aggregates.return_value = _make_aggregates()
+
+    await use_case.execute(month=1, year=2026)
+
+    saved = snapshot_repo.save.await_args.args[0]
+    assert saved.generation == 4
+
+
+@pytest.mark.asyncio
+async def test_coverage_percentages(use_case, portfolio_repo):
+    portfolio_repo.get_period_aggregates.return_value = _make_aggregates(
+        total_startups=3, healthy=3, reported=2, with_recent_meetings=1
+    )
+
+    result = await use_case.execute(month=1, year=2026)
+
+    assert result.monthly_report_pct == 66.7
+    assert result.routines_up_to_date_pct == 33.3
+
+
+@pytest.mark.asyncio
+async def test_revenue_variation_should_be_positive(use_case, portfolio_repo):
+    portfolio_repo.get_period_aggregates.return_value = _make_aggregates(
+        revenue=Decimal("120000"), previous_revenue=Decimal("100000")
     )
-    previous = MagicMock(total_revenue=Decimal("100000"))
-    indicator_repo.get_by_startups_and_period.side_effect = [
-        {s1.id: current},
-        {s1.id: previous},
-    ]
-    meeting_repo.get_startup_ids_with_recent_meetings.return_value = set()
 
     result = await use_case.execute(month=2, year=2026)
 
@@ -145,24 +172,10 @@ async def test_revenue_variation_should_be_positive(
 
 
 @pytest.mark.asyncio
-async def test_revenue_variation_should_be_negative(
-    use_case, startup_repo, indicator_repo, meeting_repo
-):
-    s1 = _make_startup()
-    startup_repo.get_all.return_value = ([s1], 1)
-
-    current = MagicMock(
-        total_revenue=Decimal("90000"),
-        cash_balance=None,
-        ebitda_burn=None,
-        headcount=None,
+async def test_revenue_variation_should_be_negative(use_case, portfolio_repo):
+    portfolio_repo.get_period_aggregates.return_value = _make_aggregates(
+        revenue=Decimal("90000"), previous_revenue=Decimal("100000")
     )
-    previous = MagicMock(total_revenue=Decimal("100000"))
-    indicator_repo.get_by_startups_and_period.side_effect = [
-        {s1.id: current},
-        {s1.id: previous},
-    ]
-    meeting_repo.get_startup_ids_with_recent_meetings.return_value = set()
 
     result = await use_case.execute(month=2, year=2026)
 
@@ -0,0 +1,110 @@
+import uuid
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.application.monthly_indicator.import_monthly_indicators import (
+    ImportMonthlyIndicators,
+)
+
+STARTUP_ID = uuid.UUID("00000000-0000-0000-0000-0000000000aa")
+
+
+@pytest.fixture
+def repo():
+    mock = AsyncMock()
+    mock.upsert_many.side_effect = lambda rows: {
+        (row["startup_id"], row["month"], row["year"]) for row in rows
+    }
+    return mock
+
+
+@pytest.fixture
+def startup_repo():
+    mock = AsyncMock()
+    mock.get_existing_ids.side_effect = lambda ids: ids & {STARTUP_ID}
+    return mock
+
+
+@pytest.fixture
+def snapshot_repo():
+    return AsyncMock()
+
+
+async def _stream(records):
+    for record in records:
+        yield record
+
+
+@pytest.fixture
+def use_case(repo, startup_repo, snapshot_repo):
+    return ImportMonthlyIndicators(
+        repository=repo, startup_repo=startup_repo, snapshot_repo=snapshot_repo
+    )
+
+
+@pytest.mark.asyncio
+async def test_merges_repeated_periods_in_a_batch(use_case, repo, snapshot_repo):
+    records = [
+        {"startup_id": STARTUP_ID, "month": 1, "year": 2025, "headcount": 5},
+        {"startup_id": STARTUP_ID, "month": 1, "year": 2025, "total_revenue": 10},
+        {"startup_id": STARTUP_ID, "month": 2, "year": 2025, "headcount": None},
+    ]
+
+    imported = await use_case.execute(_stream(records))
+
+    assert imported == 2
+    (rows,) = repo.upsert_many.await_args.args
+    assert len(rows) == 2
+    assert rows[0]["headcount"] == 5
+    assert rows[0]["total_revenue"] == 10
+    assert rows[1]["headcount"] is None
+    snapshot_repo.delete_periods.assert_awaited_once_with(
+        [(1, 2025), (2, 2025), (3, 2025)]
+    )
+
+
+@pytest.mark.asyncio
+async def test_writes_in_batches(use_case, repo):
+    records = (
+        {"startup_id": STARTUP_ID, "month": month, "year": year}
+        for year in range(2000, 2025)
+        for month in range(1, 13)
+    )
+
+    with patch(
+        "app.application.monthly_indicator.import_monthly_indicators.IMPORT_BATCH_SIZE",
+        100,
+    ):
+        imported = await use_case.execute(_stream(records))
+
+    assert imported == 300
+    assert repo.upsert_many.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_counts_a_period_split_across_batches_once(use_case, repo):
+    records = [
+        {"startup_id": STARTUP_ID, "month": 1, "year": 2025, "headcount": 5},
+        {"startup_id": STARTUP_ID, "month": 2, "year": 2025, "headcount": 6},
+        {"startup_id": STARTUP_ID, "month": 1, "year": 2025, "total_revenue": 10},
+    ]
+
+    with patch(
+        "app.application.monthly_indicator.import_monthly_indicators.IMPORT_BATCH_SIZE",
+        2,
+    ):
+        imported = await use_case.execute(_stream(records))
+
+    assert imported == 2
+    assert repo.upsert_many.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_rejects_unknown_startup(use_case, repo):
+    records = [{"startup_id": uuid.uuid4(), "month": 1, "year": 2025}]
+
+    with pytest.raises(ValueError, match="nao encontrada"):
+        await use_case.execute(_stream(records))
+
+    repo.upsert_many.assert_not_awaited()
@@ -0,0 +1,81 @@
+import uuid
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.application.portfolio.list_portfolio_startups import ListPortfolioStartups
+
+
+@pytest.fixture
+def portfolio_repo():
+    return AsyncMock()
+
+
+@pytest.fixture
+def use_case(portfolio_repo):
+    return ListPortfolioStartups(portfolio_repo=portfolio_repo)
+
+
+def _make_row(name, total_revenue=None):
+    return MagicMock(
+        Startup=MagicMock(id=uuid.uuid4(), name=name),
+        total_revenue=total_revenue,
+        cash_balance=None,
+        ebitda_burn=None,
+        headcount=None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_should_return_next_key_when_more_rows_exist(use_case, portfolio_repo):
+    rows = [_make_row("A", Decimal("10")), _make_row("B", Decimal("5"))]
+    portfolio_repo.get_monitoring_page.return_value = rows
+
+    items, next_key = await use_case.execute(
+        month=1, year=2026, sort="total_revenue", order="desc", limit=1
+    )
+
+    assert len(items) == 1
+    assert next_key == ["total_revenue", "desc", "10", str(rows[0].Startup.id)]
+    portfolio_repo.get_monitoring_page.assert_awaited_once_with(
+        1, 2026, "total_revenue", True, 2, None
+    )
+
+
+@pytest.mark.asyncio
+async def test_should_not_return_next_key_on_last_page(use_case, portfolio_repo):
+    portfolio_repo.get_monitoring_page.return_value = [_make_row("A")]
+
+    items, next_key = await use_case.execute(month=1, year=2026, limit=1)
+
+    assert len(items) == 1
+    assert next_key is None
+
+
+@pytest.mark.asyncio
+async def test_should_parse_key_for_repository(use_case, portfolio_repo):
+    portfolio_repo.get_monitoring_page.return_value = []
+    last_id = uuid.uuid4()
+
+    await use_case.execute(
+        month=1,
+        year=2026,
+        sort="total_revenue",
+        order="asc",
+        after=["total_revenue", "asc", "10.50", str(last_id)],
+    )
+
+    after = portfolio_repo.get_monitoring_page.await_args.args[5]
+    assert after == (Decimal("10.50"), last_id)
+
+
+@pytest.mark.asyncio
+async def test_should_raise_when_key_belongs_to_other_sort(use_case):
+    with pytest.raises(ValueError, match="Cursor invalido"):
+        await use_case.execute(
+            month=1,
+            year=2026,
+            sort="name",
+            after=["headcount", "asc", 3, str(uuid.uuid4())],
+        )
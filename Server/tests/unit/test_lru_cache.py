@@ -0,0 +1,33 @@
+from app.infrastructure.lru_cache import LruCache
+
+
+def test_evicts_least_recently_used_entry():
+    cache: LruCache[str, int] = LruCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_pop_and_clear():
+    cache: LruCache[str, int] = LruCache(maxsize=4)
+    cache.put("a", 1)
+    cache.put("b", 2)
+
+    cache.pop("a")
+    assert cache.get("a") is None
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_zero_size_disables_cache():
+    cache: LruCache[str, int] = LruCache(maxsize=0)
+    cache.put("a", 1)
+    assert cache.get("a") is None
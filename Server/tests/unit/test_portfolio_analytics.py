@@ -0,0 +1,58 @@
+import math
+from decimal import Decimal
+
+import numpy as np
+
+from app.application.portfolio import analytics
+
+
+def test_build_grid_scatters_rows_and_ignores_out_of_window():
+    grid = analytics.build_grid(
+        ["b", "a", "a", "a"],
+        [2, 0, 2, 5],
+        {
+            "total_revenue": [Decimal("30"), Decimal("10"), None, Decimal("99")],
+            "gross_margin_pct": [None] * 4,
+            "cash_balance": [None] * 4,
+            "ebitda_burn": [None] * 4,
+        },
+        periods=3,
+    )
+
+    assert list(grid.startup_ids) == ["a", "b"]
+    assert grid.reported.tolist() == [[True, False, True], [False, False, True]]
+    assert grid.revenue[0, 0] == 10
+    assert math.isnan(grid.revenue[0, 2])
+    assert grid.revenue[1, 2] == 30
+
+
+def test_growth_requires_positive_base():
+    result = analytics.growth(
+        np.array([120.0, 50.0, 10.0]), np.array([100.0, 0, np.nan])
+    )
+
+    assert result[0] == 20.0
+    assert np.isnan(result[1:]).all()
+
+
+def test_runway_and_burn_multiple_only_when_burning():
+    cash = np.array([1200.0, 1000.0])
+    burn = np.array([-100.0, 50.0])
+    revenue = np.array([150.0, 300.0])
+    previous = np.array([100.0, 200.0])
+
+    runway = analytics.runway_months(cash, burn)
+    multiple = analytics.burn_multiple(burn, revenue, previous)
+
+    assert runway[0] == 12.0
+    assert np.isnan(runway[1])
+    assert multiple[0] == 2.0
+    assert np.isnan(multiple[1])
+
+
+def test_distribution_skips_missing_values():
+    count, points = analytics.distribution(np.array([1.0, np.nan, 3.0, np.inf]))
+
+    assert count == 2
+    assert points[50] == 2.0
+    assert analytics.distribution(np.array([np.nan])) == (0, None)
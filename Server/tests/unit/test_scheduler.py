@@ -0,0 +1,21 @@
+from datetime import UTC, date, datetime
+
+from app.application.monthly_indicator.issue_monthly_indicator_tokens import (
+    previous_period,
+)
+from app.infrastructure.scheduler import seconds_until_next_month
+
+
+def test_seconds_until_next_month():
+    now = datetime(2026, 1, 31, 23, 59, 30, tzinfo=UTC)
+    assert seconds_until_next_month(now) == 30
+
+
+def test_seconds_until_next_month_crosses_year():
+    now = datetime(2025, 12, 31, 12, 0, tzinfo=UTC)
+    assert seconds_until_next_month(now) == 12 * 3600
+
+
+def test_previous_period():
+    assert previous_period(date(2026, 3, 1)) == (2, 2026)
+    assert previous_period(date(2026, 1, 15)) == (12, 2025)
@@ -4,7 +4,9 @@ from unittest.mock import patch
 import pytest
 
 from app.domain.validators import (
+    parse_period,
     validate_period_not_future,
+    validate_period_range,
     validate_username_no_spaces,
 )
 
@@ -41,3 +43,27 @@ def test_username_without_space_is_valid():
 def test_username_with_space_raises():
     with pytest.raises(ValueError, match="Username"):
         validate_username_no_spaces("invalid user")
+
+
+def test_parse_period():
+    assert parse_period("2026-03") == (3, 2026)
+
+
+@pytest.mark.parametrize("value", ["2026", "2026-13", "2026-00", "mar-2026"])
+def test_parse_period_invalid_raises(value):
+    with pytest.raises(ValueError):
+        parse_period(value)
+
+
+def test_period_range_is_valid():
+    validate_period_range((11, 2025), (2, 2026), max_months=4)
+
+
+def test_period_range_inverted_raises():
+    with pytest.raises(ValueError, match="anterior"):
+        validate_period_range((3, 2026), (1, 2026), max_months=12)
+
+
+def test_period_range_too_long_raises():
+    with pytest.raises(ValueError, match="exceder"):
+        validate_period_range((11, 2025), (3, 2026), max_months=4)
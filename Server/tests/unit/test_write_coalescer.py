@@ -0,0 +1,45 @@
+from app.infrastructure.write_coalescer import WriteCoalescer
+
+
+def test_keeps_latest_write_per_key():
+    buffer: WriteCoalescer[str, int] = WriteCoalescer(10)
+    buffer.put("a", 1)
+    buffer.put("a", 2)
+    buffer.put("b", 3)
+
+    assert buffer.get("a") == 2
+    assert buffer.drain() == {"a": 2, "b": 3}
+    assert len(buffer) == 0
+
+
+def test_restore_does_not_overwrite_newer_writes():
+    buffer: WriteCoalescer[str, int] = WriteCoalescer(10)
+    buffer.put("a", 1)
+    buffer.put("b", 2)
+    drained = buffer.drain()
+    buffer.put("a", 10)
+
+    buffer.restore(drained)
+
+    assert buffer.drain() == {"a": 10, "b": 2}
+
+
+def test_pop():
+    buffer: WriteCoalescer[str, int] = WriteCoalescer(10)
+    buffer.put("a", 1)
+
+    buffer.pop("a")
+    buffer.pop("missing")
+
+    assert buffer.get("a") is None
+
+
+def test_refuses_new_keys_when_full():
+    buffer: WriteCoalescer[str, int] = WriteCoalescer(2)
+    assert buffer.put("a", 1)
+    assert buffer.put("b", 2)
+
+    assert not buffer.put("c", 3)
+    assert buffer.put("a", 10)
+    assert buffer.drain() == {"a": 10, "b": 2}
+    assert buffer.put("c", 3)